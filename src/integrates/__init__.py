@@ -4,22 +4,52 @@ Integrates - A requests-style, protocol-agnostic SDK for API integration
 This package provides a simple, ergonomic interface for interacting with
 various API protocols (REST, GraphQL, SOAP) while maintaining the familiar
 feel of the Python 'requests' library.
+
+Clients and subpackages are imported on first access, so ``import integrates``
+stays cheap and a process only loads the protocols it uses.
 """
 
 __version__ = "0.1.0"
 
-import integrates.auth as auth
-import integrates.middleware as middleware
-from integrates.core.client import AsyncClient, Client
-from integrates.core.response import Response
-from integrates.protocols.graphql import AsyncGraphQLClient, GraphQLClient
-from integrates.protocols.rest import AsyncRestClient, RestClient
-from integrates.protocols.soap import AsyncSoapClient, SoapClient
+from typing import TYPE_CHECKING
+
+from integrates.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    import integrates.auth as auth
+    import integrates.middleware as middleware
+    from integrates.core.client import AsyncClient, Client
+    from integrates.core.pool import ConnectionPool, shared_pool
+    from integrates.core.response import Response
+    from integrates.protocols.graphql import AsyncGraphQLClient, GraphQLClient
+    from integrates.protocols.rest import AsyncRestClient, RestClient
+    from integrates.protocols.soap import AsyncSoapClient, SoapClient
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Client": ("integrates.core.client", "Client"),
+        "AsyncClient": ("integrates.core.client", "AsyncClient"),
+        "Response": ("integrates.core.response", "Response"),
+        "ConnectionPool": ("integrates.core.pool", "ConnectionPool"),
+        "shared_pool": ("integrates.core.pool", "shared_pool"),
+        "auth": ("integrates.auth", None),
+        "middleware": ("integrates.middleware", None),
+        "RestClient": ("integrates.protocols.rest", "RestClient"),
+        "AsyncRestClient": ("integrates.protocols.rest", "AsyncRestClient"),
+        "GraphQLClient": ("integrates.protocols.graphql", "GraphQLClient"),
+        "AsyncGraphQLClient": ("integrates.protocols.graphql", "AsyncGraphQLClient"),
+        "SoapClient": ("integrates.protocols.soap", "SoapClient"),
+        "AsyncSoapClient": ("integrates.protocols.soap", "AsyncSoapClient"),
+    },
+)
 
 __all__ = [
     "Client",
     "AsyncClient",
     "Response",
+    "ConnectionPool",
+    "shared_pool",
     "auth",
     "middleware",
     "RestClient",
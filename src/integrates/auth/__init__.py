@@ -1,12 +1,37 @@
 """
 Authentication methods for Integrates.
+
+Classes are imported on first access; OAuth2 in particular pulls in httpx.
 """
 
-from integrates.auth.api_key import ApiKeyAuth
-from integrates.auth.base import Auth
-from integrates.auth.basic import BasicAuth
-from integrates.auth.bearer import BearerAuth
-from integrates.auth.oauth2 import OAuth2
+from typing import TYPE_CHECKING
+
+from integrates.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from integrates.auth.api_key import ApiKeyAuth
+    from integrates.auth.base import Auth
+    from integrates.auth.basic import BasicAuth
+    from integrates.auth.bearer import BearerAuth
+    from integrates.auth.oauth2 import OAuth2
+    from integrates.auth.signing import HMACAuth
+    from integrates.auth.token_store import FileTokenStore, MemoryTokenStore, Token, TokenStore
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Auth": ("integrates.auth.base", "Auth"),
+        "BasicAuth": ("integrates.auth.basic", "BasicAuth"),
+        "BearerAuth": ("integrates.auth.bearer", "BearerAuth"),
+        "OAuth2": ("integrates.auth.oauth2", "OAuth2"),
+        "ApiKeyAuth": ("integrates.auth.api_key", "ApiKeyAuth"),
+        "HMACAuth": ("integrates.auth.signing", "HMACAuth"),
+        "Token": ("integrates.auth.token_store", "Token"),
+        "TokenStore": ("integrates.auth.token_store", "TokenStore"),
+        "MemoryTokenStore": ("integrates.auth.token_store", "MemoryTokenStore"),
+        "FileTokenStore": ("integrates.auth.token_store", "FileTokenStore"),
+    },
+)
 
 __all__ = [
     "Auth",
@@ -14,4 +39,9 @@ __all__ = [
     "BearerAuth",
     "OAuth2",
     "ApiKeyAuth",
+    "HMACAuth",
+    "Token",
+    "TokenStore",
+    "MemoryTokenStore",
+    "FileTokenStore",
 ]
@@ -3,9 +3,9 @@ API key authentication.
 """
 
 from enum import Enum, auto
-from typing import Dict
+from typing import Dict, Optional
 
-from integrates.auth.base import Auth
+from integrates.auth.base import Auth, Body
 
 
 class ApiKeyLocation(Enum):
@@ -18,6 +18,8 @@ class ApiKeyLocation(Enum):
 class ApiKeyAuth(Auth):
     """API key authentication."""
 
+    reusable = True
+
     def __init__(
         self,
         api_key: str,
@@ -36,7 +38,9 @@ class ApiKeyAuth(Auth):
         self.key_name = key_name
         self.location = location
 
-    def sign(self, method: str, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    def sign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
         """
         Sign a request with an API key.
 
@@ -44,6 +48,7 @@ class ApiKeyAuth(Auth):
             method: HTTP method
             url: Request URL
             headers: Request headers
+            body: Prepared request body (unused)
 
         Returns:
             Modified headers
@@ -2,13 +2,26 @@
 Base class for authentication methods.
 """
 
-from typing import Dict
+from typing import IO, Dict, Iterable, Optional, Union
+
+# A prepared request body: raw bytes, a file-like object or an iterable of chunks
+Body = Union[bytes, IO[bytes], Iterable[bytes]]
 
 
 class Auth:
     """Base class for authentication methods."""
 
-    def sign(self, method: str, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    # Set to True by auth methods that sign the request body. The client then
+    # serialises the body once and passes it to `sign` as `body`.
+    requires_body = False
+
+    # Set to True by auth methods whose signed headers do not change between
+    # requests, which lets prepared requests sign once instead of on every call.
+    reusable = False
+
+    def sign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
         """
         Sign a request.
 
@@ -16,8 +29,28 @@ class Auth:
             method: HTTP method
             url: Request URL
             headers: Request headers
+            body: Prepared request body (only passed when `requires_body` is True)
 
         Returns:
             Modified headers
         """
         return headers
+
+    async def asign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
+        """
+        Sign a request sent by an AsyncClient.
+
+        Defaults to `sign`; override it for work that would block the event loop.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            body: Prepared request body (only passed when `requires_body` is True)
+
+        Returns:
+            Modified headers
+        """
+        return self.sign(method, url, headers, body=body)
@@ -3,14 +3,16 @@ Basic HTTP authentication.
 """
 
 import base64
-from typing import Dict
+from typing import Dict, Optional
 
-from integrates.auth.base import Auth
+from integrates.auth.base import Auth, Body
 
 
 class BasicAuth(Auth):
     """Basic HTTP authentication."""
 
+    reusable = True
+
     def __init__(self, username: str, password: str):
         """
         Initialize BasicAuth.
@@ -22,7 +24,9 @@ class BasicAuth(Auth):
         self.username = username
         self.password = password
 
-    def sign(self, method: str, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    def sign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
         """
         Sign a request with Basic authentication.
 
@@ -30,6 +34,7 @@ class BasicAuth(Auth):
             method: HTTP method
             url: Request URL
             headers: Request headers
+            body: Prepared request body (unused)
 
         Returns:
             Modified headers
@@ -2,14 +2,16 @@
 Bearer token authentication.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
-from integrates.auth.base import Auth
+from integrates.auth.base import Auth, Body
 
 
 class BearerAuth(Auth):
     """Bearer token authentication."""
 
+    reusable = True
+
     def __init__(self, token: str):
         """
         Initialize BearerAuth.
@@ -19,7 +21,9 @@ class BearerAuth(Auth):
         """
         self.token = token
 
-    def sign(self, method: str, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    def sign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
         """
         Sign a request with Bearer authentication.
 
@@ -27,6 +31,7 @@ class BearerAuth(Auth):
             method: HTTP method
             url: Request URL
             headers: Request headers
+            body: Prepared request body (unused)
 
         Returns:
             Modified headers
@@ -2,9 +2,14 @@
 OAuth 2.0 authentication.
 """
 
+import time
 from typing import Dict, Optional
 
+import httpx
+from integrates.auth.base import Body
 from integrates.auth.bearer import BearerAuth
+from integrates.auth.token_store import MemoryTokenStore, Token, TokenStore
+from integrates.core.exceptions import AuthenticationError
 
 
 class OAuth2(BearerAuth):
@@ -12,10 +17,17 @@ class OAuth2(BearerAuth):
 
     def __init__(
         self,
-        token: str,
+        token: Optional[str] = None,
         token_type: str = "Bearer",
         refresh_token: Optional[str] = None,
         expires_in: Optional[int] = None,
+        token_url: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        scope: Optional[str] = None,
+        token_store: Optional[TokenStore] = None,
+        leeway: float = 30.0,
+        timeout: float = 10.0,
     ):
         """
         Initialize OAuth2.
@@ -25,13 +37,185 @@ class OAuth2(BearerAuth):
             token_type: Token type (default: Bearer)
             refresh_token: Refresh token for refreshing access token
             expires_in: Token expiration time in seconds
+            token_url: Token endpoint used to obtain new access tokens
+            client_id: Client identifier for the token endpoint
+            client_secret: Client secret for the token endpoint
+            scope: Scope requested from the token endpoint
+            token_store: Store used to share tokens (defaults to an in-memory store)
+            leeway: Seconds before expiry at which a token is considered stale
+            timeout: Timeout in seconds for token endpoint requests
         """
-        super().__init__(token)
+        super().__init__(token or "")
         self.token_type = token_type
         self.refresh_token = refresh_token
         self.expires_in = expires_in
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.scope = scope
+        self.token_store = token_store or MemoryTokenStore()
+        self.leeway = leeway
+        self.timeout = timeout
+        self.expires_at = time.time() + expires_in if expires_in is not None else None
 
-    def sign(self, method: str, url: str, headers: Dict[str, str]) -> Dict[str, str]:
+    @property
+    def reusable(self) -> bool:
+        """Return True if the token is never refreshed, so signed headers can be reused."""
+        return self.token_url is None
+
+    @property
+    def store_key(self) -> str:
+        """Return the key under which this client's token is stored."""
+        return f"{self.token_url}|{self.client_id}|{self.scope or ''}"
+
+    def _is_valid(self) -> bool:
+        return Token(self.token, expires_at=self.expires_at).is_valid(self.leeway)
+
+    def _adopt(self, token: Token) -> None:
+        self.token = token.access_token
+        self.token_type = token.token_type
+        self.expires_at = token.expires_at
+        if token.refresh_token:
+            self.refresh_token = token.refresh_token
+
+    def fetch_token(self) -> Token:
+        """
+        Request a new access token from the token endpoint.
+
+        Uses the refresh token grant when a refresh token is available and the
+        client credentials grant otherwise.
+
+        Returns:
+            Newly issued token
+
+        Raises:
+            AuthenticationError: If the token endpoint rejects the request
+        """
+        try:
+            response = httpx.post(self.token_url, data=self._token_request(), timeout=self.timeout)
+        except httpx.RequestError as exc:
+            raise AuthenticationError(f"Token request failed: {str(exc)}") from exc
+        return self._token_from(response)
+
+    async def afetch_token(self) -> Token:
+        """
+        Request a new access token from the token endpoint without blocking the event loop.
+
+        See `fetch_token`.
+
+        Returns:
+            Newly issued token
+
+        Raises:
+            AuthenticationError: If the token endpoint rejects the request
+        """
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(self.token_url, data=self._token_request())
+        except httpx.RequestError as exc:
+            raise AuthenticationError(f"Token request failed: {str(exc)}") from exc
+        return self._token_from(response)
+
+    def _token_request(self) -> Dict[str, str]:
+        if self.refresh_token:
+            data = {"grant_type": "refresh_token", "refresh_token": self.refresh_token}
+        else:
+            data = {"grant_type": "client_credentials"}
+        if self.client_id:
+            data["client_id"] = self.client_id
+        if self.client_secret:
+            data["client_secret"] = self.client_secret
+        if self.scope:
+            data["scope"] = self.scope
+        return data
+
+    @staticmethod
+    def _token_from(response: httpx.Response) -> Token:
+        if response.status_code >= 400:
+            raise AuthenticationError(
+                f"Token request failed with HTTP {response.status_code}: {response.text}"
+            )
+
+        payload = response.json()
+        expires_in = payload.get("expires_in")
+        return Token(
+            access_token=payload["access_token"],
+            token_type=payload.get("token_type") or "Bearer",
+            expires_at=time.time() + float(expires_in) if expires_in is not None else None,
+            refresh_token=payload.get("refresh_token"),
+        )
+
+    def ensure_token(self) -> None:
+        """
+        Make sure a valid access token is held, refreshing it if needed.
+
+        The token store is consulted first so that a token refreshed by another
+        process or client is reused. Only the holder of the store lock contacts
+        the token endpoint; everyone else waits and then reads the new token.
+        """
+        if self._is_valid() or not self.token_url:
+            return
+
+        key = self.store_key
+        stored = self.token_store.get(key)
+        if stored is not None and stored.is_valid(self.leeway):
+            self._adopt(stored)
+            return
+
+        with self.token_store.lock(key):
+            stored = self.token_store.get(key)
+            if stored is None or not stored.is_valid(self.leeway):
+                if stored is not None and stored.refresh_token:
+                    self.refresh_token = stored.refresh_token
+                stored = self.fetch_token()
+                self.token_store.set(key, stored)
+            self._adopt(stored)
+
+    async def aensure_token(self) -> None:
+        """
+        Make sure a valid access token is held without blocking the event loop.
+
+        See `ensure_token`. The store lock is waited for in a worker thread and
+        the token endpoint is called with an asynchronous HTTP client.
+        """
+        if self._is_valid() or not self.token_url:
+            return
+
+        key = self.store_key
+        stored = self.token_store.get(key)
+        if stored is not None and stored.is_valid(self.leeway):
+            self._adopt(stored)
+            return
+
+        import asyncio
+
+        lock = self.token_store.lock(key)
+        acquiring = asyncio.get_running_loop().run_in_executor(None, lock.__enter__)
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The worker thread still takes the lock; release it once it has
+            acquiring.add_done_callback(lambda _: lock.__exit__(None, None, None))
+            raise
+        try:
+            stored = self.token_store.get(key)
+            if stored is None or not stored.is_valid(self.leeway):
+                if stored is not None and stored.refresh_token:
+                    self.refresh_token = stored.refresh_token
+                stored = await self.afetch_token()
+                self.token_store.set(key, stored)
+            self._adopt(stored)
+        finally:
+            lock.__exit__(None, None, None)
+
+    def _authorize(self, headers: Dict[str, str]) -> Dict[str, str]:
+        headers = headers.copy()
+        headers["Authorization"] = f"{self.token_type} {self.token}"
+        return headers
+
+    def sign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
         """
         Sign a request with OAuth 2.0 authentication.
 
@@ -39,13 +223,28 @@ class OAuth2(BearerAuth):
             method: HTTP method
             url: Request URL
             headers: Request headers
+            body: Prepared request body (unused)
 
         Returns:
             Modified headers
         """
-        # TODO: Implement token refresh logic if expires_in is provided
+        self.ensure_token()
+        return self._authorize(headers)
 
-        headers = headers.copy()
-        headers["Authorization"] = f"{self.token_type} {self.token}"
+    async def asign(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[Body] = None
+    ) -> Dict[str, str]:
+        """
+        Sign a request with OAuth 2.0 authentication, refreshing the token asynchronously.
 
-        return headers
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            body: Prepared request body (unused)
+
+        Returns:
+            Modified headers
+        """
+        await self.aensure_token()
+        return self._authorize(headers)
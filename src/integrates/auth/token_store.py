@@ -0,0 +1,234 @@
+"""
+Token stores for sharing OAuth 2.0 tokens.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class Token:
+    """An access token together with its expiry information."""
+
+    def __init__(
+        self,
+        access_token: str,
+        token_type: str = "Bearer",
+        expires_at: Optional[float] = None,
+        refresh_token: Optional[str] = None,
+    ):
+        """
+        Initialize a Token.
+
+        Args:
+            access_token: Access token value
+            token_type: Token type (default: Bearer)
+            expires_at: Expiry as a UNIX timestamp, or None if the token does not expire
+            refresh_token: Refresh token issued with the access token
+        """
+        self.access_token = access_token
+        self.token_type = token_type
+        self.expires_at = expires_at
+        self.refresh_token = refresh_token
+
+    def is_valid(self, leeway: float = 0.0) -> bool:
+        """Return True if the token will still be valid in `leeway` seconds."""
+        if not self.access_token:
+            return False
+        if self.expires_at is None:
+            return True
+        return time.time() + leeway < self.expires_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the token as a JSON-serialisable dictionary."""
+        return {
+            "access_token": self.access_token,
+            "token_type": self.token_type,
+            "expires_at": self.expires_at,
+            "refresh_token": self.refresh_token,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Token":
+        """Create a Token from a dictionary produced by `to_dict`."""
+        return cls(
+            access_token=data["access_token"],
+            token_type=data.get("token_type") or "Bearer",
+            expires_at=data.get("expires_at"),
+            refresh_token=data.get("refresh_token"),
+        )
+
+
+class TokenStore(ABC):
+    """Base class for token stores."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Token]:
+        """
+        Load a token.
+
+        Args:
+            key: Store key identifying the token
+
+        Returns:
+            Stored token, or None if there is none
+        """
+
+    @abstractmethod
+    def set(self, key: str, token: Token) -> None:
+        """
+        Save a token.
+
+        Args:
+            key: Store key identifying the token
+            token: Token to save
+        """
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a key while a token is refreshed.
+
+        Args:
+            key: Store key identifying the token
+        """
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by the threads of a single process."""
+
+    def __init__(self):
+        """Initialize a MemoryTokenStore."""
+        self._tokens: Dict[str, Token] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> Optional[Token]:
+        """Load a token."""
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: Token) -> None:
+        """Save a token."""
+        self._tokens[key] = token
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on a key while a token is refreshed."""
+        with self._guard:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+def default_token_dir() -> str:
+    """
+    Return the per-user directory tokens are stored in by default.
+
+    ``integrates-tokens`` in ``$XDG_RUNTIME_DIR`` if set, else
+    ``integrates/tokens`` in ``$XDG_CACHE_HOME`` or ``~/.cache``.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "integrates-tokens")
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "integrates", "tokens")
+
+
+def _check_private(directory: str) -> None:
+    """Refuse a token directory that other users own or can access."""
+    if not hasattr(os, "getuid"):  # pragma: no cover - Windows relies on ACLs
+        return
+    info = os.stat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(
+            f"Token directory {directory!r} must be owned by the current user "
+            "and not accessible to other users (mode 0700)"
+        )
+
+
+class FileTokenStore(MemoryTokenStore):
+    """
+    Token store backed by files on disk.
+
+    Processes on the same host that point at the same directory share tokens.
+    Refreshes are serialised with an advisory file lock, so only one process
+    requests a new token while the others wait and then read it from disk.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize a FileTokenStore.
+
+        Args:
+            directory: Directory holding the token files (defaults to
+                `default_token_dir`)
+
+        Raises:
+            PermissionError: If the directory is owned by another user or
+                accessible to other users
+        """
+        super().__init__()
+        self.directory = directory or default_token_dir()
+        # The mode only applies to a directory created here, so check it either way
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        _check_private(self.directory)
+
+    def _path(self, key: str, suffix: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}{suffix}")
+
+    def get(self, key: str) -> Optional[Token]:
+        """Load a token."""
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                return Token.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, token: Token) -> None:
+        """Save a token, atomically replacing any previous one."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(token.to_dict(), f)
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on a key across threads and processes."""
+        with super().lock(key):
+            fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:  # pragma: no cover - Windows
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:  # pragma: no cover - Windows
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
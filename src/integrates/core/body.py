@@ -0,0 +1,261 @@
+"""
+Streaming request bodies.
+
+The bodies here are re-iterable: every iteration starts from the beginning,
+reopening files or calling a factory again, so a request can be retried
+without keeping its body in memory.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamBody(ABC):
+    """Base class for streaming request bodies."""
+
+    # Total size in bytes, or None if unknown (the body is then sent chunked)
+    length: Optional[int] = None
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the body from the start."""
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate asynchronously over the body from the start."""
+        for chunk in self:
+            yield chunk
+
+    def as_async(self) -> AsyncIterable:
+        """Return a re-iterable asynchronous view of the body for async transports."""
+        return _AsyncBody(self)
+
+
+class _AsyncBody:
+    """Asynchronous view of a StreamBody; each iteration starts over."""
+
+    def __init__(self, body: StreamBody):
+        self.body = body
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.body.aiter_chunks()
+
+
+class FileBody(StreamBody):
+    """Body read from a file in chunks, reopened for every attempt."""
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ):
+        """
+        Initialize a FileBody.
+
+        Args:
+            path: Path of the file to send
+            chunk_size: Size of the chunks read from the file
+            offset: Position in the file to start at
+            length: Number of bytes to send (defaults to the rest of the file)
+        """
+        self.path = os.fspath(path)
+        self.chunk_size = chunk_size
+        self.offset = offset
+        self.length = length if length is not None else os.path.getsize(self.path) - offset
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the file contents."""
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate over the file contents, reading in a worker thread."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        f = await loop.run_in_executor(None, open, self.path, "rb")
+        try:
+            await loop.run_in_executor(None, f.seek, self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await loop.run_in_executor(None, f.read, min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            f.close()
+
+
+class MmapBody(StreamBody):
+    """
+    Body served from a memory-mapped file.
+
+    Chunks are memoryview slices of the mapping, so no intermediate copies
+    are made in Python; pages are loaded by the OS as the transport writes them.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        chunk_size: int = 1024 * 1024,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ):
+        """
+        Initialize an MmapBody.
+
+        Args:
+            path: Path of the file to send
+            chunk_size: Size of the slices handed to the transport
+            offset: Position in the file to start at
+            length: Number of bytes to send (defaults to the rest of the file)
+        """
+        self.path = os.fspath(path)
+        self.chunk_size = chunk_size
+        self.offset = offset
+        self.length = length if length is not None else os.path.getsize(self.path) - offset
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Iterate over slices of the mapped file."""
+        import mmap
+
+        if self.length <= 0:
+            return
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                end = self.offset + self.length
+                for start in range(self.offset, end, self.chunk_size):
+                    yield view[start : min(start + self.chunk_size, end)]
+            finally:
+                view.release()
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A slice is still referenced; the mapping is freed with it
+                    pass
+
+
+class GeneratorBody(StreamBody):
+    """Body produced by a (sync or async) generator factory, called again for every attempt."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Union[Iterable[bytes], AsyncIterable[bytes]]],
+        length: Optional[int] = None,
+    ):
+        """
+        Initialize a GeneratorBody.
+
+        Args:
+            factory: Callable returning a fresh iterable or async iterable of chunks
+            length: Total size in bytes, if known
+        """
+        self.factory = factory
+        self.length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over a fresh generator from the factory."""
+        chunks = self.factory()
+        if hasattr(chunks, "__aiter__"):
+            raise TypeError("An async generator body can only be sent with an AsyncClient")
+        for chunk in chunks:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate asynchronously over a fresh generator from the factory."""
+        chunks = self.factory()
+        if hasattr(chunks, "__aiter__"):
+            async for chunk in chunks:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        else:
+            for chunk in chunks:
+                yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+class ChainBody(StreamBody):
+    """Body concatenating bytes and other streaming bodies."""
+
+    def __init__(self, parts: List[Union[bytes, str, StreamBody]]):
+        """
+        Initialize a ChainBody.
+
+        Args:
+            parts: Parts to send in order
+        """
+        self.parts = [part.encode("utf-8") if isinstance(part, str) else part for part in parts]
+        lengths = [len(part) if isinstance(part, bytes) else part.length for part in self.parts]
+        self.length = None if None in lengths else sum(lengths)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over all parts."""
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate asynchronously over all parts."""
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                async for chunk in part.aiter_chunks():
+                    yield chunk
+
+
+def body_positions(request_kwargs: Any) -> List[Tuple[IO[bytes], int]]:
+    """
+    Record the positions of seekable file objects in a request.
+
+    Args:
+        request_kwargs: Keyword arguments for the underlying transport
+
+    Returns:
+        List of (file object, position) pairs to restore before a retry
+    """
+    candidates = [request_kwargs.get("content")]
+    files = request_kwargs.get("files") or {}
+    for value in files.values() if isinstance(files, dict) else [v for _, v in files]:
+        candidates.append(value[1] if isinstance(value, tuple) else value)
+
+    positions = []
+    for candidate in candidates:
+        if hasattr(candidate, "seek") and hasattr(candidate, "tell"):
+            try:
+                positions.append((candidate, candidate.tell()))
+            except (OSError, ValueError):
+                pass
+    return positions
+
+
+def rewind(positions: List[Tuple[IO[bytes], int]]) -> None:
+    """Restore file objects to the positions recorded by `body_positions`."""
+    for file, position in positions:
+        file.seek(position)
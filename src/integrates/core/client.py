@@ -2,14 +2,44 @@
 Core client classes for making HTTP requests.
 """
 
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+import os
+import threading
+from json import dumps as json_dumps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import httpx
 from integrates.auth.base import Auth
+from integrates.core.body import FileBody, StreamBody, body_positions, rewind
 from integrates.core.exceptions import IntegratesError, TransportError
+from integrates.core.pool import ConnectionPool, shared_pool
+from integrates.core.prepared import AsyncPreparedRequest, PreparedRequest
 from integrates.core.response import Response
+from integrates.core.tls import client_kwargs
 from integrates.middleware.base import Middleware
+from integrates.utils.url import URLResolver
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from integrates.core.download import DownloadResult
+    from integrates.core.warmup import KeepWarm
+
+
+def _set_default_header(headers: Dict[str, str], name: str, value: str) -> None:
+    """Set a header unless it is already present (case-insensitive)."""
+    lowered = name.lower()
+    if not any(key.lower() == lowered for key in headers):
+        headers[name] = value
+
+
+def _split_stream_kwargs(request_kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split transport arguments into those for building a request and those for sending it."""
+    build_kwargs = dict(request_kwargs)
+    send_kwargs = {
+        key: build_kwargs.pop(key) for key in ("auth", "follow_redirects") if key in build_kwargs
+    }
+    return build_kwargs, send_kwargs
 
 
 class BaseClient:
@@ -22,6 +52,7 @@ class BaseClient:
         middlewares: Optional[List[Middleware]] = None,
         timeout: Union[float, tuple, httpx.Timeout] = 10.0,
         verify: bool = True,
+        pool: Optional[Union[ConnectionPool, str]] = None,
         **kwargs,
     ):
         """
@@ -33,6 +64,8 @@ class BaseClient:
             middlewares: List of middleware to apply to requests
             timeout: Request timeout in seconds
             verify: Verify SSL certificates
+            pool: ConnectionPool (or the name of a shared one) to send requests
+                through; its transport settings replace ``verify`` and ``**kwargs``
             **kwargs: Additional keyword arguments to pass to the underlying transport
         """
         self.base_url = base_url
@@ -49,20 +82,203 @@ class BaseClient:
         self.verify = verify
         self.kwargs = kwargs
 
+        # The httpx client is created on first use, see `_client`
+        self._http: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+        self._http_lock = threading.Lock()
+        self._closed = False
+        self._pool = shared_pool(pool) if isinstance(pool, str) else pool
+        if self._pool is not None:
+            self._pool.attach(self._http_class)
+
+    # httpx client class wrapped by the subclass
+    _http_class: Any = None
+
+    @property
+    def _client(self) -> Any:
+        """Return the underlying httpx client, creating it on first use."""
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    if self._closed:
+                        raise RuntimeError("Cannot send a request, as the client has been closed.")
+                    if self._pool is not None:
+                        self._http = self._pool.get(self._http_class)
+                    else:
+                        self._http = self._http_class(**self._http_kwargs())
+                http = self._http
+        return http
+
+    def _http_kwargs(self) -> Dict[str, Any]:
+        """Return the arguments for the underlying httpx client."""
+        # Loading the CA bundle is slow; SSL contexts are shared per set of settings
+        return client_kwargs(self.timeout, self.verify, self.kwargs)
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL for all requests."""
+        return self._url_resolver.base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """Set the base URL, resetting the cache of resolved URLs."""
+        self._url_resolver = URLResolver(value)
+
+    def _build_request_kwargs(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        sign: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Resolve the URL, apply authentication and build the transport arguments.
+
+        With ``sign`` false, auth methods that do not sign the body are left to
+        the caller too (AsyncClient awaits `Auth.asign` instead).
+
+        For auth methods that sign the request body, the body is serialised
+        exactly once and sent as the request content; it is signed by
+        `_sign_body` after the pre-request middlewares, which may still change
+        it (e.g. compress it).
+
+        Returns:
+            Keyword arguments for the underlying transport
+        """
+        if path_params:
+            request_url = self._url_resolver.expand(url, path_params)
+        else:
+            request_url = self._url_resolver.resolve(url)
+
+        final_headers = headers or {}
+        content = kwargs.get("content")
+        # Only path objects name files: a str is ambiguous and is sent as the body itself
+        if isinstance(content, os.PathLike):
+            content = kwargs["content"] = FileBody(content)
+        if isinstance(content, StreamBody) and content.length is not None:
+            final_headers = dict(final_headers)
+            _set_default_header(final_headers, "Content-Length", str(content.length))
+
+        # Apply authentication if provided
+        if self.auth and getattr(self.auth, "requires_body", False):
+            final_headers = dict(final_headers)
+            body = kwargs.pop("content", None)
+            if json is not None:
+                body = json_dumps(json).encode("utf-8")
+                json = None
+                _set_default_header(final_headers, "Content-Type", "application/json")
+            elif body is None and isinstance(data, (bytes, str)):
+                body = data
+                data = None
+            elif body is None and isinstance(data, dict) and not files:
+                body = urlencode(data, doseq=True)
+                data = None
+                _set_default_header(
+                    final_headers, "Content-Type", "application/x-www-form-urlencoded"
+                )
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            if body is not None:
+                kwargs["content"] = body
+
+            # The query string is part of the signature, so it has to be final
+            if params:
+                request_url = str(httpx.URL(request_url, params=params))
+                params = None
+        elif self.auth and sign:
+            final_headers = self.auth.sign(method, request_url, final_headers)
+
+        if self._pool is not None:
+            # The shared httpx client has the pool's timeout; send this client's own
+            kwargs.setdefault("timeout", self.timeout)
+
+        return {
+            "method": method,
+            "url": request_url,
+            "params": params,
+            "headers": final_headers,
+            "cookies": cookies,
+            "data": data,
+            "json": json,
+            "files": files,
+            **kwargs,
+        }
+
+    def _sign_body(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sign the final request body for auth methods that require it.
+
+        Runs after the pre-request middlewares, so the signature covers the
+        body and headers that are actually sent.
+
+        Args:
+            request_kwargs: Keyword arguments for the underlying transport
+
+        Returns:
+            The arguments with signed headers
+        """
+        if self.auth is None or not getattr(self.auth, "requires_body", False):
+            return request_kwargs
+        request_kwargs["headers"] = self.auth.sign(
+            request_kwargs["method"],
+            request_kwargs["url"],
+            dict(request_kwargs.get("headers") or {}),
+            body=_final_body(request_kwargs),
+        )
+        return request_kwargs
+
+    def _release(self) -> Optional[Any]:
+        """Mark the client closed and return the httpx client it should close, if any."""
+        if self._closed:
+            return None
+        self._closed = True
+        if self._pool is not None:
+            # Only the last client attached to the pool closes it
+            return self._pool.release(self._http_class)
+        return self._http
+
+    def _warmup_urls(self, origins: Optional[List[str]]) -> List[str]:
+        urls = [self.base_url] if self.base_url else []
+        for origin in origins or []:
+            url = self._url_resolver.resolve(origin)
+            if url not in urls:
+                urls.append(url)
+        if not urls:
+            raise ValueError("No base_url or origins to warm up")
+        return urls
+
+
+def _final_body(request_kwargs: Dict[str, Any]) -> Optional[Any]:
+    """Return the body a request is sent with, as passed to body-signing auth."""
+    body = request_kwargs.get("content")
+    if body is None and isinstance(request_kwargs.get("data"), (bytes, str)):
+        body = request_kwargs["data"]
+    return body.encode("utf-8") if isinstance(body, str) else body
+
 
 class Client(BaseClient):
     """Synchronous HTTP client for making requests."""
 
+    _http_class = httpx.Client
+
     def __init__(self, *args, **kwargs):
         """Initialize a synchronous Client."""
         super().__init__(*args, **kwargs)
-        self._client = httpx.Client(timeout=self.timeout, verify=self.verify, **self.kwargs)
+        self._keep_warm: Optional["KeepWarm"] = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._client.close()
+        self.close()
 
     def request(
         self,
@@ -75,6 +291,8 @@ class Client(BaseClient):
         data: Optional[Any] = None,
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
         **kwargs,
     ) -> Response:
         """
@@ -88,8 +306,14 @@ class Client(BaseClient):
             cookies: Cookies to send
             data: Form data or raw request body
             json: JSON data to send
-            files: Files to upload
-            **kwargs: Additional keyword arguments to pass to the underlying transport
+            files: Files to upload (file objects are streamed and rewound on retries)
+            path_params: Values for ``{name}`` placeholders in the URL
+            stream: Leave the body unread so it can be consumed incrementally
+                (``iter_bytes``, ``iter_records``); close the response when done
+            **kwargs: Additional keyword arguments to pass to the underlying transport,
+                e.g. ``content`` as bytes, a `pathlib.Path` or a streaming body
+                (`FileBody`, `MmapBody`, `GeneratorBody`); a str is sent as text,
+                never opened as a path
 
         Returns:
             Response object
@@ -97,30 +321,44 @@ class Client(BaseClient):
         Raises:
             IntegratesError: If the request fails
         """
-        # Apply middlewares (pre-request)
-        request_url = urljoin(self.base_url, url)
-
-        # Apply authentication if provided
-        final_headers = headers or {}
-        if self.auth:
-            final_headers = self.auth.sign(method, request_url, final_headers)
-
-        # Create and apply middlewares to request params
-        request_kwargs = {
-            "method": method,
-            "url": request_url,
-            "params": params,
-            "headers": final_headers,
-            "cookies": cookies,
-            "data": data,
-            "json": json,
-            "files": files,
+        request_kwargs = self._build_request_kwargs(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            data=data,
+            json=json,
+            files=files,
+            path_params=path_params,
             **kwargs,
-        }
+        )
+        if stream:
+            request_kwargs["stream"] = True
 
+        # Apply middlewares (pre-request)
         for middleware in self.middlewares:
             request_kwargs = middleware.pre_request(request_kwargs)
 
+        return self._send(self._sign_body(request_kwargs))
+
+    def _send(self, request_kwargs: Dict[str, Any]) -> Response:
+        """
+        Send prepared transport arguments, retrying and applying post-request middlewares.
+
+        Args:
+            request_kwargs: Keyword arguments for the underlying transport
+
+        Returns:
+            Response object
+
+        Raises:
+            TransportError: If the request fails after all retries
+        """
+        stream = request_kwargs.pop("stream", False)
+        # File bodies are rewound before each retry instead of being buffered
+        positions = body_positions(request_kwargs)
+
         # Extract retry configuration if present
         retry_config = request_kwargs.pop("_retry_config", None)
         retries_left = retry_config.get("count", 0) if retry_config else 0
@@ -132,12 +370,21 @@ class Client(BaseClient):
         last_exception = None
 
         while True:
+            if attempt:
+                rewind(positions)
             try:
-                httpx_response = self._client.request(**request_kwargs)
-                response = Response.from_httpx(httpx_response)
+                if stream:
+                    build_kwargs, send_kwargs = _split_stream_kwargs(request_kwargs)
+                    httpx_response = self._client.send(
+                        self._client.build_request(**build_kwargs), stream=True, **send_kwargs
+                    )
+                else:
+                    httpx_response = self._client.request(**request_kwargs)
+                response = Response.from_httpx(httpx_response, stream=stream)
 
                 # Check if we should retry based on status code
                 if retries_left > 0 and response.status_code in retry_status_codes:
+                    response.close()
                     attempt += 1
                     retries_left -= 1
                     if retries_left >= 0:
@@ -172,6 +419,43 @@ class Client(BaseClient):
                 backoff_time = backoff_time + (random.randint(0, 1000) / 1000.0)
                 time.sleep(backoff_time)
 
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> PreparedRequest:
+        """
+        Prepare a request that is sent repeatedly with only params or body changing.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: URL to request (will be joined with base_url)
+            params: Query parameters sent with every call
+            headers: HTTP headers
+            cookies: Cookies to send
+            path_params: Values for ``{name}`` placeholders in the URL
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Immutable prepared request; call its ``send()`` method to send it
+        """
+        return PreparedRequest(
+            self,
+            method,
+            url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            path_params=path_params,
+            **kwargs,
+        )
+
     def get(self, url: str, **kwargs) -> Response:
         """Make a GET request."""
         return self.request("GET", url, **kwargs)
@@ -200,24 +484,133 @@ class Client(BaseClient):
         """Make an OPTIONS request."""
         return self.request("OPTIONS", url, **kwargs)
 
+    def download(
+        self,
+        url: str,
+        dest: Union[str, "os.PathLike[str]"],
+        *,
+        parts: int = 4,
+        chunk_size: int = 64 * 1024,
+        retries: int = 3,
+        resume: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "DownloadResult":
+        """
+        Download a URL to a file, fetching byte ranges in parallel.
+
+        The size is probed with a one-byte range request. If the server supports
+        ranges, the file is preallocated and ``parts`` ranges are written into it
+        at their offsets as they arrive. Progress is saved next to the file
+        (``<dest>.part`` and ``<dest>.part.json``), so a failed download resumes
+        where it stopped when called again, provided the ETag or Last-Modified
+        validator still matches. Servers without range support get a single
+        streamed request.
+
+        Args:
+            url: URL to download (will be joined with base_url)
+            dest: Path of the file to write
+            parts: Number of ranges to fetch concurrently
+            chunk_size: Size of the chunks written to disk
+            retries: Attempts per part after a dropped connection
+            resume: Continue from a matching partial download, if any
+            headers: HTTP headers
+            progress: Callback receiving (bytes done, total bytes), called from
+                worker threads
+
+        Returns:
+            DownloadResult with the size, ETag and throughput
+
+        Raises:
+            DownloadError: If the resource changed during the download or the
+                file does not have the expected length
+            TransportError: If a part fails after all retries
+        """
+        from integrates.core.download import download
+
+        return download(
+            self,
+            url,
+            dest,
+            parts=parts,
+            chunk_size=chunk_size,
+            retries=retries,
+            resume=resume,
+            headers=headers,
+            progress=progress,
+        )
+
+    def warmup(
+        self,
+        origins: Optional[List[str]] = None,
+        connections: int = 1,
+        *,
+        keep_warm: bool = False,
+        interval: float = 4.0,
+        method: str = "HEAD",
+    ) -> Dict[str, int]:
+        """
+        Open pooled connections ahead of the first requests.
+
+        ``connections`` requests are sent concurrently to the base URL and to
+        every origin listed, so DNS, TCP and TLS setup happen now instead of on
+        the first real requests. Failures are ignored. The pool only keeps
+        connections up to its keep-alive limit, and idle connections expire
+        after its keep-alive timeout (5 seconds by default in httpx); with
+        ``keep_warm`` the warm-up is repeated every ``interval`` seconds in a
+        background thread so at least ``connections`` stay open.
+
+        Args:
+            origins: Additional URLs to connect to (relative ones are joined with base_url)
+            connections: Connections to open per URL
+            keep_warm: Keep repeating the warm-up until `stop_keep_warm` or close
+            interval: Seconds between keep-warm rounds
+            method: HTTP method of the warm-up requests
+
+        Returns:
+            Number of connections warmed per URL
+        """
+        from integrates.core.warmup import KeepWarm, warm
+
+        urls = self._warmup_urls(origins)
+        warmed = warm(self._client, urls, connections, method)
+        if keep_warm:
+            self.stop_keep_warm()
+            self._keep_warm = KeepWarm(
+                lambda: warm(self._client, urls, connections, method), interval
+            )
+            self._keep_warm.start()
+        return warmed
+
+    def stop_keep_warm(self) -> None:
+        """Stop a keep-warm loop started by `warmup`."""
+        if self._keep_warm is not None:
+            self._keep_warm.stop()
+            self._keep_warm = None
+
     def close(self):
         """Close the underlying transport."""
-        self._client.close()
+        self.stop_keep_warm()
+        http = self._release()
+        if http is not None:
+            http.close()
 
 
 class AsyncClient(BaseClient):
     """Asynchronous HTTP client for making requests."""
 
+    _http_class = httpx.AsyncClient
+
     def __init__(self, *args, **kwargs):
         """Initialize an asynchronous Client."""
         super().__init__(*args, **kwargs)
-        self._client = httpx.AsyncClient(timeout=self.timeout, verify=self.verify, **self.kwargs)
+        self._keep_warm: Optional["asyncio.Task"] = None
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.aclose()
+        await self.close()
 
     async def request(
         self,
@@ -230,6 +623,8 @@ class AsyncClient(BaseClient):
         data: Optional[Any] = None,
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
         **kwargs,
     ) -> Response:
         """
@@ -243,8 +638,14 @@ class AsyncClient(BaseClient):
             cookies: Cookies to send
             data: Form data or raw request body
             json: JSON data to send
-            files: Files to upload
-            **kwargs: Additional keyword arguments to pass to the underlying transport
+            files: Files to upload (file objects are streamed and rewound on retries)
+            path_params: Values for ``{name}`` placeholders in the URL
+            stream: Leave the body unread so it can be consumed incrementally
+                (``iter_bytes``, ``iter_records``); close the response when done
+            **kwargs: Additional keyword arguments to pass to the underlying transport,
+                e.g. ``content`` as bytes, a `pathlib.Path` or a streaming body
+                (`FileBody`, `MmapBody`, `GeneratorBody`); a str is sent as text,
+                never opened as a path
 
         Returns:
             Response object
@@ -252,29 +653,80 @@ class AsyncClient(BaseClient):
         Raises:
             IntegratesError: If the request fails
         """
+        request_kwargs = self._build_request_kwargs(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            data=data,
+            json=json,
+            files=files,
+            path_params=path_params,
+            sign=False,
+            **kwargs,
+        )
+        if stream:
+            request_kwargs["stream"] = True
+        request_kwargs = await self._asign(request_kwargs)
+
         # Apply middlewares (pre-request)
-        request_url = urljoin(self.base_url, url)
+        for middleware in self.middlewares:
+            request_kwargs = await middleware.apre_request(request_kwargs)
 
-        # Apply authentication if provided
-        final_headers = headers or {}
-        if self.auth:
-            final_headers = self.auth.sign(method, request_url, final_headers)
+        return await self._send(await self._asign(request_kwargs, body=True))
 
-        # Create and apply middlewares to request params
-        request_kwargs = {
-            "method": method,
-            "url": request_url,
-            "params": params,
-            "headers": final_headers,
-            "cookies": cookies,
-            "data": data,
-            "json": json,
-            "files": files,
-            **kwargs,
-        }
+    async def _asign(self, request_kwargs: Dict[str, Any], body: bool = False) -> Dict[str, Any]:
+        """
+        Sign a request with `Auth.asign`, so token refreshes do not block the event loop.
 
-        for middleware in self.middlewares:
-            request_kwargs = middleware.pre_request(request_kwargs)
+        Auth methods that do not sign the body are applied before the
+        pre-request middlewares (``body`` false), body-signing ones after them
+        (``body`` true), as in the synchronous client.
+
+        Args:
+            request_kwargs: Keyword arguments for the underlying transport
+            body: Apply body-signing auth methods instead of the others
+
+        Returns:
+            The arguments with signed headers
+        """
+        if self.auth is None or bool(getattr(self.auth, "requires_body", False)) != body:
+            return request_kwargs
+        import inspect
+
+        args = (
+            request_kwargs["method"],
+            request_kwargs["url"],
+            dict(request_kwargs.get("headers") or {}),
+        )
+        body_arg = {"body": _final_body(request_kwargs)} if body else {}
+        asign = getattr(self.auth, "asign", None)
+        if inspect.iscoroutinefunction(asign):
+            request_kwargs["headers"] = await asign(*args, **body_arg)
+        else:
+            # Auth objects that only implement `sign`
+            request_kwargs["headers"] = self.auth.sign(*args, **body_arg)
+        return request_kwargs
+
+    async def _send(self, request_kwargs: Dict[str, Any]) -> Response:
+        """
+        Send prepared transport arguments, retrying and applying post-request middlewares.
+
+        Args:
+            request_kwargs: Keyword arguments for the underlying transport
+
+        Returns:
+            Response object
+
+        Raises:
+            TransportError: If the request fails after all retries
+        """
+        if isinstance(request_kwargs.get("content"), StreamBody):
+            request_kwargs["content"] = request_kwargs["content"].as_async()
+        stream = request_kwargs.pop("stream", False)
+        # File bodies are rewound before each retry instead of being buffered
+        positions = body_positions(request_kwargs)
 
         # Extract retry configuration if present
         retry_config = request_kwargs.pop("_retry_config", None)
@@ -287,12 +739,21 @@ class AsyncClient(BaseClient):
         last_exception = None
 
         while True:
+            if attempt:
+                rewind(positions)
             try:
-                httpx_response = await self._client.request(**request_kwargs)
-                response = Response.from_httpx(httpx_response)
+                if stream:
+                    build_kwargs, send_kwargs = _split_stream_kwargs(request_kwargs)
+                    httpx_response = await self._client.send(
+                        self._client.build_request(**build_kwargs), stream=True, **send_kwargs
+                    )
+                else:
+                    httpx_response = await self._client.request(**request_kwargs)
+                response = Response.from_httpx(httpx_response, stream=stream)
 
                 # Check if we should retry based on status code
                 if retries_left > 0 and response.status_code in retry_status_codes:
+                    await response.aclose()
                     attempt += 1
                     retries_left -= 1
                     if retries_left >= 0:
@@ -327,6 +788,43 @@ class AsyncClient(BaseClient):
                 backoff_time = backoff_time + (random.randint(0, 1000) / 1000.0)
                 await asyncio.sleep(backoff_time)
 
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> AsyncPreparedRequest:
+        """
+        Prepare a request that is sent repeatedly with only params or body changing.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: URL to request (will be joined with base_url)
+            params: Query parameters sent with every call
+            headers: HTTP headers
+            cookies: Cookies to send
+            path_params: Values for ``{name}`` placeholders in the URL
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Immutable prepared request; call its ``send()`` method to send it
+        """
+        return AsyncPreparedRequest(
+            self,
+            method,
+            url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            path_params=path_params,
+            **kwargs,
+        )
+
     async def get(self, url: str, **kwargs) -> Response:
         """Make a GET request."""
         return await self.request("GET", url, **kwargs)
@@ -355,6 +853,113 @@ class AsyncClient(BaseClient):
         """Make an OPTIONS request."""
         return await self.request("OPTIONS", url, **kwargs)
 
+    async def download(
+        self,
+        url: str,
+        dest: Union[str, "os.PathLike[str]"],
+        *,
+        parts: int = 4,
+        chunk_size: int = 64 * 1024,
+        retries: int = 3,
+        resume: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "DownloadResult":
+        """
+        Download a URL to a file asynchronously, fetching byte ranges concurrently.
+
+        The size is probed with a one-byte range request. If the server supports
+        ranges, the file is preallocated and ``parts`` ranges are written into it
+        at their offsets as they arrive. Progress is saved next to the file
+        (``<dest>.part`` and ``<dest>.part.json``), so a failed download resumes
+        where it stopped when called again, provided the ETag or Last-Modified
+        validator still matches. Servers without range support get a single
+        streamed request.
+
+        Args:
+            url: URL to download (will be joined with base_url)
+            dest: Path of the file to write
+            parts: Number of ranges to fetch concurrently
+            chunk_size: Size of the chunks written to disk
+            retries: Attempts per part after a dropped connection
+            resume: Continue from a matching partial download, if any
+            headers: HTTP headers
+            progress: Callback receiving (bytes done, total bytes)
+
+        Returns:
+            DownloadResult with the size, ETag and throughput
+
+        Raises:
+            DownloadError: If the resource changed during the download or the
+                file does not have the expected length
+            TransportError: If a part fails after all retries
+        """
+        from integrates.core.download import adownload
+
+        return await adownload(
+            self,
+            url,
+            dest,
+            parts=parts,
+            chunk_size=chunk_size,
+            retries=retries,
+            resume=resume,
+            headers=headers,
+            progress=progress,
+        )
+
+    async def warmup(
+        self,
+        origins: Optional[List[str]] = None,
+        connections: int = 1,
+        *,
+        keep_warm: bool = False,
+        interval: float = 4.0,
+        method: str = "HEAD",
+    ) -> Dict[str, int]:
+        """
+        Open pooled connections ahead of the first requests.
+
+        ``connections`` requests are sent concurrently to the base URL and to
+        every origin listed, so DNS, TCP and TLS setup happen now instead of on
+        the first real requests. Failures are ignored. The pool only keeps
+        connections up to its keep-alive limit, and idle connections expire
+        after its keep-alive timeout (5 seconds by default in httpx); with
+        ``keep_warm`` the warm-up is repeated every ``interval`` seconds in a
+        background task so at least ``connections`` stay open.
+
+        Args:
+            origins: Additional URLs to connect to (relative ones are joined with base_url)
+            connections: Connections to open per URL
+            keep_warm: Keep repeating the warm-up until `stop_keep_warm` or close
+            interval: Seconds between keep-warm rounds
+            method: HTTP method of the warm-up requests
+
+        Returns:
+            Number of connections warmed per URL
+        """
+        import asyncio
+
+        from integrates.core.warmup import awarm, keep_warm_loop
+
+        urls = self._warmup_urls(origins)
+        warmed = await awarm(self._client, urls, connections, method)
+        if keep_warm:
+            self.stop_keep_warm()
+            self._keep_warm = asyncio.ensure_future(
+                keep_warm_loop(lambda: awarm(self._client, urls, connections, method), interval)
+            )
+        return warmed
+
+    def stop_keep_warm(self) -> None:
+        """Stop a keep-warm loop started by `warmup`."""
+        if self._keep_warm is not None:
+            self._keep_warm.cancel()
+            self._keep_warm = None
+
     async def close(self):
         """Close the underlying transport."""
-        await self._client.aclose()
+        self.stop_keep_warm()
+        http = self._release()
+        if http is not None:
+            await http.aclose()
@@ -0,0 +1,496 @@
+"""
+Parallel, resumable ranged downloads to disk.
+"""
+
+import asyncio
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+from integrates.core.exceptions import DownloadError, TransportError
+from integrates.core.response import Response
+
+if TYPE_CHECKING:
+    from integrates.core.client import AsyncClient, Client
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Ranges smaller than this are not worth a connection of their own
+MIN_PART_SIZE = 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)")
+_seek_lock = threading.Lock()
+
+Progress = Callable[[int, int], None]
+
+
+class DownloadResult:
+    """Outcome of a download."""
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        downloaded: int,
+        elapsed: float,
+        etag: Optional[str] = None,
+        resumed: bool = False,
+    ):
+        """
+        Initialize a DownloadResult.
+
+        Args:
+            path: Path of the downloaded file
+            size: Size of the file in bytes
+            downloaded: Bytes transferred by this call (less than size when resumed)
+            elapsed: Wall-clock time in seconds
+            etag: ETag of the downloaded resource, if the server sent one
+            resumed: Whether the download continued from an earlier partial file
+        """
+        self.path = path
+        self.size = size
+        self.downloaded = downloaded
+        self.elapsed = elapsed
+        self.etag = etag
+        self.resumed = resumed
+
+    def __repr__(self) -> str:
+        return f"<DownloadResult {self.path} {self.size} bytes {self.throughput / 1e6:.1f} MB/s>"
+
+    @property
+    def throughput(self) -> float:
+        """Return the average transfer rate of this call in bytes per second."""
+        return self.downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _DownloadState:
+    """
+    Byte ranges still to fetch, saved next to the partial file.
+
+    Each range is a ``[next, end)`` pair that its worker advances as chunks
+    are written, so an interrupted download resumes where every part stopped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        url: str,
+        size: int,
+        etag: Optional[str],
+        validator: Optional[str],
+        ranges: List[List[int]],
+    ):
+        self.path = path
+        self.url = url
+        self.size = size
+        self.etag = etag
+        self.validator = validator
+        self.ranges = ranges
+        self.lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.downloaded = 0
+        self._saved_at = 0.0
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        url: str,
+        size: int,
+        etag: Optional[str],
+        validator: Optional[str],
+        parts: int,
+    ) -> "_DownloadState":
+        parts = max(1, min(parts, -(-size // MIN_PART_SIZE)))
+        step = max(1, -(-size // parts))
+        ranges = [[start, min(start + step, size)] for start in range(0, size, step)]
+        return cls(path, url, size, etag, validator, ranges)
+
+    @classmethod
+    def load(
+        cls, path: str, url: str, size: int, etag: Optional[str], validator: Optional[str]
+    ) -> Optional["_DownloadState"]:
+        """Load saved ranges if they belong to the same version of the same resource."""
+        if validator is None:
+            # Without a validator there is no way to tell whether the resource changed
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (data.get("url"), data.get("size"), data.get("validator")) != (url, size, validator):
+            return None
+        return cls(path, url, size, etag, validator, data["ranges"])
+
+    @property
+    def remaining(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+    def advance(self, index: int, count: int, save: bool = True) -> bool:
+        """Record progress of a part; return True if a save is due (done here if ``save``)."""
+        with self.lock:
+            self.ranges[index][0] += count
+            self.downloaded += count
+            due = time.monotonic() - self._saved_at >= 1.0
+            if due:
+                # Claimed here so concurrent parts do not all save at once
+                self._saved_at = time.monotonic()
+        if due and save:
+            self.save()
+        return due
+
+    def save(self) -> None:
+        with self.lock:
+            self._saved_at = time.monotonic()
+            data = {
+                "url": self.url,
+                "size": self.size,
+                "validator": self.validator,
+                "ranges": self.ranges,
+            }
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def discard(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def range_headers(self, headers: Dict[str, str], start: int, end: int) -> Dict[str, str]:
+        range_headers = {**headers, "Range": f"bytes={start}-{end - 1}"}
+        if self.validator:
+            # The server answers 200 with the full body if the resource changed
+            range_headers["If-Range"] = self.validator
+        return range_headers
+
+    def check_part(self, response: Response, start: int) -> None:
+        """Make sure a range response is the part of the same resource that was asked for."""
+        if response.status_code == 200 or (
+            self.etag and response.headers.get("etag") not in (None, self.etag)
+        ):
+            raise DownloadError(f"{self.url} changed during the download")
+        if response.status_code != 206:
+            response.raise_for_status()
+            raise DownloadError(f"Unexpected status {response.status_code} for a range request")
+        match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+        if not match or match.group(1) is None or int(match.group(1)) != start:
+            raise DownloadError("Server returned the wrong byte range")
+
+
+def _validator(headers: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return the ETag and the strongest validator usable with If-Range."""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag, etag
+    return etag, headers.get("last-modified")
+
+
+def _plan(response: Response) -> Optional[int]:
+    """
+    Read the size of the resource from a ``Range: bytes=0-0`` probe.
+
+    Returns:
+        Total size, or None if the server does not support ranges
+    """
+    if response.status_code in (206, 416):
+        match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+        if match and match.group(3) != "*":
+            size = int(match.group(3))
+            if response.status_code == 206 or size == 0:
+                return size
+    if response.status_code == 200:
+        return None
+    response.raise_for_status()
+    raise DownloadError(f"Unexpected status {response.status_code} for a range request")
+
+
+def _preallocate(fd: int, size: int) -> None:
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            # Not supported by this filesystem; a sparse file works too
+            pass
+    os.ftruncate(fd, size)
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    """Write at an offset without moving a shared file position."""
+    view = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+        return
+    with _seek_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+def _open_partial(path: str, size: int, fresh: bool) -> int:
+    flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags | (os.O_TRUNC if fresh else 0), 0o644)
+    if fresh:
+        _preallocate(fd, size)
+    return fd
+
+
+def _finish(partial: str, dest: str, state: Optional[_DownloadState], size: int) -> None:
+    actual = os.path.getsize(partial)
+    if (state is not None and state.remaining) or actual != size:
+        raise DownloadError(f"Downloaded {actual} bytes, expected {size}")
+    os.replace(partial, dest)
+    if state is not None:
+        state.discard()
+
+
+def _backoff(attempt: int) -> float:
+    return 0.3 * (2**attempt)
+
+
+def _fetch_part(
+    client: "Client",
+    state: _DownloadState,
+    index: int,
+    fd: int,
+    headers: Dict[str, str],
+    chunk_size: int,
+    retries: int,
+    progress: Optional[Progress],
+) -> None:
+    attempt = 0
+    while not state.cancelled.is_set():
+        start, end = state.ranges[index]
+        if start >= end:
+            return
+        try:
+            with client.get(
+                state.url, headers=state.range_headers(headers, start, end), stream=True
+            ) as response:
+                state.check_part(response, start)
+                for chunk in response.iter_bytes(chunk_size):
+                    if state.cancelled.is_set():
+                        return
+                    chunk = chunk[: end - start]
+                    _pwrite(fd, chunk, start)
+                    start += len(chunk)
+                    state.advance(index, len(chunk))
+                    if progress:
+                        progress(state.size - state.remaining, state.size)
+                    if start >= end:
+                        break
+            if start < end:
+                raise TransportError(f"Connection closed with {end - start} bytes left in part")
+        except (httpx.HTTPError, TransportError) as exc:
+            attempt += 1
+            if attempt > retries:
+                raise TransportError(f"Download of {state.url} failed: {exc}") from exc
+            time.sleep(_backoff(attempt))
+
+
+def download(
+    client: "Client",
+    url: str,
+    dest: Union[str, "os.PathLike[str]"],
+    *,
+    parts: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    retries: int = 3,
+    resume: bool = True,
+    headers: Optional[Dict[str, str]] = None,
+    progress: Optional[Progress] = None,
+) -> DownloadResult:
+    """
+    Download a URL to a file, fetching byte ranges in parallel.
+
+    See `Client.download` for the arguments.
+    """
+    dest = os.fspath(dest)
+    partial = dest + ".part"
+    started = time.monotonic()
+    headers = {**(headers or {}), "Accept-Encoding": "identity"}
+
+    with client.get(url, headers={**headers, "Range": "bytes=0-0"}, stream=True) as probe:
+        size = _plan(probe)
+        etag, validator = _validator(probe.headers)
+        if size is None:
+            # No range support: write the probe's own body sequentially
+            downloaded = 0
+            with open(partial, "wb") as f:
+                for chunk in probe.iter_bytes(chunk_size):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if progress:
+                        progress(downloaded, downloaded)
+            expected = probe.headers.get("content-length")
+            _finish(partial, dest, None, int(expected) if expected else downloaded)
+            return DownloadResult(dest, downloaded, downloaded, time.monotonic() - started, etag)
+
+    state_path = partial + ".json"
+    state = None
+    if resume and os.path.exists(partial):
+        state = _DownloadState.load(state_path, url, size, etag, validator)
+    resumed = state is not None
+    if state is None:
+        state = _DownloadState.create(state_path, url, size, etag, validator, parts)
+
+    fd = _open_partial(partial, size, fresh=not resumed)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(state.ranges))) as pool:
+            futures = [
+                pool.submit(
+                    _fetch_part, client, state, index, fd, headers, chunk_size, retries, progress
+                )
+                for index in range(len(state.ranges))
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                state.cancelled.set()
+                raise
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+        if state.remaining:
+            state.save()
+
+    _finish(partial, dest, state, size)
+    return DownloadResult(dest, size, state.downloaded, time.monotonic() - started, etag, resumed)
+
+
+async def _afetch_part(
+    client: "AsyncClient",
+    state: _DownloadState,
+    index: int,
+    fd: int,
+    headers: Dict[str, str],
+    chunk_size: int,
+    retries: int,
+    progress: Optional[Progress],
+) -> None:
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    while not state.cancelled.is_set():
+        start, end = state.ranges[index]
+        if start >= end:
+            return
+        try:
+            response = await client.get(
+                state.url, headers=state.range_headers(headers, start, end), stream=True
+            )
+            async with response:
+                state.check_part(response, start)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if state.cancelled.is_set():
+                        return
+                    chunk = chunk[: end - start]
+                    await loop.run_in_executor(None, _pwrite, fd, chunk, start)
+                    start += len(chunk)
+                    # File I/O stays off the event loop, the state file included
+                    if state.advance(index, len(chunk), save=False):
+                        await loop.run_in_executor(None, state.save)
+                    if progress:
+                        progress(state.size - state.remaining, state.size)
+                    if start >= end:
+                        break
+            if start < end:
+                raise TransportError(f"Connection closed with {end - start} bytes left in part")
+        except (httpx.HTTPError, TransportError) as exc:
+            attempt += 1
+            if attempt > retries:
+                raise TransportError(f"Download of {state.url} failed: {exc}") from exc
+            await asyncio.sleep(_backoff(attempt))
+
+
+async def adownload(
+    client: "AsyncClient",
+    url: str,
+    dest: Union[str, "os.PathLike[str]"],
+    *,
+    parts: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    retries: int = 3,
+    resume: bool = True,
+    headers: Optional[Dict[str, str]] = None,
+    progress: Optional[Progress] = None,
+) -> DownloadResult:
+    """
+    Download a URL to a file asynchronously, fetching byte ranges concurrently.
+
+    See `AsyncClient.download` for the arguments.
+    """
+    dest = os.fspath(dest)
+    partial = dest + ".part"
+    started = time.monotonic()
+    headers = {**(headers or {}), "Accept-Encoding": "identity"}
+    loop = asyncio.get_running_loop()
+
+    probe = await client.get(url, headers={**headers, "Range": "bytes=0-0"}, stream=True)
+    async with probe:
+        size = _plan(probe)
+        etag, validator = _validator(probe.headers)
+        if size is None:
+            downloaded = 0
+            f = await loop.run_in_executor(None, open, partial, "wb")
+            try:
+                async for chunk in probe.aiter_bytes(chunk_size):
+                    await loop.run_in_executor(None, f.write, chunk)
+                    downloaded += len(chunk)
+                    if progress:
+                        progress(downloaded, downloaded)
+            finally:
+                f.close()
+            expected = probe.headers.get("content-length")
+            _finish(partial, dest, None, int(expected) if expected else downloaded)
+            return DownloadResult(dest, downloaded, downloaded, time.monotonic() - started, etag)
+
+    state_path = partial + ".json"
+    state = None
+    if resume and os.path.exists(partial):
+        state = _DownloadState.load(state_path, url, size, etag, validator)
+    resumed = state is not None
+    if state is None:
+        state = _DownloadState.create(state_path, url, size, etag, validator, parts)
+
+    fd = await loop.run_in_executor(None, _open_partial, partial, size, not resumed)
+    try:
+        tasks = [
+            asyncio.ensure_future(
+                _afetch_part(client, state, index, fd, headers, chunk_size, retries, progress)
+            )
+            for index in range(len(state.ranges))
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            state.cancelled.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        await loop.run_in_executor(None, os.fsync, fd)
+    finally:
+        os.close(fd)
+        if state.remaining:
+            await loop.run_in_executor(None, state.save)
+
+    _finish(partial, dest, state, size)
+    return DownloadResult(dest, size, state.downloaded, time.monotonic() - started, etag, resumed)
@@ -2,7 +2,7 @@
 Exception classes for Integrates.
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from integrates.core.response import Response
 
@@ -25,6 +25,18 @@ class TimeoutError(TransportError):
     pass
 
 
+class AuthenticationError(IntegratesError):
+    """Error obtaining or refreshing credentials."""
+
+    pass
+
+
+class DownloadError(IntegratesError):
+    """Downloaded file is incomplete or the resource changed while it was fetched."""
+
+    pass
+
+
 class HTTPError(IntegratesError):
     """HTTP error response."""
 
@@ -45,6 +57,33 @@ class HTTPError(IntegratesError):
         return self.response.status_code if self.response else None
 
 
+class GraphQLError(IntegratesError):
+    """GraphQL operation returned errors."""
+
+    def __init__(self, message: str, errors: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize a GraphQLError.
+
+        Args:
+            message: Error message
+            errors: Entries of the response's ``errors`` list
+        """
+        super().__init__(message)
+        self.errors = errors or []
+
+
+class GraphQLSyntaxError(GraphQLError):
+    """GraphQL document could not be parsed."""
+
+    pass
+
+
+class GraphQLValidationError(GraphQLError):
+    """GraphQL operation does not match the endpoint's schema."""
+
+    pass
+
+
 class SchemaValidationError(IntegratesError):
     """Error validating response against schema."""
 
@@ -0,0 +1,132 @@
+"""
+Connection pools shared between clients.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Union
+
+import httpx
+from integrates.core.tls import client_kwargs
+
+
+class ConnectionPool:
+    """
+    Underlying httpx client shared by several Integrates clients.
+
+    Clients attached to the same pool reuse its connections while keeping
+    their own base URL, auth, middlewares and timeout. The pool's transport
+    settings (TLS verification, limits, proxies, HTTP/2) apply to all of them,
+    and so does its cookie jar. Synchronous and asynchronous clients get
+    separate httpx clients from the pool; each is created on first use and
+    closed when the last client of its kind attached to the pool is closed.
+    """
+
+    def __init__(
+        self,
+        timeout: Union[float, httpx.Timeout] = 10.0,
+        verify: bool = True,
+        name: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Initialize a ConnectionPool.
+
+        Args:
+            timeout: Default timeout (clients send their own with every request)
+            verify: Verify SSL certificates
+            name: Registry name, set for pools created by `shared_pool`
+            **kwargs: Additional keyword arguments for the httpx clients
+                (limits, http2, proxy, ...)
+        """
+        self.timeout = timeout
+        self.verify = verify
+        self.name = name
+        self.kwargs = kwargs
+        self._clients: Dict[type, Any] = {}
+        self._refs: Dict[type, int] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        refs = sum(self._refs.values())
+        return f"<ConnectionPool {self.name or hex(id(self))} clients={refs}>"
+
+    def attach(self, http_class: type) -> None:
+        """
+        Register a client using the pool.
+
+        Args:
+            http_class: ``httpx.Client`` or ``httpx.AsyncClient``
+        """
+        with self._lock:
+            self._refs[http_class] = self._refs.get(http_class, 0) + 1
+
+    def get(self, http_class: type) -> Any:
+        """
+        Return the shared httpx client of a kind, creating it on first use.
+
+        Args:
+            http_class: ``httpx.Client`` or ``httpx.AsyncClient``
+
+        Returns:
+            Shared httpx client
+        """
+        with self._lock:
+            http = self._clients.get(http_class)
+            if http is None:
+                http = self._clients[http_class] = http_class(
+                    **client_kwargs(self.timeout, self.verify, self.kwargs)
+                )
+            return http
+
+    def release(self, http_class: type) -> Optional[Any]:
+        """
+        Unregister a client; the caller closes the returned httpx client, if any.
+
+        Args:
+            http_class: ``httpx.Client`` or ``httpx.AsyncClient``
+
+        Returns:
+            The shared httpx client if the last client of its kind was released
+        """
+        with self._lock:
+            refs = self._refs.get(http_class, 0) - 1
+            if refs > 0:
+                self._refs[http_class] = refs
+                return None
+            self._refs.pop(http_class, None)
+            http = self._clients.pop(http_class, None)
+            unused = not self._refs
+        if unused and self.name is not None:
+            _unregister(self)
+        return http
+
+
+_registry: Dict[str, ConnectionPool] = {}
+_registry_lock = threading.Lock()
+
+
+def shared_pool(name: str = "default", **settings) -> ConnectionPool:
+    """
+    Return the process-wide pool registered under a name.
+
+    The pool is created with ``settings`` on first use and dropped from the
+    registry once every client attached to it has been closed.
+
+    Args:
+        name: Registry name, e.g. the gateway the clients talk to
+        **settings: Arguments for `ConnectionPool` when the pool is created
+
+    Returns:
+        Shared ConnectionPool
+    """
+    with _registry_lock:
+        pool = _registry.get(name)
+        if pool is None:
+            pool = _registry[name] = ConnectionPool(name=name, **settings)
+        return pool
+
+
+def _unregister(pool: ConnectionPool) -> None:
+    with _registry_lock:
+        if _registry.get(pool.name) is pool and not pool._refs:
+            del _registry[pool.name]
@@ -0,0 +1,229 @@
+"""
+Prepared requests for sending the same call repeatedly.
+"""
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from integrates.core.response import Response
+
+if TYPE_CHECKING:
+    from integrates.core.client import AsyncClient, BaseClient, Client
+
+
+class BasePreparedRequest:
+    """
+    Immutable request template bound to a client.
+
+    The URL is resolved, headers are merged and, for auth methods with static
+    signatures, the request is signed once when it is prepared. Sending only
+    adds the per-call params and body, runs the client's middlewares and hands
+    the request to the transport.
+    """
+
+    __slots__ = ("_client", "_kwargs", "_sign_per_call")
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """
+        Initialize a prepared request.
+
+        Args:
+            client: Client that sends the request
+            method: HTTP method (GET, POST, etc.)
+            url: URL to request (will be joined with base_url)
+            params: Query parameters sent with every call
+            headers: HTTP headers
+            cookies: Cookies to send
+            path_params: Values for ``{name}`` placeholders in the URL
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+        """
+        auth = client.auth
+        sign_per_call = auth is not None and (
+            getattr(auth, "requires_body", False) or not getattr(auth, "reusable", False)
+        )
+        if sign_per_call:
+            # Only resolve the URL now; signing happens on every send
+            request_url = (
+                client._url_resolver.expand(url, path_params)
+                if path_params
+                else client._url_resolver.resolve(url)
+            )
+            request_kwargs = {
+                "method": method,
+                "url": request_url,
+                "params": params,
+                "headers": dict(headers or {}),
+                "cookies": cookies,
+                **kwargs,
+            }
+        else:
+            request_kwargs = client._build_request_kwargs(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                cookies=cookies,
+                path_params=path_params,
+                **kwargs,
+            )
+            for key in ("data", "json", "files"):
+                request_kwargs.pop(key)
+
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_kwargs", request_kwargs)
+        object.__setattr__(self, "_sign_per_call", sign_per_call)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.method} {self.url}>"
+
+    @property
+    def method(self) -> str:
+        """Return the HTTP method."""
+        return self._kwargs["method"]
+
+    @property
+    def url(self) -> str:
+        """Return the resolved URL."""
+        return self._kwargs["url"]
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Return a read-only view of the prepared headers."""
+        return MappingProxyType(self._kwargs["headers"])
+
+    def _request_kwargs(
+        self,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Any],
+        json: Optional[Any],
+        content: Optional[Any],
+        files: Optional[Dict[str, Any]],
+        stream: bool,
+        sign: bool = True,
+    ) -> Dict[str, Any]:
+        base_params = self._kwargs["params"]
+        if params and base_params:
+            params = {**base_params, **params}
+        elif not params:
+            params = base_params
+
+        if self._sign_per_call:
+            kwargs = dict(self._kwargs)
+            if content is not None:
+                kwargs["content"] = content
+            request_kwargs = self._client._build_request_kwargs(
+                kwargs.pop("method"),
+                kwargs.pop("url"),
+                params=params,
+                headers=kwargs.pop("headers"),
+                data=data,
+                json=json,
+                files=files,
+                sign=sign,
+                **{key: value for key, value in kwargs.items() if key != "params"},
+            )
+        else:
+            request_kwargs = dict(self._kwargs)
+            # Middlewares may modify headers in place; keep the template intact
+            request_kwargs["headers"] = dict(request_kwargs["headers"])
+            request_kwargs["params"] = params
+            request_kwargs["data"] = data
+            request_kwargs["json"] = json
+            request_kwargs["files"] = files
+            if content is not None:
+                request_kwargs["content"] = content
+        if stream:
+            request_kwargs["stream"] = True
+        return request_kwargs
+
+
+class PreparedRequest(BasePreparedRequest):
+    """Prepared request for a synchronous Client."""
+
+    __slots__ = ()
+
+    _client: "Client"
+
+    def send(
+        self,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        content: Optional[Any] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send the prepared request.
+
+        Args:
+            params: Query parameters for this call (merged over the prepared ones)
+            data: Form data or raw request body
+            json: JSON data to send
+            content: Raw request content
+            files: Files to upload
+            stream: Leave the body unread so it can be consumed incrementally
+
+        Returns:
+            Response object
+        """
+        request_kwargs = self._request_kwargs(params, data, json, content, files, stream)
+        for middleware in self._client.middlewares:
+            request_kwargs = middleware.pre_request(request_kwargs)
+        return self._client._send(self._client._sign_body(request_kwargs))
+
+
+class AsyncPreparedRequest(BasePreparedRequest):
+    """Prepared request for an AsyncClient."""
+
+    __slots__ = ()
+
+    _client: "AsyncClient"
+
+    async def send(
+        self,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        content: Optional[Any] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send the prepared request asynchronously.
+
+        Args:
+            params: Query parameters for this call (merged over the prepared ones)
+            data: Form data or raw request body
+            json: JSON data to send
+            content: Raw request content
+            files: Files to upload
+            stream: Leave the body unread so it can be consumed incrementally
+
+        Returns:
+            Response object
+        """
+        request_kwargs = self._request_kwargs(
+            params, data, json, content, files, stream, sign=False
+        )
+        if self._sign_per_call:
+            request_kwargs = await self._client._asign(request_kwargs)
+        for middleware in self._client.middlewares:
+            request_kwargs = await middleware.apre_request(request_kwargs)
+        return await self._client._send(await self._client._asign(request_kwargs, body=True))
@@ -2,7 +2,7 @@
 Response class for handling HTTP responses.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
 
 import httpx
 
@@ -14,11 +14,12 @@ class Response:
         self,
         status_code: int,
         headers: Dict[str, str],
-        content: bytes,
+        content: Optional[bytes],
         url: str,
         request_info: Optional[Dict[str, Any]] = None,
         encoding: Optional[str] = None,
         elapsed: Optional[float] = None,
+        stream: Optional[httpx.Response] = None,
     ):
         """
         Initialize a Response object.
@@ -26,11 +27,12 @@ class Response:
         Args:
             status_code: HTTP status code
             headers: Response headers
-            content: Response body
+            content: Response body (None for a streamed response that has not been read)
             url: Response URL
             request_info: Information about the request
             encoding: Response encoding
             elapsed: Time elapsed since request was sent
+            stream: Open streaming httpx response the body is read from
         """
         self.status_code = status_code
         self.headers = headers
@@ -39,22 +41,170 @@ class Response:
         self.request_info = request_info or {}
         self.encoding = encoding
         self.elapsed = elapsed
+        self._stream = stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     @property
     def ok(self) -> bool:
         """Return True if status_code is less than 400."""
         return self.status_code < 400
 
+    @property
+    def is_stream_consumed(self) -> bool:
+        """Return True if the body has been read or there is no stream."""
+        return self._content is not None
+
+    @property
+    def _unread_async(self) -> bool:
+        # Bodies streamed by AsyncClient can only be read with aread()
+        return (
+            self._content is None
+            and self._stream is not None
+            and not isinstance(self._stream.stream, httpx.SyncByteStream)
+        )
+
     @property
     def content(self) -> bytes:
-        """Return the response content as bytes."""
+        """
+        Return the response content as bytes, reading a streamed body if needed.
+
+        Raises:
+            RuntimeError: If the body is streamed by an asynchronous client and has
+                not been read with `aread`
+        """
+        if self._unread_async:
+            raise RuntimeError(
+                "The body of a streamed asynchronous response must be read first: "
+                "call `await response.aread()`"
+            )
+        if self._content is None:
+            self._content = self._stream.read()
+            self.close()
         return self._content
 
+    async def aread(self) -> bytes:
+        """Read a streamed body asynchronously and return it."""
+        if self._content is None:
+            self._content = await self._stream.aread()
+            await self.aclose()
+        return self._content
+
+    def close(self) -> None:
+        """Release the connection held by a streamed response."""
+        if self._stream is not None:
+            self._stream.close()
+
+    async def aclose(self) -> None:
+        """Release the connection held by a streamed response asynchronously."""
+        if self._stream is not None:
+            await self._stream.aclose()
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the (decompressed) body in chunks without buffering it.
+
+        Args:
+            chunk_size: Size of the chunks to yield (defaults to network chunk sizes)
+
+        Returns:
+            Iterator over byte chunks
+        """
+        if self._content is not None:
+            size = chunk_size or max(len(self._content), 1)
+            for start in range(0, len(self._content), size):
+                yield self._content[start : start + size]
+            return
+        try:
+            yield from self._stream.iter_bytes(chunk_size)
+        finally:
+            self.close()
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Iterate asynchronously over the (decompressed) body in chunks.
+
+        Args:
+            chunk_size: Size of the chunks to yield (defaults to network chunk sizes)
+
+        Returns:
+            Asynchronous iterator over byte chunks
+        """
+        if self._content is not None:
+            for chunk in self.iter_bytes(chunk_size):
+                yield chunk
+            return
+        try:
+            async for chunk in self._stream.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await self.aclose()
+
+    def iter_records(
+        self, format: str = "ndjson", chunk_size: Optional[int] = None, **options
+    ) -> Iterator[Any]:
+        """
+        Parse records incrementally from the body.
+
+        Only the current chunk and any record split across chunk boundaries are
+        held in memory, so a streamed response (``stream=True``) of any size can
+        be consumed in bounded memory.
+
+        Args:
+            format: ``"ndjson"`` (or ``"jsonl"``), ``"csv"`` or ``"json"``
+            chunk_size: Size of the chunks read from the body
+            **options: Decoder options (``header`` and `csv.reader` formatting
+                parameters for CSV, ``path`` for JSON)
+
+        Returns:
+            Iterator over records (parsed JSON values, CSV dicts or CSV rows)
+        """
+        from integrates.utils.records import get_record_decoder
+
+        decoder = get_record_decoder(format, self.encoding, **options)
+        for chunk in self.iter_bytes(chunk_size):
+            yield from decoder.feed(chunk)
+        yield from decoder.close()
+
+    async def aiter_records(
+        self, format: str = "ndjson", chunk_size: Optional[int] = None, **options
+    ) -> AsyncIterator[Any]:
+        """
+        Parse records incrementally from the body asynchronously.
+
+        Args:
+            format: ``"ndjson"`` (or ``"jsonl"``), ``"csv"`` or ``"json"``
+            chunk_size: Size of the chunks read from the body
+            **options: Decoder options (``header`` and `csv.reader` formatting
+                parameters for CSV, ``path`` for JSON)
+
+        Returns:
+            Asynchronous iterator over records
+        """
+        from integrates.utils.records import get_record_decoder
+
+        decoder = get_record_decoder(format, self.encoding, **options)
+        async for chunk in self.aiter_bytes(chunk_size):
+            for record in decoder.feed(chunk):
+                yield record
+        for record in decoder.close():
+            yield record
+
     def text(self) -> str:
         """Return the response content as a string."""
         if self.encoding:
-            return self._content.decode(self.encoding)
-        return self._content.decode("utf-8")
+            return self.content.decode(self.encoding)
+        return self.content.decode("utf-8")
 
     def json(self) -> Any:
         """Return the response content as a JSON object."""
@@ -62,13 +212,46 @@ class Response:
 
         return json.loads(self.text())
 
+    def iter_items(self, path: str = "item", chunk_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Yield the values at a path inside a single large JSON body as they are parsed.
+
+        The path uses dotted keys with ``item`` for array elements, e.g.
+        ``data.item`` for each element of ``{"data": [...]}``. With a streamed
+        response (``stream=True``), peak memory is about one element.
+
+        Args:
+            path: Dotted path of the values to yield
+            chunk_size: Size of the chunks read from the body
+
+        Returns:
+            Iterator over values
+        """
+        return self.iter_records("json", chunk_size, path=path)
+
+    def aiter_items(
+        self, path: str = "item", chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the values at a path inside a single large JSON body asynchronously.
+
+        Args:
+            path: Dotted path of the values to yield
+            chunk_size: Size of the chunks read from the body
+
+        Returns:
+            Asynchronous iterator over values
+        """
+        return self.aiter_records("json", chunk_size, path=path)
+
     @classmethod
-    def from_httpx(cls, response: httpx.Response) -> "Response":
+    def from_httpx(cls, response: httpx.Response, stream: bool = False) -> "Response":
         """
         Create a Response object from an httpx.Response.
 
         Args:
             response: httpx.Response object
+            stream: Leave the body unread so it can be consumed incrementally
 
         Returns:
             Response object
@@ -79,6 +262,17 @@ class Response:
             "headers": dict(response.request.headers),
         }
 
+        if stream:
+            return cls(
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                content=None,
+                url=str(response.url),
+                request_info=request_info,
+                encoding=response.encoding,
+                stream=response,
+            )
+
         # Ensure the response is read before accessing elapsed time
         content = response.content
         elapsed = None
@@ -108,4 +302,6 @@ class Response:
         from integrates.core.exceptions import HTTPError
 
         if not self.ok:
-            raise HTTPError(f"HTTP Error {self.status_code}: {self.text()}", response=self)
+            # The body of an unread asynchronous stream is left for the caller to read
+            detail = "" if self._unread_async else f": {self.text()}"
+            raise HTTPError(f"HTTP Error {self.status_code}{detail}", response=self)
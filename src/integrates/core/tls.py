@@ -0,0 +1,94 @@
+"""
+Process-wide cache of SSL contexts shared by all clients.
+"""
+
+import os
+import ssl
+import threading
+from typing import Any, Dict, Hashable, Optional, Union
+
+import httpx
+
+_contexts: Dict[Hashable, ssl.SSLContext] = {}
+_lock = threading.Lock()
+
+
+def get_ssl_context(
+    verify: Union[ssl.SSLContext, str, bool] = True,
+    cert: Optional[Any] = None,
+    trust_env: bool = True,
+    http2: bool = False,
+) -> ssl.SSLContext:
+    """
+    Return the shared SSL context for a set of TLS settings.
+
+    Building a context loads the CA bundle, which takes several milliseconds.
+    Contexts are safe to share between clients and threads once configured,
+    so each distinct combination of settings is built once per process.
+    httpcore sets a context's ALPN protocols on every connection, with ``h2``
+    only for HTTP/2 clients, so HTTP/1.1 and HTTP/2 clients get separate
+    contexts. Unhashable ``cert`` values are not cached.
+
+    Args:
+        verify: Verify certificates, a CA bundle path, or a ready-made context
+            (returned unchanged)
+        cert: Client certificate, as accepted by httpx
+        trust_env: Honour ``SSL_CERT_FILE`` and ``SSL_CERT_DIR``
+        http2: The context is for a client with HTTP/2 enabled
+
+    Returns:
+        SSL context
+    """
+    if isinstance(verify, ssl.SSLContext):
+        return verify
+
+    key = (
+        verify,
+        tuple(cert) if isinstance(cert, list) else cert,
+        trust_env,
+        # The CA bundle read from the environment is part of the settings
+        (os.environ.get("SSL_CERT_FILE"), os.environ.get("SSL_CERT_DIR")) if trust_env else None,
+        http2,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+    context = _contexts.get(key)
+    if context is None:
+        with _lock:
+            context = _contexts.get(key)
+            if context is None:
+                context = httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+                _contexts[key] = context
+    return context
+
+
+def clear_ssl_contexts() -> None:
+    """Drop the cached contexts, e.g. after a CA bundle or client certificate was rotated."""
+    with _lock:
+        _contexts.clear()
+
+
+def client_kwargs(timeout: Any, verify: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the arguments for an httpx client, using a shared SSL context.
+
+    Args:
+        timeout: Client timeout
+        verify: TLS verification setting
+        kwargs: Other httpx client arguments
+
+    Returns:
+        Keyword arguments for ``httpx.Client`` or ``httpx.AsyncClient``
+    """
+    kwargs = dict(kwargs)
+    if kwargs.get("transport") is None:
+        # Custom transports bring their own TLS setup
+        verify = get_ssl_context(
+            verify,
+            kwargs.pop("cert", None),
+            kwargs.get("trust_env", True),
+            kwargs.get("http2", False),
+        )
+    return {"timeout": timeout, "verify": verify, **kwargs}
@@ -0,0 +1,134 @@
+"""
+Connection warm-up for client connection pools.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger("integrates")
+
+
+def warm(http: httpx.Client, urls: List[str], connections: int, method: str) -> Dict[str, int]:
+    """
+    Open pooled connections to each URL's origin.
+
+    One request per connection is opened concurrently and held until all of
+    them have answered, so each one needs its own connection; finishing them
+    afterwards leaves the connections idle in the pool.
+
+    Args:
+        http: Underlying httpx client
+        urls: URLs to send the warm-up requests to
+        connections: Connections to open per URL
+        method: HTTP method of the warm-up requests (should not return a body)
+
+    Returns:
+        Number of connections warmed per URL
+    """
+    jobs = [url for url in urls for _ in range(connections)]
+
+    def open_stream(url: str) -> Optional[httpx.Response]:
+        try:
+            return http.send(http.build_request(method, url), stream=True)
+        except httpx.HTTPError:
+            # Warm-up is best effort; the first real request will report the error
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        responses = list(pool.map(open_stream, jobs))
+
+    warmed = dict.fromkeys(urls, 0)
+    for url, response in zip(jobs, responses):
+        if response is None:
+            continue
+        try:
+            # Reading the (empty) body is what lets the connection return to the pool
+            response.read()
+            warmed[url] += 1
+        except httpx.HTTPError:
+            pass
+        finally:
+            response.close()
+    return warmed
+
+
+async def awarm(
+    http: httpx.AsyncClient, urls: List[str], connections: int, method: str
+) -> Dict[str, int]:
+    """
+    Open pooled connections to each URL's origin asynchronously.
+
+    See `warm` for the arguments.
+    """
+    jobs = [url for url in urls for _ in range(connections)]
+
+    async def open_stream(url: str) -> Optional[httpx.Response]:
+        try:
+            return await http.send(http.build_request(method, url), stream=True)
+        except httpx.HTTPError:
+            return None
+
+    responses = await asyncio.gather(*(open_stream(url) for url in jobs))
+
+    warmed = dict.fromkeys(urls, 0)
+    for url, response in zip(jobs, responses):
+        if response is None:
+            continue
+        try:
+            await response.aread()
+            warmed[url] += 1
+        except httpx.HTTPError:
+            pass
+        finally:
+            await response.aclose()
+    return warmed
+
+
+class KeepWarm(threading.Thread):
+    """Background thread that repeats a warm-up before idle connections expire."""
+
+    def __init__(self, warmup: Callable[[], Dict[str, int]], interval: float):
+        """
+        Initialize a KeepWarm thread.
+
+        Args:
+            warmup: Callable running one warm-up round
+            interval: Seconds between rounds
+        """
+        super().__init__(name="integrates-keep-warm", daemon=True)
+        self.warmup = warmup
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.warmup()
+            except Exception:
+                # A failed round must not end the thread; the next one may succeed
+                logger.exception("Keep-warm round failed")
+
+    def stop(self) -> None:
+        """Stop after the current round."""
+        self._stopped.set()
+
+
+async def keep_warm_loop(warmup: Callable, interval: float) -> None:
+    """
+    Repeat an asynchronous warm-up until cancelled.
+
+    Args:
+        warmup: Coroutine function running one warm-up round
+        interval: Seconds between rounds
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await warmup()
+        except Exception:
+            logger.exception("Keep-warm round failed")
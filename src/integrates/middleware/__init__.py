@@ -1,15 +1,35 @@
 """
 Middleware components for Integrates.
+
+Classes are imported on first access.
 """
 
-from integrates.middleware.base import Middleware
-from integrates.middleware.logging import LoggingMiddleware
-from integrates.middleware.rate_limit import RateLimiterMiddleware
-from integrates.middleware.retry import RetryMiddleware
+from typing import TYPE_CHECKING
+
+from integrates.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from integrates.middleware.base import Middleware
+    from integrates.middleware.compression import CompressionMiddleware
+    from integrates.middleware.logging import LoggingMiddleware
+    from integrates.middleware.rate_limit import RateLimiterMiddleware
+    from integrates.middleware.retry import RetryMiddleware
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Middleware": ("integrates.middleware.base", "Middleware"),
+        "RetryMiddleware": ("integrates.middleware.retry", "RetryMiddleware"),
+        "RateLimiterMiddleware": ("integrates.middleware.rate_limit", "RateLimiterMiddleware"),
+        "LoggingMiddleware": ("integrates.middleware.logging", "LoggingMiddleware"),
+        "CompressionMiddleware": ("integrates.middleware.compression", "CompressionMiddleware"),
+    },
+)
 
 __all__ = [
     "Middleware",
     "RetryMiddleware",
     "RateLimiterMiddleware",
     "LoggingMiddleware",
+    "CompressionMiddleware",
 ]
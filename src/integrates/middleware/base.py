@@ -22,6 +22,20 @@ class Middleware:
         """
         return request_kwargs
 
+    async def apre_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Modify request parameters before sending from an AsyncClient.
+
+        Defaults to `pre_request`; override it for work that would block the event loop.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Modified request parameters
+        """
+        return self.pre_request(request_kwargs)
+
     def post_request(self, response: Response) -> Response:
         """
         Process response after receiving.
@@ -0,0 +1,206 @@
+"""
+Request body compression middleware.
+"""
+
+import asyncio
+import json
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from integrates.core.response import Response
+from integrates.middleware.base import Middleware
+
+# zlib window bits selecting the container format of each Content-Encoding
+_WBITS = {"gzip": 31, "deflate": 15}
+# Same compact form httpx uses for ``json=`` bodies
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+# Characters of serialised JSON collected before each write to the compressor
+_BATCH_SIZE = 64 * 1024
+
+
+class CompressionMiddleware(Middleware):
+    """
+    Middleware that compresses request bodies above a size threshold.
+
+    JSON bodies are serialised incrementally and fed straight into the
+    compressor, so the uncompressed document is never built as one string.
+    When a server answers an encoded body with 415 Unsupported Media Type,
+    its host is remembered and later requests to it use an encoding listed in
+    the response's Accept-Encoding header, or no encoding at all.
+
+    Auth methods that sign the body (HMACAuth) sign it after the pre-request
+    middlewares, so the signature covers the compressed body.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 1024,
+        encoding: str = "gzip",
+        level: int = 6,
+        offload: bool = True,
+    ):
+        """
+        Initialize CompressionMiddleware.
+
+        Args:
+            threshold: Minimum body size in bytes to compress
+            encoding: Content-Encoding to use (``"gzip"`` or ``"deflate"``)
+            level: Compression level (1-9)
+            offload: Compress in a worker thread when used with an AsyncClient
+
+        Raises:
+            ValueError: If the encoding is not supported
+        """
+        if encoding not in _WBITS:
+            raise ValueError(f"Unsupported encoding {encoding!r}; expected 'gzip' or 'deflate'")
+        self.threshold = threshold
+        self.encoding = encoding
+        self.level = level
+        self.offload = offload
+        # Hosts that rejected an encoding, mapped to the encoding to use instead
+        self.host_encodings: Dict[str, Optional[str]] = {}
+
+    def encoding_for(self, url: str) -> Optional[str]:
+        """
+        Return the encoding used for requests to a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Content-Encoding, or None if the host does not accept encoded bodies
+        """
+        return self.host_encodings.get(urlsplit(url).netloc, self.encoding)
+
+    def _compressor(self, encoding: str) -> Any:
+        return zlib.compressobj(self.level, zlib.DEFLATED, _WBITS[encoding])
+
+    def _encode_json(self, value: Any, encoding: str) -> Tuple[bytes, bool]:
+        """Serialise JSON and, once it passes the threshold, compress it in the same pass."""
+        compressor = None
+        parts: List[bytes] = []
+        size = 0
+        batch: List[str] = []
+        batch_size = 0
+
+        def write(data: bytes) -> None:
+            nonlocal compressor, size
+            size += len(data)
+            if compressor is None and size >= self.threshold:
+                compressor = self._compressor(encoding)
+                parts[:] = [compressor.compress(part) for part in parts]
+            parts.append(compressor.compress(data) if compressor else data)
+
+        for piece in _json_encoder.iterencode(value):
+            batch.append(piece)
+            batch_size += len(piece)
+            if batch_size >= _BATCH_SIZE:
+                write("".join(batch).encode("utf-8"))
+                batch = []
+                batch_size = 0
+        if batch:
+            write("".join(batch).encode("utf-8"))
+
+        if compressor is None:
+            return b"".join(parts), False
+        parts.append(compressor.flush())
+        return b"".join(parts), True
+
+    def _raw_body(self, request_kwargs: Dict[str, Any]) -> Optional[bytes]:
+        body = request_kwargs.get("content")
+        if body is None and isinstance(request_kwargs.get("data"), (str, bytes)):
+            body = request_kwargs["data"]
+        if isinstance(body, str):
+            return body.encode("utf-8")
+        return body if isinstance(body, bytes) else None
+
+    def _should_compress(self, request_kwargs: Dict[str, Any]) -> bool:
+        headers = request_kwargs.get("headers") or {}
+        if any(name.lower() == "content-encoding" for name in headers):
+            return False
+        if self.encoding_for(request_kwargs.get("url", "")) is None:
+            return False
+        if request_kwargs.get("json") is not None:
+            return not request_kwargs.get("data") and not request_kwargs.get("files")
+        body = self._raw_body(request_kwargs)
+        return body is not None and len(body) >= self.threshold
+
+    def pre_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compress the request body if it is large enough.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Modified request parameters
+        """
+        if not self._should_compress(request_kwargs):
+            return request_kwargs
+
+        encoding = self.encoding_for(request_kwargs.get("url", ""))
+        headers = dict(request_kwargs.get("headers") or {})
+        if request_kwargs.get("json") is not None:
+            body, compressed = self._encode_json(request_kwargs.pop("json"), encoding)
+            if not any(name.lower() == "content-type" for name in headers):
+                headers["Content-Type"] = "application/json"
+        else:
+            compressor = self._compressor(encoding)
+            body = compressor.compress(self._raw_body(request_kwargs)) + compressor.flush()
+            request_kwargs.pop("data", None)
+            compressed = True
+
+        if compressed:
+            headers["Content-Encoding"] = encoding
+        # A length set for the original body no longer applies; httpx sets the new one
+        for name in [name for name in headers if name.lower() == "content-length"]:
+            del headers[name]
+        request_kwargs["headers"] = headers
+        request_kwargs["content"] = body
+        return request_kwargs
+
+    async def apre_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compress the request body, in a worker thread if offloading is enabled.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Modified request parameters
+        """
+        if self.offload and self._should_compress(request_kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.pre_request, request_kwargs)
+        return self.pre_request(request_kwargs)
+
+    def post_request(self, response: Response) -> Response:
+        """
+        Learn from servers that reject encoded request bodies.
+
+        Args:
+            response: Response object
+
+        Returns:
+            Unmodified response
+        """
+        if response.status_code != 415:
+            return response
+
+        request_headers = {
+            name.lower(): value for name, value in response.request_info.get("headers", {}).items()
+        }
+        encoding = request_headers.get("content-encoding")
+        if encoding in _WBITS:
+            accepted = [
+                token.split(";")[0].strip().lower()
+                for token in response.headers.get("accept-encoding", "").split(",")
+            ]
+            fallback = next(
+                (name for name in accepted if name in _WBITS and name != encoding), None
+            )
+            host = urlsplit(response.request_info.get("url", "")).netloc
+            self.host_encodings[host] = fallback
+
+        return response
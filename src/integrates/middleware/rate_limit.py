@@ -10,7 +10,12 @@ from integrates.middleware.base import Middleware
 
 
 class RateLimiterMiddleware(Middleware):
-    """Rate limiting middleware using token bucket algorithm."""
+    """
+    Rate limiting middleware using token bucket algorithm.
+
+    Every request costs one token. For GraphQL APIs that meter query cost
+    points instead, use ``integrates.protocols.graphql.CostLimiterMiddleware``.
+    """
 
     def __init__(self, calls: int = 10, period: float = 1.0):
         """
@@ -2,9 +2,29 @@
 GraphQL protocol adapter for Integrates.
 """
 
-from integrates.protocols.graphql.client import AsyncGraphQLClient, GraphQLClient
+from integrates.protocols.graphql.cache import NormalizedCache
+from integrates.protocols.graphql.client import (
+    AsyncGraphQLClient,
+    AsyncPreparedQuery,
+    GraphQLClient,
+    PreparedQuery,
+)
+from integrates.protocols.graphql.cost import CostEstimator, CostLimiterMiddleware
+from integrates.protocols.graphql.incremental import IncrementalResult
+from integrates.protocols.graphql.loader import DataLoader, GraphQLLoader
+from integrates.protocols.graphql.schema import Schema, SchemaStore
 
 __all__ = [
     "GraphQLClient",
     "AsyncGraphQLClient",
+    "PreparedQuery",
+    "AsyncPreparedQuery",
+    "DataLoader",
+    "GraphQLLoader",
+    "NormalizedCache",
+    "IncrementalResult",
+    "Schema",
+    "SchemaStore",
+    "CostEstimator",
+    "CostLimiterMiddleware",
 ]
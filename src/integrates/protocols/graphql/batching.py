@@ -0,0 +1,95 @@
+"""
+Batching of several GraphQL operations into one HTTP request.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+from integrates.core.response import Response
+from integrates.protocols.graphql.document import build_payload
+
+# An operation: a query string, a ``(query, variables)`` pair or a payload dict
+Operation = Union[str, Tuple[str, Dict[str, Any]], Dict[str, Any]]
+
+
+def operation_payload(operation: Operation, minify: bool = True) -> Dict[str, Any]:
+    """
+    Build the request payload of one operation in a batch.
+
+    Args:
+        operation: Query string, ``(query, variables)`` pair, or a dict with
+            ``query`` and optionally ``variables`` and ``operationName``
+        minify: Send the query minified (see `build_payload`)
+
+    Returns:
+        Payload dict
+
+    Raises:
+        ValueError: If the operation has no query
+    """
+    if isinstance(operation, str):
+        return build_payload(operation, minify=minify)
+    if isinstance(operation, tuple):
+        query, variables = operation
+        return build_payload(query, variables, minify=minify)
+    if "query" not in operation:
+        raise ValueError("A batched operation needs a 'query'")
+    operation_name = operation.get("operationName", operation.get("operation_name"))
+    return build_payload(operation["query"], operation.get("variables"), operation_name, minify)
+
+
+def chunks(payloads: Sequence[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Split payloads into batches of at most ``size`` operations.
+
+    Args:
+        payloads: Operation payloads
+        size: Maximum number of operations per request
+
+    Returns:
+        Iterator over lists of payloads
+
+    Raises:
+        ValueError: If size is less than 1
+    """
+    if size < 1:
+        raise ValueError("batch_size must be at least 1")
+    for start in range(0, len(payloads), size):
+        yield list(payloads[start : start + size])
+
+
+def split_results(response: Response, count: int) -> List[Response]:
+    """
+    Split the response to a batched request into one Response per operation.
+
+    A server answers a batch with a JSON array holding one result per
+    operation, in order. Any other answer (an HTTP error, or a single error
+    object from a server that does not support batching) is returned for
+    every operation of the batch.
+
+    Args:
+        response: Response to the batched request
+        count: Number of operations in the batch
+
+    Returns:
+        Responses in the order of the operations
+    """
+    try:
+        results = response.json() if response.ok else None
+    except ValueError:
+        results = None
+    if not isinstance(results, list) or len(results) != count:
+        return [response] * count
+
+    return [
+        Response(
+            status_code=response.status_code,
+            headers={"content-type": "application/json"},
+            content=json.dumps(result).encode("utf-8"),
+            url=response.url,
+            request_info=response.request_info,
+            encoding="utf-8",
+            elapsed=response.elapsed,
+        )
+        for result in results
+    ]
@@ -0,0 +1,327 @@
+"""
+Normalized cache of GraphQL results.
+
+Results are split into entities identified by ``__typename`` and ``id``, so
+an entity fetched by one query is shared by every query that selects it and
+updated by every result (including mutation results) that contains it.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from integrates.core.response import Response
+from integrates.protocols.graphql.document import Document, Field
+
+CACHE_FIRST = "cache-first"
+NETWORK_ONLY = "network-only"
+CACHE_AND_NETWORK = "cache-and-network"
+FETCH_POLICIES = (CACHE_FIRST, NETWORK_ONLY, CACHE_AND_NETWORK)
+
+ROOT_QUERY = "ROOT_QUERY"
+# Record entry remembering which fragment type conditions apply to an object
+_CONDITIONS = "__conditions"
+
+
+class _Miss(Exception):
+    """A selected field is not in the cache."""
+
+
+def check_fetch_policy(fetch_policy: str) -> str:
+    """
+    Validate a fetch policy.
+
+    Args:
+        fetch_policy: ``"cache-first"``, ``"network-only"`` or ``"cache-and-network"``
+
+    Returns:
+        The fetch policy
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    if fetch_policy not in FETCH_POLICIES:
+        raise ValueError(f"Unknown fetch policy {fetch_policy!r}; expected one of {FETCH_POLICIES}")
+    return fetch_policy
+
+
+class NormalizedCache:
+    """
+    Entity store answering queries whose every selected field is cached.
+
+    Each entity is a record of its fields, keyed by field name and arguments;
+    objects without an identity are embedded in their parent's record, and
+    root query fields are kept in the ``ROOT_QUERY`` record. Writes merge into
+    existing records, so partial results from different queries add up.
+    Records are evicted least recently used first once there are more than
+    ``max_entities``; a query reaching an evicted entity is a cache miss.
+
+    The cache is thread-safe and can be shared between clients of the same
+    endpoint.
+    """
+
+    def __init__(self, max_entities: int = 10_000):
+        """
+        Initialize a NormalizedCache.
+
+        Args:
+            max_entities: Maximum number of records kept
+        """
+        self.max_entities = max_entities
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    @staticmethod
+    def identify(value: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the cache key of an object, e.g. ``"User:42"``.
+
+        Args:
+            value: Result object
+
+        Returns:
+            Key, or None if the object lacks ``__typename`` or ``id``
+        """
+        typename = value.get("__typename")
+        identifier = value.get("id")
+        if typename is None or identifier is None:
+            return None
+        return f"{typename}:{identifier}"
+
+    def entity(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a stored record.
+
+        Args:
+            key: Record key, e.g. ``"User:42"`` or ``ROOT_QUERY``
+
+        Returns:
+            Record with references to other entities as ``{"__ref": key}``
+        """
+        with self._lock:
+            record = self._records.get(key)
+            return json.loads(json.dumps(record)) if record is not None else None
+
+    def evict(self, key: str) -> None:
+        """
+        Remove a record.
+
+        Args:
+            key: Record key
+        """
+        with self._lock:
+            self._records.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock:
+            self._records.clear()
+
+    def read(
+        self,
+        document: Document,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer a query from the cache.
+
+        Args:
+            document: Parsed query document
+            operation_name: Operation to read
+            variables: Variables of the operation
+
+        Returns:
+            The query's ``data``, or None unless every selected field is cached
+        """
+        with self._lock:
+            root = self._records.get(ROOT_QUERY)
+            if root is None:
+                return None
+            self._records.move_to_end(ROOT_QUERY)
+            try:
+                return self._read(root, document.selections(operation_name), variables or {})
+            except _Miss:
+                return None
+
+    def write(
+        self,
+        document: Document,
+        data: Dict[str, Any],
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store the result of an operation.
+
+        Root fields of queries are kept for later reads; for mutations and
+        subscriptions only the entities in the result are updated.
+
+        Args:
+            document: Parsed document of the operation
+            data: The result's ``data``
+            operation_name: Operation that produced the result
+            variables: Variables of the operation
+        """
+        operation = document.operation(operation_name)
+        selections = document.selections(operation_name)
+        with self._lock:
+            if operation.kind == "query":
+                root = self._records.get(ROOT_QUERY, {})
+                self._write(root, data, selections, variables or {})
+                self._store(ROOT_QUERY, root)
+            else:
+                self._write({}, data, selections, variables or {})
+
+    def write_response(
+        self,
+        document: Document,
+        response: Response,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store a successful, error-free response; other responses are ignored.
+
+        Args:
+            document: Parsed document of the operation
+            response: Response to the operation
+            operation_name: Operation that produced the response
+            variables: Variables of the operation
+        """
+        if not response.ok:
+            return
+        try:
+            result = response.json()
+        except ValueError:
+            return
+        if isinstance(result, dict) and result.get("data") and not result.get("errors"):
+            self.write(document, result["data"], operation_name, variables)
+
+    def _store(self, key: str, record: Dict[str, Any]) -> None:
+        self._records[key] = record
+        self._records.move_to_end(key)
+        while len(self._records) > self.max_entities:
+            self._records.popitem(last=False)
+
+    def _fields(
+        self, selections: List[Any], record: Dict[str, Any], data: Optional[Dict[str, Any]]
+    ) -> Iterator[Field]:
+        """Yield the fields that apply to an object, following its fragments."""
+        typename = (data or record).get("__typename")
+        for selection in selections:
+            if isinstance(selection, Field):
+                yield selection
+                continue
+            condition = selection.type_condition
+            if condition is None or condition == typename:
+                yield from self._fields(selection.selections, record, data)
+                continue
+            conditions = record.setdefault(_CONDITIONS, {}) if data is not None else None
+            if data is not None:
+                # Without a schema, whether an interface or union applies is
+                # learnt from whether the server returned the fragment's fields
+                applies = any(
+                    isinstance(s, Field) and s.response_key in data for s in selection.selections
+                )
+                conditions[condition] = applies or conditions.get(condition, False)
+            else:
+                applies = record.get(_CONDITIONS, {}).get(condition)
+                if applies is None:
+                    raise _Miss()
+            if applies:
+                yield from self._fields(selection.selections, record, data)
+
+    def _write(
+        self,
+        record: Dict[str, Any],
+        data: Dict[str, Any],
+        selections: List[Any],
+        variables: Dict[str, Any],
+    ) -> None:
+        for field in self._fields(selections, record, data):
+            if field.response_key not in data:
+                continue
+            key = _storage_key(field, variables)
+            record[key] = self._normalize(
+                data[field.response_key], field, variables, record.get(key)
+            )
+
+    def _normalize(self, value: Any, field: Field, variables: Dict[str, Any], existing: Any) -> Any:
+        if value is None or field.selections is None:
+            return value
+        if isinstance(value, list):
+            return [self._normalize(item, field, variables, None) for item in value]
+        key = self.identify(value)
+        if key is not None:
+            record = self._records.get(key, {})
+            self._write(record, value, field.selections, variables)
+            self._store(key, record)
+            return {"__ref": key}
+        # Objects without identity are embedded in the parent record
+        record = dict(existing) if isinstance(existing, dict) and "__ref" not in existing else {}
+        self._write(record, value, field.selections, variables)
+        return record
+
+    def _read(
+        self, record: Dict[str, Any], selections: List[Any], variables: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for field in self._fields(selections, record, None):
+            key = _storage_key(field, variables)
+            if key not in record:
+                raise _Miss()
+            result[field.response_key] = self._denormalize(record[key], field, variables)
+        return result
+
+    def _denormalize(self, value: Any, field: Field, variables: Dict[str, Any]) -> Any:
+        if value is None:
+            return None
+        if field.selections is None:
+            # Copy scalar lists and custom JSON scalars so callers cannot modify the cache
+            return json.loads(json.dumps(value)) if isinstance(value, (list, dict)) else value
+        if isinstance(value, list):
+            return [self._denormalize(item, field, variables) for item in value]
+        if "__ref" in value:
+            record = self._records.get(value["__ref"])
+            if record is None:
+                raise _Miss()
+            self._records.move_to_end(value["__ref"])
+            value = record
+        return self._read(value, field.selections, variables)
+
+
+def _storage_key(field: Field, variables: Dict[str, Any]) -> str:
+    if not field.arguments:
+        return field.name
+    arguments = json.dumps(field.argument_values(variables), sort_keys=True, separators=(",", ":"))
+    return f"{field.name}({arguments})"
+
+
+def cached_response(data: Dict[str, Any], url: str) -> Response:
+    """
+    Build the Response for a query answered from the cache.
+
+    Args:
+        data: The query's ``data``
+        url: GraphQL endpoint URL
+
+    Returns:
+        Response with status 200 and ``request_info["cache"]`` set to ``"hit"``
+    """
+    return Response(
+        status_code=200,
+        headers={"content-type": "application/json"},
+        content=json.dumps({"data": data}).encode("utf-8"),
+        url=url,
+        request_info={"method": "POST", "url": url, "cache": "hit"},
+        encoding="utf-8",
+        elapsed=0.0,
+    )
@@ -1,17 +1,132 @@
 """
 GraphQL client implementation.
-
-This is a minimal placeholder for the GraphQL client functionality.
-Future versions will include full GraphQL support with schema introspection,
-variable handling, and more advanced features.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from integrates.auth.base import Auth
 from integrates.core.client import AsyncClient, Client
+from integrates.core.prepared import AsyncPreparedRequest, PreparedRequest
 from integrates.core.response import Response
 from integrates.middleware.base import Middleware
+from integrates.protocols.graphql.batching import (
+    Operation,
+    chunks,
+    operation_payload,
+    split_results,
+)
+from integrates.protocols.graphql.cache import (
+    CACHE_AND_NETWORK,
+    CACHE_FIRST,
+    NETWORK_ONLY,
+    NormalizedCache,
+    cached_response,
+    check_fetch_policy,
+)
+from integrates.protocols.graphql.document import Document, build_payload, parse
+from integrates.protocols.graphql.incremental import ACCEPT, MultipartDecoder, multipart_boundary
+from integrates.protocols.graphql.loader import GraphQLLoader
+from integrates.protocols.graphql.lookup import alookup, lookup
+from integrates.protocols.graphql.pagination import aiter_nodes, iter_nodes
+from integrates.protocols.graphql.persisted import (
+    NOT_SUPPORTED,
+    is_query,
+    persisted_error,
+    persisted_payload,
+    query_params,
+)
+from integrates.protocols.graphql.schema import (
+    INTROSPECTION_QUERY,
+    Schema,
+    SchemaStore,
+    introspected_schema,
+    schema_changed,
+    validation_error,
+)
+
+
+class PreparedQuery:
+    """Immutable GraphQL operation prepared for repeated execution with different variables."""
+
+    __slots__ = ("_request", "_query", "_operation_name")
+
+    def __init__(self, request: PreparedRequest, query: str, operation_name: Optional[str] = None):
+        """
+        Initialize a PreparedQuery.
+
+        Args:
+            request: Prepared POST request to the GraphQL endpoint
+            query: GraphQL query string
+            operation_name: Name of the operation to execute
+        """
+        object.__setattr__(self, "_request", request)
+        object.__setattr__(self, "_query", query)
+        object.__setattr__(self, "_operation_name", operation_name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def request(self) -> PreparedRequest:
+        """Return the prepared POST request."""
+        return self._request
+
+    @property
+    def query(self) -> str:
+        """Return the GraphQL query string."""
+        return self._query
+
+    @property
+    def operation_name(self) -> Optional[str]:
+        """Return the name of the operation to execute."""
+        return self._operation_name
+
+    def _payload(self, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return build_payload(self._query, variables, self._operation_name, minify=False)
+
+    def send(self, variables: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Execute the prepared operation.
+
+        Args:
+            variables: Variables for this execution
+
+        Returns:
+            Response object
+        """
+        return self._request.send(json=self._payload(variables))
+
+
+class AsyncPreparedQuery(PreparedQuery):
+    """GraphQL operation prepared for repeated asynchronous execution."""
+
+    __slots__ = ()
+
+    _request: AsyncPreparedRequest
+
+    async def send(self, variables: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Execute the prepared operation asynchronously.
+
+        Args:
+            variables: Variables for this execution
+
+        Returns:
+            Response object
+        """
+        return await self._request.send(json=self._payload(variables))
 
 
 class GraphQLClient(Client):
@@ -24,6 +139,14 @@ class GraphQLClient(Client):
         middlewares: Optional[List[Middleware]] = None,
         timeout: Union[float, tuple] = 10.0,
         verify: bool = True,
+        persisted_queries: bool = False,
+        get_persisted: bool = False,
+        minify: bool = True,
+        cache: Optional[NormalizedCache] = None,
+        fetch_policy: str = CACHE_FIRST,
+        validate: bool = False,
+        schema_store: Optional[SchemaStore] = None,
+        schema_version_header: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -35,6 +158,22 @@ class GraphQLClient(Client):
             middlewares: List of middleware to apply to requests
             timeout: Request timeout in seconds
             verify: Verify SSL certificates
+            persisted_queries: Send queries as automatic persisted queries (APQ),
+                i.e. as the SHA-256 hash of their text
+            get_persisted: Send hashed queries (not mutations) as GET requests,
+                which HTTP caches and CDNs can serve
+            minify: Check the syntax of queries and send them minified, without
+                unused fragments and with the operation name filled in
+            cache: Normalized cache for query results; queries then request
+                ``__typename`` in nested selection sets
+            fetch_policy: Default use of the cache: ``"cache-first"``,
+                ``"network-only"`` or ``"cache-and-network"``
+            validate: Validate queries against the endpoint's schema before sending
+                them; the schema is introspected once and cached on disk
+            schema_store: Where schemas are cached (defaults to a SchemaStore in the
+                user cache directory)
+            schema_version_header: Response header carrying the schema version; a
+                changed version makes the next validation introspect again
             **kwargs: Additional keyword arguments to pass to the underlying transport
         """
         super().__init__(
@@ -45,12 +184,26 @@ class GraphQLClient(Client):
             verify=verify,
             **kwargs,
         )
+        self.persisted_queries = persisted_queries
+        self.get_persisted = get_persisted
+        self.minify = minify
+        self.cache = cache
+        self.fetch_policy = check_fetch_policy(fetch_policy)
+        self.validate = validate
+        self.schema_store = schema_store or SchemaStore()
+        self.schema_version_header = schema_version_header
+        self._schema: Optional[Schema] = None
+        # Loaded from the store, i.e. possibly older than the queries it validates
+        self._schema_from_disk = False
+        self._schema_stale = False
 
     def query(
         self,
         query: str,
         variables: Optional[Dict[str, Any]] = None,
         operation_name: Optional[str] = None,
+        stream: bool = False,
+        fetch_policy: Optional[str] = None,
     ) -> Response:
         """
         Execute a GraphQL query.
@@ -59,19 +212,285 @@ class GraphQLClient(Client):
             query: GraphQL query string
             variables: Variables for the query
             operation_name: Name of the operation to execute
+            stream: Leave the body unread so large results can be consumed
+                incrementally with ``iter_items`` (streamed queries are always
+                sent with their text and bypass the cache)
+            fetch_policy: Use of the cache for this query (defaults to the client's)
 
         Returns:
             Response object
+
+        Raises:
+            GraphQLSyntaxError: If ``minify`` is enabled and the query is malformed
+            GraphQLValidationError: If ``validate`` is enabled and the query does not
+                match the schema
+        """
+        payload = build_payload(
+            query, variables, operation_name, self.minify, self.cache is not None
+        )
+        if self.validate:
+            self._validate(query, payload.get("operationName"))
+        if self.cache is not None and not stream:
+            policy = check_fetch_policy(fetch_policy or self.fetch_policy)
+            response = self._query_cached(parse(query), payload, policy)
+        else:
+            response = self._execute(payload, stream)
+        if self.validate:
+            self._watch_schema(response)
+        return response
+
+    def schema(self, refresh: bool = False) -> Schema:
+        """
+        Return the endpoint's schema.
+
+        The schema is read from the schema store, or introspected and saved
+        there if the store has none. It is introspected again only when
+        ``refresh`` is set or a response signalled a schema change (see
+        ``schema_version_header``). Use ``Schema.field_type`` and
+        ``Schema.decode`` for typed decoding of results.
+
+        Args:
+            refresh: Introspect the schema even if it is cached
+
+        Returns:
+            Schema
+
+        Raises:
+            GraphQLError: If the server does not allow introspection
+        """
+        if self._schema is None and not refresh:
+            self._schema = self.schema_store.load(self.base_url)
+            self._schema_from_disk = self._schema is not None
+        if self._schema is None or refresh or self._schema_stale:
+            payload = build_payload(INTROSPECTION_QUERY, minify=self.minify)
+            self._set_schema(
+                introspected_schema(self._execute(payload), self.schema_version_header)
+            )
+        return self._schema
+
+    def _set_schema(self, schema: Schema) -> None:
+        self._schema = schema
+        self._schema_from_disk = False
+        self._schema_stale = False
+        try:
+            self.schema_store.save(self.base_url, schema)
+        except OSError:
+            # The schema still serves this client; the next one introspects again
+            pass
+
+    def _validate(self, query: str, operation_name: Optional[str]) -> None:
+        document = parse(query)
+        errors = self.schema().validate(document, operation_name)
+        if errors and self._schema_from_disk:
+            # The query may use fields added since the schema was cached
+            errors = self.schema(refresh=True).validate(document, operation_name)
+        if errors:
+            raise validation_error(errors)
+
+    def _watch_schema(self, response: Response) -> None:
+        if self._schema is not None and schema_changed(
+            response, self._schema, self.schema_version_header
+        ):
+            self._schema_stale = True
+
+    def _execute(self, payload: Dict[str, Any], stream: bool = False) -> Response:
+        if self.persisted_queries and not stream:
+            return self._query_persisted(payload)
+        return self.post("", json=payload, stream=stream)
+
+    def _query_cached(self, document: Document, payload: Dict[str, Any], policy: str) -> Response:
+        operation_name = payload.get("operationName")
+        if policy != NETWORK_ONLY and document.operation(operation_name).kind == "query":
+            data = self.cache.read(document, operation_name, payload["variables"])
+            if data is not None:
+                if policy == CACHE_AND_NETWORK:
+                    import threading
+
+                    threading.Thread(
+                        target=self._refresh, args=(document, payload, True), daemon=True
+                    ).start()
+                return cached_response(data, self.base_url)
+        return self._refresh(document, payload)
+
+    def _refresh(
+        self, document: Document, payload: Dict[str, Any], background: bool = False
+    ) -> Optional[Response]:
+        try:
+            response = self._execute(payload)
+        except Exception:
+            if not background:
+                raise
+            # The caller already has the cached result; the next query retries
+            return None
+        self.cache.write_response(
+            document, response, payload.get("operationName"), payload["variables"]
+        )
+        return response
+
+    def _query_persisted(self, payload: Dict[str, Any]) -> Response:
+        hashed = persisted_payload(payload)
+        if self.get_persisted and is_query(payload["query"], payload.get("operationName")):
+            response = self.get("", params=query_params(hashed))
+        else:
+            response = self.post("", json=hashed)
+
+        error = persisted_error(response)
+        if error is None:
+            return response
+        if error == NOT_SUPPORTED:
+            self.persisted_queries = False
+            return self.post("", json=payload)
+        # Register the query: send its text along with the hash
+        return self.post("", json={**hashed, "query": payload["query"]})
+
+    def query_incremental(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a query using ``@defer`` or ``@stream`` and yield payloads as they arrive.
+
+        The first payload holds the initial ``data``; later ones hold patches
+        (under ``incremental``), and the last has ``hasNext`` false. A server
+        answering with a single JSON result yields just that result. Use
+        ``IncrementalResult.apply`` to assemble the full result.
+
+        Args:
+            query: GraphQL query string
+            variables: Variables for the query
+            operation_name: Name of the operation to execute
+            headers: Additional HTTP headers
+
+        Returns:
+            Iterator over payloads
+
+        Raises:
+            HTTPError: If the server answers with an error status
+        """
+        payload = build_payload(query, variables, operation_name, self.minify)
+        headers = {"Accept": ACCEPT, **(headers or {})}
+        with self.post("", json=payload, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            boundary = multipart_boundary(response.headers.get("content-type", ""))
+            if boundary is None:
+                yield response.json()
+                return
+            decoder = MultipartDecoder(boundary)
+            for chunk in response.iter_bytes():
+                for part in decoder.feed(chunk):
+                    yield part
+                    if not part.get("hasNext", True):
+                        return
+
+    def paginate(
+        self,
+        query: str,
+        path: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        cursor_variable: str = "after",
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Iterate over the nodes of a Relay-style connection.
+
+        The query declares the cursor variable and selects the connection's
+        ``edges { node }`` (or ``nodes``) and ``pageInfo { hasNextPage endCursor }``.
+        Pages are fetched as the iterator is consumed.
+
+        Args:
+            query: GraphQL query string
+            path: Dotted path of the connection below ``data``, e.g. ``"repository.issues"``
+            variables: Variables for the query
+            operation_name: Name of the operation to execute
+            cursor_variable: Variable receiving the ``endCursor`` of the previous page
+            max_pages: Maximum number of pages to fetch
+
+        Returns:
+            Iterator over nodes
+
+        Raises:
+            GraphQLError: If a page has no connection at the path
+        """
+
+        def fetch(cursor: Optional[str]) -> Response:
+            return self.query(query, {**(variables or {}), cursor_variable: cursor}, operation_name)
+
+        return iter_nodes(fetch, path, max_pages)
+
+    def prepare_query(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> PreparedQuery:
+        """
+        Prepare a GraphQL operation that is executed repeatedly.
+
+        Args:
+            query: GraphQL query string
+            operation_name: Name of the operation to execute
+            headers: HTTP headers sent with every execution
+
+        Returns:
+            Prepared query; call its ``send(variables)`` method to execute it
+        """
+        payload = build_payload(query, None, operation_name, self.minify)
+        return PreparedQuery(
+            self.prepare("POST", "", headers=headers),
+            payload["query"],
+            payload.get("operationName"),
+        )
+
+    def batch(self, operations: Sequence[Operation], batch_size: int = 10) -> List[Response]:
+        """
+        Execute several operations with one POST per batch.
+
+        The operations are sent as a JSON array, which servers such as Apollo
+        Server and Hasura answer with an array of results. Lists longer than
+        ``batch_size`` are split into several requests.
+
+        Args:
+            operations: Query strings, ``(query, variables)`` pairs or dicts with
+                ``query``, ``variables`` and ``operationName``
+            batch_size: Maximum number of operations per request
+
+        Returns:
+            One Response per operation, in order
+        """
+        payloads = [operation_payload(operation, self.minify) for operation in operations]
+        results: List[Response] = []
+        for chunk in chunks(payloads, batch_size):
+            results.extend(split_results(self.post("", json=chunk), len(chunk)))
+        return results
+
+    def lookup(
+        self, ids: Iterable[Hashable], field: str, selection: str = "", **options
+    ) -> Dict[Any, Any]:
         """
-        payload = {
-            "query": query,
-            "variables": variables or {},
-        }
+        Look up many entities by id, in chunks of aliased queries the server accepts.
 
-        if operation_name:
-            payload["operationName"] = operation_name
+        Each query selects ``field`` once per id of its chunk, under an alias
+        (see `GraphQLLoader`); chunks are sent one after another and their
+        results merged.
 
-        return self.post("", json=payload)
+        Args:
+            ids: Ids to look up
+            field: Root query field returning one entity, e.g. ``"node"``
+            selection: Selection set of the field, e.g. ``"{ id name }"``
+            **options: Other `lookup` arguments (``argument``, ``argument_type``,
+                ``chunk_size``, ``max_cost``, ``estimator``, ``partial``)
+
+        Returns:
+            Id mapped to the entity's data
+
+        Raises:
+            GraphQLError: If the lookup of any id reported errors, unless ``partial`` is set
+        """
+        return lookup(self, ids, field, selection, **options)
 
     def mutation(
         self,
@@ -103,6 +522,14 @@ class AsyncGraphQLClient(AsyncClient):
         middlewares: Optional[List[Middleware]] = None,
         timeout: Union[float, tuple] = 10.0,
         verify: bool = True,
+        persisted_queries: bool = False,
+        get_persisted: bool = False,
+        minify: bool = True,
+        cache: Optional[NormalizedCache] = None,
+        fetch_policy: str = CACHE_FIRST,
+        validate: bool = False,
+        schema_store: Optional[SchemaStore] = None,
+        schema_version_header: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -114,6 +541,22 @@ class AsyncGraphQLClient(AsyncClient):
             middlewares: List of middleware to apply to requests
             timeout: Request timeout in seconds
             verify: Verify SSL certificates
+            persisted_queries: Send queries as automatic persisted queries (APQ),
+                i.e. as the SHA-256 hash of their text
+            get_persisted: Send hashed queries (not mutations) as GET requests,
+                which HTTP caches and CDNs can serve
+            minify: Check the syntax of queries and send them minified, without
+                unused fragments and with the operation name filled in
+            cache: Normalized cache for query results; queries then request
+                ``__typename`` in nested selection sets
+            fetch_policy: Default use of the cache: ``"cache-first"``,
+                ``"network-only"`` or ``"cache-and-network"``
+            validate: Validate queries against the endpoint's schema before sending
+                them; the schema is introspected once and cached on disk
+            schema_store: Where schemas are cached (defaults to a SchemaStore in the
+                user cache directory)
+            schema_version_header: Response header carrying the schema version; a
+                changed version makes the next validation introspect again
             **kwargs: Additional keyword arguments to pass to the underlying transport
         """
         super().__init__(
@@ -124,12 +567,28 @@ class AsyncGraphQLClient(AsyncClient):
             verify=verify,
             **kwargs,
         )
+        self.persisted_queries = persisted_queries
+        self.get_persisted = get_persisted
+        self.minify = minify
+        self.cache = cache
+        self.fetch_policy = check_fetch_policy(fetch_policy)
+        self.validate = validate
+        self.schema_store = schema_store or SchemaStore()
+        self.schema_version_header = schema_version_header
+        self._schema: Optional[Schema] = None
+        # Loaded from the store, i.e. possibly older than the queries it validates
+        self._schema_from_disk = False
+        self._schema_stale = False
+        # Background refreshes of cache-and-network queries
+        self._refreshes: Set[Any] = set()
 
     async def query(
         self,
         query: str,
         variables: Optional[Dict[str, Any]] = None,
         operation_name: Optional[str] = None,
+        stream: bool = False,
+        fetch_policy: Optional[str] = None,
     ) -> Response:
         """
         Execute a GraphQL query asynchronously.
@@ -138,19 +597,299 @@ class AsyncGraphQLClient(AsyncClient):
             query: GraphQL query string
             variables: Variables for the query
             operation_name: Name of the operation to execute
+            stream: Leave the body unread so large results can be consumed
+                incrementally with ``aiter_items`` (streamed queries are always
+                sent with their text and bypass the cache)
+            fetch_policy: Use of the cache for this query (defaults to the client's)
 
         Returns:
             Response object
+
+        Raises:
+            GraphQLSyntaxError: If ``minify`` is enabled and the query is malformed
+            GraphQLValidationError: If ``validate`` is enabled and the query does not
+                match the schema
+        """
+        payload = build_payload(
+            query, variables, operation_name, self.minify, self.cache is not None
+        )
+        if self.validate:
+            await self._validate(query, payload.get("operationName"))
+        if self.cache is not None and not stream:
+            policy = check_fetch_policy(fetch_policy or self.fetch_policy)
+            response = await self._query_cached(parse(query), payload, policy)
+        else:
+            response = await self._execute(payload, stream)
+        if self.validate:
+            self._watch_schema(response)
+        return response
+
+    async def schema(self, refresh: bool = False) -> Schema:
+        """
+        Return the endpoint's schema.
+
+        See `GraphQLClient.schema`.
+
+        Args:
+            refresh: Introspect the schema even if it is cached
+
+        Returns:
+            Schema
+
+        Raises:
+            GraphQLError: If the server does not allow introspection
+        """
+        if self._schema is None and not refresh:
+            self._schema = self.schema_store.load(self.base_url)
+            self._schema_from_disk = self._schema is not None
+        if self._schema is None or refresh or self._schema_stale:
+            payload = build_payload(INTROSPECTION_QUERY, minify=self.minify)
+            response = await self._execute(payload)
+            self._set_schema(introspected_schema(response, self.schema_version_header))
+        return self._schema
+
+    def _set_schema(self, schema: Schema) -> None:
+        self._schema = schema
+        self._schema_from_disk = False
+        self._schema_stale = False
+        try:
+            self.schema_store.save(self.base_url, schema)
+        except OSError:
+            pass
+
+    async def _validate(self, query: str, operation_name: Optional[str]) -> None:
+        document = parse(query)
+        errors = (await self.schema()).validate(document, operation_name)
+        if errors and self._schema_from_disk:
+            errors = (await self.schema(refresh=True)).validate(document, operation_name)
+        if errors:
+            raise validation_error(errors)
+
+    def _watch_schema(self, response: Response) -> None:
+        if self._schema is not None and schema_changed(
+            response, self._schema, self.schema_version_header
+        ):
+            self._schema_stale = True
+
+    async def _execute(self, payload: Dict[str, Any], stream: bool = False) -> Response:
+        if self.persisted_queries and not stream:
+            return await self._query_persisted(payload)
+        return await self.post("", json=payload, stream=stream)
+
+    async def _query_cached(
+        self, document: Document, payload: Dict[str, Any], policy: str
+    ) -> Response:
+        operation_name = payload.get("operationName")
+        if policy != NETWORK_ONLY and document.operation(operation_name).kind == "query":
+            data = self.cache.read(document, operation_name, payload["variables"])
+            if data is not None:
+                if policy == CACHE_AND_NETWORK:
+                    import asyncio
+
+                    task = asyncio.ensure_future(self._refresh(document, payload, True))
+                    self._refreshes.add(task)
+                    task.add_done_callback(self._refreshes.discard)
+                return cached_response(data, self.base_url)
+        return await self._refresh(document, payload)
+
+    async def _refresh(
+        self, document: Document, payload: Dict[str, Any], background: bool = False
+    ) -> Optional[Response]:
+        try:
+            response = await self._execute(payload)
+        except Exception:
+            if not background:
+                raise
+            return None
+        self.cache.write_response(
+            document, response, payload.get("operationName"), payload["variables"]
+        )
+        return response
+
+    async def _query_persisted(self, payload: Dict[str, Any]) -> Response:
+        hashed = persisted_payload(payload)
+        if self.get_persisted and is_query(payload["query"], payload.get("operationName")):
+            response = await self.get("", params=query_params(hashed))
+        else:
+            response = await self.post("", json=hashed)
+
+        error = persisted_error(response)
+        if error is None:
+            return response
+        if error == NOT_SUPPORTED:
+            self.persisted_queries = False
+            return await self.post("", json=payload)
+        return await self.post("", json={**hashed, "query": payload["query"]})
+
+    async def query_incremental(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        payload = {
-            "query": query,
-            "variables": variables or {},
-        }
+        Execute a query using ``@defer`` or ``@stream`` and yield payloads as they arrive.
 
-        if operation_name:
-            payload["operationName"] = operation_name
+        See `GraphQLClient.query_incremental`.
 
-        return await self.post("", json=payload)
+        Args:
+            query: GraphQL query string
+            variables: Variables for the query
+            operation_name: Name of the operation to execute
+            headers: Additional HTTP headers
+
+        Returns:
+            Asynchronous iterator over payloads
+
+        Raises:
+            HTTPError: If the server answers with an error status
+        """
+        payload = build_payload(query, variables, operation_name, self.minify)
+        headers = {"Accept": ACCEPT, **(headers or {})}
+        async with await self.post("", json=payload, headers=headers, stream=True) as response:
+            if not response.ok:
+                await response.aread()
+            response.raise_for_status()
+            boundary = multipart_boundary(response.headers.get("content-type", ""))
+            if boundary is None:
+                await response.aread()
+                yield response.json()
+                return
+            decoder = MultipartDecoder(boundary)
+            async for chunk in response.aiter_bytes():
+                for part in decoder.feed(chunk):
+                    yield part
+                    if not part.get("hasNext", True):
+                        return
+
+    def paginate(
+        self,
+        query: str,
+        path: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        cursor_variable: str = "after",
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over the nodes of a Relay-style connection.
+
+        The next page is requested as soon as a page arrives, so it is fetched
+        while the caller consumes the current one. See `GraphQLClient.paginate`.
+
+        Args:
+            query: GraphQL query string
+            path: Dotted path of the connection below ``data``, e.g. ``"repository.issues"``
+            variables: Variables for the query
+            operation_name: Name of the operation to execute
+            cursor_variable: Variable receiving the ``endCursor`` of the previous page
+            max_pages: Maximum number of pages to fetch
+
+        Returns:
+            Asynchronous iterator over nodes
+
+        Raises:
+            GraphQLError: If a page has no connection at the path
+        """
+
+        async def fetch(cursor: Optional[str]) -> Response:
+            return await self.query(
+                query, {**(variables or {}), cursor_variable: cursor}, operation_name
+            )
+
+        return aiter_nodes(fetch, path, max_pages)
+
+    def prepare_query(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncPreparedQuery:
+        """
+        Prepare a GraphQL operation that is executed repeatedly.
+
+        Args:
+            query: GraphQL query string
+            operation_name: Name of the operation to execute
+            headers: HTTP headers sent with every execution
+
+        Returns:
+            Prepared query; call its ``send(variables)`` method to execute it
+        """
+        payload = build_payload(query, None, operation_name, self.minify)
+        return AsyncPreparedQuery(
+            self.prepare("POST", "", headers=headers),
+            payload["query"],
+            payload.get("operationName"),
+        )
+
+    async def batch(self, operations: Sequence[Operation], batch_size: int = 10) -> List[Response]:
+        """
+        Execute several operations with one POST per batch asynchronously.
+
+        Batches are sent concurrently. See `GraphQLClient.batch`.
+
+        Args:
+            operations: Query strings, ``(query, variables)`` pairs or dicts with
+                ``query``, ``variables`` and ``operationName``
+            batch_size: Maximum number of operations per request
+
+        Returns:
+            One Response per operation, in order
+        """
+        import asyncio
+
+        payloads = [operation_payload(operation, self.minify) for operation in operations]
+
+        async def send(chunk: List[Dict[str, Any]]) -> List[Response]:
+            return split_results(await self.post("", json=chunk), len(chunk))
+
+        responses = await asyncio.gather(*(send(chunk) for chunk in chunks(payloads, batch_size)))
+        return [response for chunk in responses for response in chunk]
+
+    def loader(self, field: str, selection: str = "", **options) -> GraphQLLoader:
+        """
+        Create a loader that batches lookups of one root field.
+
+        ``await loader.load(key)`` calls issued in the same event-loop tick are
+        deduplicated and sent as one aliased query. The loader caches results,
+        so create one per unit of work, e.g. per incoming request.
+
+        Args:
+            field: Root query field returning one entity, e.g. ``"user"``
+            selection: Selection set of the field, e.g. ``"{ id name }"``
+            **options: Other GraphQLLoader arguments (``argument``, ``argument_type``,
+                ``max_batch_size``, ``cache``)
+
+        Returns:
+            GraphQLLoader
+        """
+        return GraphQLLoader(self, field, selection, **options)
+
+    async def lookup(
+        self, ids: Iterable[Hashable], field: str, selection: str = "", **options
+    ) -> Dict[Any, Any]:
+        """
+        Look up many entities by id, in chunks of aliased queries sent concurrently.
+
+        See `GraphQLClient.lookup`; at most ``concurrency`` queries (default 4)
+        are in flight at once.
+
+        Args:
+            ids: Ids to look up
+            field: Root query field returning one entity, e.g. ``"node"``
+            selection: Selection set of the field, e.g. ``"{ id name }"``
+            **options: Other `alookup` arguments (``argument``, ``argument_type``,
+                ``chunk_size``, ``max_cost``, ``estimator``, ``partial``, ``concurrency``)
+
+        Returns:
+            Id mapped to the entity's data
+
+        Raises:
+            GraphQLError: If the lookup of any id reported errors, unless ``partial`` is set
+        """
+        return await alookup(self, ids, field, selection, **options)
 
     async def mutation(
         self,
@@ -0,0 +1,306 @@
+"""
+Query cost estimation and cost-based throttling.
+
+APIs such as GitHub's and Shopify's meter GraphQL traffic in cost points
+rather than requests: a query's cost grows with the objects it selects,
+multiplied by the page size of the connections it traverses.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from integrates.core.exceptions import GraphQLError
+from integrates.core.response import Response
+from integrates.middleware.base import Middleware
+from integrates.protocols.graphql.document import Document, Field, parse
+from integrates.protocols.graphql.schema import Schema, named_type
+from integrates.protocols.rest.pagination import dig
+
+# Extension where Shopify-style servers report query costs
+COST_EXTENSION = "extensions.cost"
+
+
+def _is_list(ref: Dict[str, Any]) -> bool:
+    while ref is not None:
+        if ref["kind"] == "LIST":
+            return True
+        ref = ref.get("ofType")
+    return False
+
+
+class CostEstimator:
+    """
+    Estimates the cost of GraphQL operations before they are sent.
+
+    A field selecting objects costs ``object_weight`` plus the cost of its
+    selection set, multiplied by its ``first``/``last`` argument (or by
+    ``list_size`` for other list fields, which needs a schema to recognize).
+    Leaf fields cost ``scalar_weight``. ``weights`` overrides the weight of
+    fields (``"Type.field"``, or ``"field"`` for fields whose parent type is
+    not known) and of types (``"Type"``).
+    """
+
+    def __init__(
+        self,
+        schema: Optional[Schema] = None,
+        weights: Optional[Dict[str, float]] = None,
+        object_weight: float = 1,
+        scalar_weight: float = 0,
+        list_size: int = 1,
+        page_arguments: Sequence[str] = ("first", "last"),
+    ):
+        """
+        Initialize a CostEstimator.
+
+        Args:
+            schema: Schema telling field types (e.g. from ``client.schema()``)
+            weights: Weights by ``"Type.field"``, ``"field"`` or ``"Type"``
+            object_weight: Weight of fields selecting objects
+            scalar_weight: Weight of leaf fields
+            list_size: Assumed length of list fields without a page argument
+            page_arguments: Arguments giving the number of items a field returns
+        """
+        self.schema = schema
+        self.weights = weights or {}
+        self.object_weight = object_weight
+        self.scalar_weight = scalar_weight
+        self.list_size = list_size
+        self.page_arguments = tuple(page_arguments)
+
+    def estimate(
+        self,
+        query: Union[str, Document],
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> float:
+        """
+        Estimate the cost of an operation.
+
+        Args:
+            query: Query string or parsed document
+            variables: Variables of the operation
+            operation_name: Operation to estimate
+
+        Returns:
+            Estimated cost in points
+        """
+        document = parse(query) if isinstance(query, str) else query
+        kind = document.operation(operation_name).kind
+        root = self.schema.roots.get(kind) if self.schema else None
+        return self._cost(
+            root or kind.capitalize(), document.selections(operation_name), variables or {}
+        )
+
+    def _cost(
+        self, parent: Optional[str], selections: List[Any], variables: Dict[str, Any]
+    ) -> float:
+        total = 0.0
+        for selection in selections:
+            if not isinstance(selection, Field):
+                # Fragments on distinct types are counted as if all applied
+                condition = selection.type_condition or parent
+                total += self._cost(condition, selection.selections, variables)
+                continue
+            if selection.name.startswith("__"):
+                continue
+
+            field = self.schema.field(parent, selection.name) if self.schema and parent else None
+            type_name = named_type(field["type"]) if field else None
+            weight = self._weight(parent, selection, type_name)
+            if selection.selections is None:
+                total += weight
+                continue
+            multiplier = self._multiplier(selection, variables, field)
+            total += weight + multiplier * self._cost(type_name, selection.selections, variables)
+        return total
+
+    def _weight(self, parent: Optional[str], field: Field, type_name: Optional[str]) -> float:
+        for key in (f"{parent}.{field.name}" if parent else field.name, type_name):
+            if key is not None and key in self.weights:
+                return self.weights[key]
+        return self.object_weight if field.selections is not None else self.scalar_weight
+
+    def _multiplier(
+        self, selection: Field, variables: Dict[str, Any], field: Optional[Dict[str, Any]]
+    ) -> float:
+        if selection.arguments:
+            arguments = selection.argument_values(variables)
+            for name in self.page_arguments:
+                if isinstance(arguments.get(name), int):
+                    return arguments[name]
+        return self.list_size if field and _is_list(field["type"]) else 1
+
+
+def throttle_status(response: Response) -> Optional[Dict[str, Any]]:
+    """
+    Return the throttle status a response reports in ``extensions.cost``.
+
+    Args:
+        response: Response to a GraphQL request (or a batch of them)
+
+    Returns:
+        ``{"maximumAvailable", "currentlyAvailable", "restoreRate"}`` plus
+        ``actualQueryCost`` if reported, or None
+    """
+    # Skip parsing bodies that cannot hold a status; streamed bodies are left unread
+    if not response.is_stream_consumed or b"throttleStatus" not in response.content:
+        return None
+    try:
+        result = response.json()
+    except ValueError:
+        return None
+    for item in reversed(result if isinstance(result, list) else [result]):
+        cost = dig(item, COST_EXTENSION) if isinstance(item, dict) else None
+        if isinstance(cost, dict) and isinstance(cost.get("throttleStatus"), dict):
+            return {**cost["throttleStatus"], "actualQueryCost": cost.get("actualQueryCost")}
+    return None
+
+
+def _serialised_payloads(request_kwargs: Dict[str, Any]) -> Any:
+    # Body-signing auth serialises ``json`` into ``content`` before the middlewares run
+    content = request_kwargs.get("content")
+    if not isinstance(content, (bytes, str)):
+        return None
+    headers = request_kwargs.get("headers") or {}
+    if any(name.lower() == "content-encoding" for name in headers):
+        # An unknown operation, counted like a hashed persisted query
+        return {}
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+class CostLimiterMiddleware(Middleware):
+    """
+    Rate limiting middleware that budgets GraphQL requests by query cost.
+
+    A bucket of ``maximum`` points refills at ``restore_rate`` points per
+    second; each request takes its estimated cost from the bucket, waiting
+    until the bucket holds it. The bucket follows the server's account
+    whenever a response reports its ``extensions.cost.throttleStatus``.
+
+    Operations are read from the ``json`` payload, the query string of GET
+    requests, or a JSON body already serialised by body-signing auth. Place
+    the limiter before `CompressionMiddleware`: compressed bodies are not
+    decoded and only cost ``object_weight``.
+    """
+
+    def __init__(
+        self,
+        estimator: Optional[CostEstimator] = None,
+        maximum: float = 1000.0,
+        restore_rate: float = 50.0,
+    ):
+        """
+        Initialize CostLimiterMiddleware.
+
+        Args:
+            estimator: Estimator of query costs (defaults to a CostEstimator without schema)
+            maximum: Size of the cost budget in points
+            restore_rate: Points restored per second
+        """
+        self.estimator = estimator or CostEstimator()
+        self.maximum = maximum
+        self.restore_rate = restore_rate
+        self.available = maximum
+        self.last_check = time.monotonic()
+        # Cost reported by the server for the last request
+        self.last_cost: Optional[float] = None
+
+    def cost(self, request_kwargs: Dict[str, Any]) -> float:
+        """
+        Estimate the cost of a request.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Sum of the estimated costs of the request's operations
+        """
+        payloads = request_kwargs.get("json")
+        if payloads is None:
+            payloads = _serialised_payloads(request_kwargs)
+        if payloads is None:
+            # Persisted queries sent as GET carry the operation in the query string
+            payloads = request_kwargs.get("params") or {}
+        if not isinstance(payloads, list):
+            payloads = [payloads]
+        return sum(self._payload_cost(payload) for payload in payloads if isinstance(payload, dict))
+
+    def _payload_cost(self, payload: Dict[str, Any]) -> float:
+        query = payload.get("query")
+        if not isinstance(query, str):
+            # A hashed persisted query: its text is unknown here
+            return self.estimator.object_weight
+        variables = payload.get("variables")
+        if isinstance(variables, str):
+            variables = json.loads(variables)
+        try:
+            return self.estimator.estimate(query, variables, payload.get("operationName"))
+        except GraphQLError:
+            # The server rejects malformed queries without charging for them
+            return 0
+
+    def _reserve(self, request_kwargs: Dict[str, Any]) -> float:
+        # Deducting before waiting makes concurrent requests queue behind each other
+        cost = min(self.cost(request_kwargs), self.maximum)
+        now = time.monotonic()
+        self.available = min(
+            self.maximum, self.available + (now - self.last_check) * self.restore_rate
+        )
+        self.last_check = now
+        self.available -= cost
+        return -self.available / self.restore_rate if self.available < 0 else 0.0
+
+    def pre_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait until the request's estimated cost fits the budget.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Unmodified request parameters
+        """
+        wait = self._reserve(request_kwargs)
+        if wait:
+            time.sleep(wait)
+        return request_kwargs
+
+    async def apre_request(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait until the request's estimated cost fits the budget, without blocking the event loop.
+
+        Args:
+            request_kwargs: Request parameters
+
+        Returns:
+            Unmodified request parameters
+        """
+        wait = self._reserve(request_kwargs)
+        if wait:
+            import asyncio
+
+            await asyncio.sleep(wait)
+        return request_kwargs
+
+    def post_request(self, response: Response) -> Response:
+        """
+        Adopt the budget reported in the response's cost extension.
+
+        Args:
+            response: Response object
+
+        Returns:
+            Unmodified response
+        """
+        status = throttle_status(response)
+        if status is not None:
+            self.maximum = status.get("maximumAvailable", self.maximum)
+            self.restore_rate = status.get("restoreRate", self.restore_rate)
+            self.available = status.get("currentlyAvailable", self.available)
+            self.last_check = time.monotonic()
+            self.last_cost = status.get("actualQueryCost")
+        return response
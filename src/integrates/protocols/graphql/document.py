@@ -0,0 +1,568 @@
+"""
+Parsing, minification and caching of GraphQL documents.
+
+Documents are parsed down to their definitions (operations and fragments),
+which is enough to minify them, select one operation with the fragments it
+uses, and name it. Parsed documents are cached by source string, so sending
+a query that was seen before costs a dictionary lookup.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from integrates.core.exceptions import GraphQLSyntaxError
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<ignored>[\s,\ufeff]+|\#[^\n\r]*)
+    | (?P<block>\"\"\"(?:\\\"\"\"|(?!\"\"\")[\s\S])*\"\"\")
+    | (?P<string>"(?:[^"\\\n\r]|\\.)*")
+    | (?P<spread>\.\.\.)
+    | (?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<punct>[!$&()\:=@\[\]{|}])
+    """,
+    re.VERBOSE,
+)
+_OPERATION_TYPES = ("query", "mutation", "subscription")
+_CLOSING = {"(": ")", "[": "]", "{": "}"}
+
+Token = Tuple[str, str]
+
+
+def tokenize(source: str) -> List[Token]:
+    """
+    Split a document into significant tokens, dropping whitespace, commas and comments.
+
+    Args:
+        source: GraphQL document
+
+    Returns:
+        ``(kind, text)`` pairs
+
+    Raises:
+        GraphQLSyntaxError: On a character that cannot start a token
+    """
+    tokens = []
+    position = 0
+    match = _TOKEN_RE.match
+    while position < len(source):
+        found = match(source, position)
+        if found is None:
+            raise GraphQLSyntaxError(
+                f"Unexpected character {source[position]!r} at position {position}"
+            )
+        kind = found.lastgroup
+        if kind != "ignored":
+            tokens.append((kind, found.group()))
+        position = found.end()
+    return tokens
+
+
+def _needs_space(previous: Token, token: Token) -> bool:
+    # Adjacent names and numbers would run together, and so would an empty
+    # string followed by another string (read back as a block string)
+    if previous[0] in ("string", "block"):
+        return token[0] in ("string", "block")
+    return previous[0] in ("name", "number") and (
+        token[0] in ("name", "number") or (previous[0] == "number" and token[0] == "spread")
+    )
+
+
+def print_tokens(tokens: List[Token]) -> str:
+    """
+    Join tokens with the least whitespace that keeps them apart.
+
+    Args:
+        tokens: Tokens from `tokenize`
+
+    Returns:
+        Minified document text
+    """
+    parts = []
+    previous = ("punct", "")
+    for token in tokens:
+        if _needs_space(previous, token):
+            parts.append(" ")
+        parts.append(token[1])
+        previous = token
+    return "".join(parts)
+
+
+class Field:
+    """Field of a selection set."""
+
+    def __init__(
+        self,
+        name: str,
+        alias: Optional[str] = None,
+        arguments: Optional[List[Tuple[str, List[Token]]]] = None,
+        selections: Optional[List[Any]] = None,
+    ):
+        """
+        Initialize a Field.
+
+        Args:
+            name: Field name
+            alias: Alias the field is returned under
+            arguments: Argument names and the tokens of their values
+            selections: Selection set (None for a leaf field)
+        """
+        self.name = name
+        self.alias = alias
+        self.arguments = arguments or []
+        self.selections = selections
+        self.response_key = alias or name
+
+    def argument_values(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate the arguments of the field.
+
+        Args:
+            variables: Variables of the operation
+
+        Returns:
+            Argument name mapped to its value
+        """
+        return {name: _value(tokens, variables) for name, tokens in self.arguments}
+
+    def __repr__(self) -> str:
+        return f"<Field {self.response_key}>"
+
+
+class InlineFragment:
+    """Inline fragment, or a fragment spread resolved to its definition's selections."""
+
+    def __init__(self, type_condition: Optional[str], selections: List[Any]):
+        """
+        Initialize an InlineFragment.
+
+        Args:
+            type_condition: Type the fragment applies to (None for any type)
+            selections: Selection set
+        """
+        self.type_condition = type_condition
+        self.selections = selections
+
+
+class Definition:
+    """Operation or fragment definition of a document."""
+
+    def __init__(
+        self,
+        kind: str,
+        name: Optional[str],
+        text: str,
+        spreads: Set[str],
+        tokens: Optional[List[Token]] = None,
+    ):
+        """
+        Initialize a Definition.
+
+        Args:
+            kind: ``"query"``, ``"mutation"``, ``"subscription"`` or ``"fragment"``
+            name: Operation or fragment name (None for an anonymous operation)
+            text: Minified text of the definition
+            spreads: Names of the fragments spread in the definition
+            tokens: Tokens of the definition
+        """
+        self.kind = kind
+        self.name = name
+        self.text = text
+        self.spreads = spreads
+        self.tokens = tokens or []
+        self.type_condition = self.tokens[3][1] if kind == "fragment" and tokens else None
+        self._selections: Optional[List[Any]] = None
+
+    def __repr__(self) -> str:
+        return f"<Definition {self.kind} {self.name or '(anonymous)'}>"
+
+    @property
+    def selections(self) -> List[Any]:
+        """
+        Selection set of the definition, parsed on first use.
+
+        Fragment spreads are kept as their names (strings); `Document.selections`
+        resolves them.
+        """
+        if self._selections is None:
+            self._selections, _ = _selection_set(self.tokens, _selection_start(self.tokens))
+        return self._selections
+
+
+class Document:
+    """Parsed GraphQL document."""
+
+    def __init__(self, source: str):
+        """
+        Parse a GraphQL document.
+
+        Args:
+            source: Document text
+
+        Raises:
+            GraphQLSyntaxError: If the document is malformed or spreads an undefined fragment
+        """
+        self.source = source
+        self.operations: List[Definition] = []
+        self.fragments: Dict[str, Definition] = {}
+        for definition in _definitions(tokenize(source)):
+            if definition.kind == "fragment":
+                if definition.name in self.fragments:
+                    raise GraphQLSyntaxError(f"Fragment {definition.name!r} is defined twice")
+                self.fragments[definition.name] = definition
+            else:
+                self.operations.append(definition)
+        if not self.operations:
+            raise GraphQLSyntaxError("Document does not contain an operation")
+        for definition in self.operations + list(self.fragments.values()):
+            for spread in definition.spreads:
+                if spread not in self.fragments:
+                    raise GraphQLSyntaxError(f"Unknown fragment {spread!r}")
+        self._printed: Dict[Tuple[Optional[str], bool], str] = {}
+
+    @property
+    def operation_name(self) -> Optional[str]:
+        """Name of the operation if the document has exactly one operation."""
+        return self.operations[0].name if len(self.operations) == 1 else None
+
+    def operation(self, operation_name: Optional[str] = None) -> Definition:
+        """
+        Return an operation of the document.
+
+        Args:
+            operation_name: Operation name (may be omitted for a single-operation document)
+
+        Returns:
+            Operation definition
+
+        Raises:
+            GraphQLSyntaxError: If there is no such operation, or no name was
+                given for a document with several operations
+        """
+        if operation_name is None:
+            if len(self.operations) > 1:
+                raise GraphQLSyntaxError(
+                    "An operation name is required for a document with several operations"
+                )
+            return self.operations[0]
+        for operation in self.operations:
+            if operation.name == operation_name:
+                return operation
+        raise GraphQLSyntaxError(f"Unknown operation {operation_name!r}")
+
+    def print(self, operation_name: Optional[str] = None, add_typename: bool = False) -> str:
+        """
+        Return the minified text of an operation and the fragments it uses.
+
+        Other operations and unused fragments are left out.
+
+        Args:
+            operation_name: Operation to print (may be omitted for a single-operation document)
+            add_typename: Request ``__typename`` in every selection set below the root,
+                as needed to normalize results
+
+        Returns:
+            Minified document text
+        """
+        text = self._printed.get((operation_name, add_typename))
+        if text is None:
+            operation = self.operation(operation_name)
+            used = self._used_fragments(operation)
+            # Keep the source order of the definitions
+            definitions = [operation] + [f for name, f in self.fragments.items() if name in used]
+            if add_typename:
+                text = "".join(print_tokens(_with_typename(d)) for d in definitions)
+            else:
+                text = "".join(d.text for d in definitions)
+            self._printed[(operation_name, add_typename)] = text
+        return text
+
+    def selections(self, operation_name: Optional[str] = None) -> List[Any]:
+        """
+        Return the selection set of an operation with fragment spreads resolved.
+
+        Args:
+            operation_name: Operation (may be omitted for a single-operation document)
+
+        Returns:
+            Fields and inline fragments
+        """
+        return self._resolve(self.operation(operation_name).selections, ())
+
+    def _resolve(self, selections: List[Any], active: Tuple[str, ...]) -> List[Any]:
+        resolved = []
+        for selection in selections:
+            if isinstance(selection, str):
+                if selection in active:
+                    raise GraphQLSyntaxError(f"Fragment {selection!r} spreads itself")
+                fragment = self.fragments[selection]
+                inner = self._resolve(fragment.selections, active + (selection,))
+                resolved.append(InlineFragment(fragment.type_condition, inner))
+            elif isinstance(selection, InlineFragment):
+                inner = self._resolve(selection.selections, active)
+                resolved.append(InlineFragment(selection.type_condition, inner))
+            elif selection.selections is not None:
+                inner = self._resolve(selection.selections, active)
+                resolved.append(Field(selection.name, selection.alias, selection.arguments, inner))
+            else:
+                resolved.append(selection)
+        return resolved
+
+    def _used_fragments(self, operation: Definition) -> Set[str]:
+        used: Set[str] = set()
+        pending = list(operation.spreads)
+        while pending:
+            name = pending.pop()
+            if name not in used:
+                used.add(name)
+                pending.extend(self.fragments[name].spreads)
+        return used
+
+
+def _definitions(tokens: List[Token]) -> List[Definition]:
+    definitions = []
+    index = 0
+    while index < len(tokens):
+        start = index
+        kind, text = tokens[index]
+        name = None
+        if text == "{":
+            operation = "query"
+        elif kind == "name" and text in _OPERATION_TYPES + ("fragment",):
+            operation = text
+            if index + 1 < len(tokens) and tokens[index + 1][0] == "name":
+                name = tokens[index + 1][1]
+            if operation == "fragment" and (
+                name is None or index + 3 >= len(tokens) or tokens[index + 2][1] != "on"
+            ):
+                raise GraphQLSyntaxError("Expected 'fragment Name on Type'")
+        else:
+            raise GraphQLSyntaxError(f"Unexpected {text!r}; expected an operation or fragment")
+
+        index, spreads = _skip_definition(tokens, index)
+        definition_tokens = tokens[start:index]
+        definitions.append(
+            Definition(operation, name, print_tokens(definition_tokens), spreads, definition_tokens)
+        )
+    return definitions
+
+
+def _skip_definition(tokens: List[Token], index: int) -> Tuple[int, Set[str]]:
+    """Return the index after the definition starting at ``index`` and its fragment spreads."""
+    stack: List[str] = []
+    spreads: Set[str] = set()
+    while index < len(tokens):
+        kind, text = tokens[index]
+        index += 1
+        if text in _CLOSING:
+            stack.append(_CLOSING[text])
+        elif text in (")", "]", "}"):
+            if not stack or stack.pop() != text:
+                raise GraphQLSyntaxError(f"Unbalanced {text!r}")
+            if text == "}" and not stack:
+                return index, spreads
+        elif kind == "spread" and index < len(tokens):
+            following = tokens[index]
+            if following[0] == "name" and following[1] != "on":
+                spreads.add(following[1])
+    raise GraphQLSyntaxError("Unexpected end of document")
+
+
+def _selection_start(tokens: List[Token]) -> int:
+    """Return the index of the definition's selection set, skipping variable definitions."""
+    depth = 0
+    for index, (_, text) in enumerate(tokens):
+        if text in ("(", "["):
+            depth += 1
+        elif text in (")", "]"):
+            depth -= 1
+        elif text == "{" and depth == 0:
+            return index
+    raise GraphQLSyntaxError("Definition without a selection set")
+
+
+def _with_typename(definition: Definition) -> List[Token]:
+    tokens = definition.tokens
+    root = _selection_start(tokens) if definition.kind != "fragment" else -1
+    result = []
+    depth = 0
+    for index, token in enumerate(tokens):
+        result.append(token)
+        text = token[1]
+        if text in ("(", "["):
+            depth += 1
+        elif text in (")", "]"):
+            depth -= 1
+        elif text == "{" and depth == 0 and index != root:
+            result.append(("name", "__typename"))
+    return result
+
+
+def _expect(tokens: List[Token], index: int, text: str) -> int:
+    if index >= len(tokens) or tokens[index][1] != text:
+        found = tokens[index][1] if index < len(tokens) else "end of document"
+        raise GraphQLSyntaxError(f"Expected {text!r}, found {found!r}")
+    return index + 1
+
+
+def _skip_value(tokens: List[Token], index: int) -> int:
+    text = tokens[index][1]
+    if text == "$":
+        return index + 2
+    if text not in ("[", "{"):
+        return index + 1
+    depth = 0
+    while index < len(tokens):
+        text = tokens[index][1]
+        if text in ("[", "{"):
+            depth += 1
+        elif text in ("]", "}"):
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise GraphQLSyntaxError("Unexpected end of document")
+
+
+def _arguments(tokens: List[Token], index: int) -> Tuple[List[Tuple[str, List[Token]]], int]:
+    arguments = []
+    if index < len(tokens) and tokens[index][1] == "(":
+        index += 1
+        while tokens[index][1] != ")":
+            name = tokens[index][1]
+            index = _expect(tokens, index + 1, ":")
+            end = _skip_value(tokens, index)
+            arguments.append((name, tokens[index:end]))
+            index = end
+        index += 1
+    return arguments, index
+
+
+def _skip_directives(tokens: List[Token], index: int) -> int:
+    while index < len(tokens) and tokens[index][1] == "@":
+        _, index = _arguments(tokens, index + 2)
+    return index
+
+
+def _selection_set(tokens: List[Token], index: int) -> Tuple[List[Any], int]:
+    """Parse the selection set starting at ``index``; return it and the index after it."""
+    index = _expect(tokens, index, "{")
+    selections: List[Any] = []
+    while index < len(tokens) and tokens[index][1] != "}":
+        kind, text = tokens[index]
+        if kind == "spread":
+            following = tokens[index + 1]
+            if following[0] == "name" and following[1] != "on":
+                selections.append(following[1])
+                index = _skip_directives(tokens, index + 2)
+                continue
+            type_condition = None
+            index += 1
+            if tokens[index][1] == "on":
+                type_condition = tokens[index + 1][1]
+                index += 2
+            index = _skip_directives(tokens, index)
+            inner, index = _selection_set(tokens, index)
+            selections.append(InlineFragment(type_condition, inner))
+        elif kind == "name":
+            alias, name = None, text
+            index += 1
+            if tokens[index][1] == ":":
+                alias, name = name, tokens[index + 1][1]
+                index += 2
+            arguments, index = _arguments(tokens, index)
+            index = _skip_directives(tokens, index)
+            inner = None
+            if index < len(tokens) and tokens[index][1] == "{":
+                inner, index = _selection_set(tokens, index)
+            selections.append(Field(name, alias, arguments, inner))
+        else:
+            raise GraphQLSyntaxError(f"Unexpected {text!r} in selection set")
+    return selections, _expect(tokens, index, "}")
+
+
+def _value(tokens: List[Token], variables: Dict[str, Any]) -> Any:
+    value, _ = _parse_value(tokens, 0, variables)
+    return value
+
+
+def _parse_value(tokens: List[Token], index: int, variables: Dict[str, Any]) -> Tuple[Any, int]:
+    kind, text = tokens[index]
+    if text == "$":
+        return variables.get(tokens[index + 1][1]), index + 2
+    if text == "[":
+        items = []
+        index += 1
+        while tokens[index][1] != "]":
+            item, index = _parse_value(tokens, index, variables)
+            items.append(item)
+        return items, index + 1
+    if text == "{":
+        fields = {}
+        index += 1
+        while tokens[index][1] != "}":
+            name = tokens[index][1]
+            fields[name], index = _parse_value(tokens, index + 2, variables)
+        return fields, index + 1
+    if kind == "number":
+        return (float(text) if any(c in text for c in ".eE") else int(text)), index + 1
+    if kind == "string":
+        return json.loads(text), index + 1
+    if kind == "block":
+        return text[3:-3].replace('\\"""', '"""'), index + 1
+    # Names: booleans, null and enum values
+    return {"true": True, "false": False, "null": None}.get(text, text), index + 1
+
+
+@lru_cache(maxsize=512)
+def parse(source: str) -> Document:
+    """
+    Parse a document, reusing the result for a source seen before.
+
+    Args:
+        source: Document text
+
+    Returns:
+        Parsed document
+
+    Raises:
+        GraphQLSyntaxError: If the document is malformed
+    """
+    return Document(source)
+
+
+def build_payload(
+    query: str,
+    variables: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+    minify: bool = True,
+    add_typename: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the request payload of an operation.
+
+    Args:
+        query: GraphQL document
+        variables: Variables of the operation
+        operation_name: Operation to execute; filled in from a single named operation
+        minify: Parse the document and send only the minified text the operation needs
+        add_typename: Request ``__typename`` in nested selection sets (implies ``minify``)
+
+    Returns:
+        Payload with ``query``, ``variables`` and, if known, ``operationName``
+
+    Raises:
+        GraphQLSyntaxError: If ``minify`` is set and the document is malformed
+    """
+    if minify or add_typename:
+        document = parse(query)
+        query = document.print(operation_name, add_typename)
+        operation_name = operation_name or document.operation_name
+
+    payload = {"query": query, "variables": variables or {}}
+    if operation_name:
+        payload["operationName"] = operation_name
+    return payload
@@ -0,0 +1,182 @@
+"""
+Incremental delivery of GraphQL results (``@defer`` and ``@stream``).
+
+Servers deliver such results as a ``multipart/mixed`` response: the initial
+payload first, then one part per patch, each a JSON object with ``hasNext``
+telling whether more parts follow.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from integrates.core.exceptions import GraphQLError
+
+ACCEPT = "multipart/mixed;deferSpec=20220824, application/json"
+
+
+def multipart_boundary(content_type: str) -> Optional[str]:
+    """
+    Return the boundary of a ``multipart/mixed`` content type.
+
+    Args:
+        content_type: Content-Type header value
+
+    Returns:
+        Boundary (``"-"`` if the header has none), or None for other content types
+    """
+    media_type, _, parameters = content_type.partition(";")
+    if media_type.strip().lower() != "multipart/mixed":
+        return None
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "boundary":
+            return value.strip().strip('"')
+    return "-"
+
+
+class MultipartDecoder:
+    """Splits a ``multipart/mixed`` body into the JSON payloads of its parts as bytes arrive."""
+
+    def __init__(self, boundary: str = "-"):
+        """
+        Initialize a MultipartDecoder.
+
+        Args:
+            boundary: Multipart boundary
+        """
+        self.delimiter = b"\r\n--" + boundary.encode("ascii")
+        # The first delimiter may start the body without a preceding line break
+        self._buffer = bytearray(b"\r\n")
+        # Offset where the next delimiter search starts; earlier bytes hold none
+        self._scan = 0
+        self._started = False
+        # True right after a delimiter, until its line shows whether it closes the body
+        self._delimited = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Decode the parts completed by a chunk.
+
+        Args:
+            chunk: Next bytes of the body
+
+        Returns:
+            Parsed JSON payloads of the completed parts (empty parts are skipped)
+        """
+        payloads: List[Any] = []
+        if self.done:
+            return payloads
+        self._buffer += chunk
+        while True:
+            if self._delimited:
+                if len(self._buffer) < 2:
+                    break
+                if self._buffer.startswith(b"--"):
+                    self.done = True
+                    break
+                self._delimited = False
+            index = self._buffer.find(self.delimiter, self._scan)
+            if index < 0:
+                if not self._started:
+                    # Drop the preamble, keeping enough to match a split delimiter
+                    del self._buffer[: -len(self.delimiter)]
+                # A delimiter split across chunks starts in the last len - 1 bytes
+                self._scan = max(0, len(self._buffer) - len(self.delimiter) + 1)
+                break
+            part = bytes(self._buffer[:index])
+            del self._buffer[: index + len(self.delimiter)]
+            self._scan = 0
+            if self._started:
+                payload = self._parse_part(part)
+                if payload is not None:
+                    payloads.append(payload)
+            self._started = True
+            self._delimited = True
+        return payloads
+
+    @staticmethod
+    def _parse_part(part: bytes) -> Any:
+        # A part is: rest of the delimiter line, headers, blank line, body
+        for separator in (b"\r\n\r\n", b"\n\n"):
+            headers, found, body = part.partition(separator)
+            if found:
+                break
+        else:
+            return None
+        body = body.strip()
+        return json.loads(body) if body else None
+
+
+class IncrementalResult:
+    """
+    Result assembled from incremental payloads.
+
+    Supports both the current format (patches listed under ``incremental``)
+    and the earlier one (a patch per payload with ``path``).
+    """
+
+    def __init__(self):
+        """Initialize an empty IncrementalResult."""
+        self.data: Optional[Dict[str, Any]] = None
+        self.errors: List[Dict[str, Any]] = []
+        self.extensions: Dict[str, Any] = {}
+        self.has_next = True
+
+    def apply(self, payload: Dict[str, Any]) -> "IncrementalResult":
+        """
+        Merge a payload into the result.
+
+        Args:
+            payload: Initial payload or patch
+
+        Returns:
+            The result itself
+        """
+        patches = payload.get("incremental")
+        if patches is None:
+            patches = [payload] if "path" in payload else []
+            if "path" not in payload and "data" in payload:
+                self.data = payload["data"]
+        for patch in patches:
+            if patch.get("items") is not None:
+                target = self._at(patch["path"][:-1])
+                if isinstance(target, list):
+                    target.extend(patch["items"])
+            elif patch.get("data") is not None:
+                target = self._at(patch["path"])
+                if isinstance(target, dict):
+                    _merge(target, patch["data"])
+            self.errors.extend(patch.get("errors") or [])
+        if "path" not in payload:
+            self.errors.extend(payload.get("errors") or [])
+        self.extensions.update(payload.get("extensions") or {})
+        self.has_next = bool(payload.get("hasNext", False))
+        return self
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise the errors reported so far.
+
+        Raises:
+            GraphQLError: If any payload reported errors
+        """
+        if self.errors:
+            message = "; ".join(str(error.get("message", error)) for error in self.errors)
+            raise GraphQLError(message, self.errors)
+
+    def _at(self, path: List[Any]) -> Any:
+        target: Any = self.data
+        for key in path:
+            if target is None:
+                return None
+            target = target[key] if isinstance(target, list) else target.get(key)
+        return target
+
+
+def _merge(target: Dict[str, Any], data: Dict[str, Any]) -> None:
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
@@ -0,0 +1,301 @@
+"""
+DataLoader-style batching and deduplication of keyed lookups.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from integrates.core.exceptions import GraphQLError
+from integrates.core.response import Response
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from integrates.protocols.graphql.client import AsyncGraphQLClient
+
+BatchLoadFn = Callable[[List[Hashable]], Awaitable[Sequence[Any]]]
+
+
+class DataLoader:
+    """
+    Coalesces the lookups issued in one event-loop tick into batch calls.
+
+    Every ``load(key)`` made before the event loop gets to run the loader's
+    dispatch callback joins the same batch; duplicate keys are loaded once.
+    ``batch_load`` receives the unique keys and returns one value per key, in
+    order; a value that is an exception is raised to the callers of its key.
+
+    Results are cached by key for the loader's lifetime, so create one loader
+    per unit of work (e.g. per incoming request) to scope the cache.
+    """
+
+    def __init__(self, batch_load: BatchLoadFn, max_batch_size: int = 100, cache: bool = True):
+        """
+        Initialize a DataLoader.
+
+        Args:
+            batch_load: Coroutine function loading a list of keys
+            max_batch_size: Maximum number of keys per ``batch_load`` call
+            cache: Keep results for later loads of the same key
+
+        Raises:
+            ValueError: If max_batch_size is less than 1
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._futures: Dict[Hashable, "asyncio.Future"] = {}
+        self._primed: Dict[Hashable, Any] = {}
+        self._queue: List[Hashable] = []
+        self._tasks: Set["asyncio.Task"] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Load the value of a key as part of the current batch.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Value returned by ``batch_load`` for the key
+        """
+        import asyncio
+
+        if key in self._primed:
+            return self._primed[key]
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        # Several callers may wait for the same future; none may cancel it for the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        """
+        Load several keys as part of the current batch.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Values in the order of the keys
+        """
+        import asyncio
+
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value already known, e.g. from another query.
+
+        Args:
+            key: Key
+            value: Value for the key
+        """
+        self._primed[key] = value
+
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        """
+        Forget cached values.
+
+        Args:
+            key: Key to forget (None for all)
+        """
+        if key is None:
+            self._primed.clear()
+            self._futures = {k: future for k, future in self._futures.items() if not future.done()}
+        else:
+            self._primed.pop(key, None)
+            future = self._futures.get(key)
+            if future is not None and future.done():
+                del self._futures[key]
+
+    def _dispatch(self) -> None:
+        import asyncio
+
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self.max_batch_size):
+            task = asyncio.ensure_future(self._run(keys[start : start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: List[Hashable]) -> None:
+        futures = [self._futures[key] for key in keys]
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(f"batch_load returned {len(values)} values for {len(keys)} keys")
+        except BaseException as exc:
+            for key, future in zip(keys, futures):
+                self._settle(key, future, exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for key, future, value in zip(keys, futures, values):
+            self._settle(key, future, value)
+
+    def _settle(self, key: Hashable, future: "asyncio.Future", value: Any) -> None:
+        if isinstance(value, BaseException):
+            future.set_exception(value)
+            # Failures are not cached, so a later load retries the key
+            if self._futures.get(key) is future:
+                del self._futures[key]
+        else:
+            future.set_result(value)
+            if not self.cache and self._futures.get(key) is future:
+                del self._futures[key]
+
+
+class GraphQLLoader(DataLoader):
+    """
+    Loads entities by key with one aliased GraphQL query per batch.
+
+    The keys of a batch become aliases of one root field, e.g. for the field
+    ``user``::
+
+        query Load($k0: ID!, $k1: ID!) {
+          k0: user(id: $k0) { id name }
+          k1: user(id: $k1) { id name }
+        }
+
+    Errors reported for an alias are raised to the callers of that key as
+    GraphQLError.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncGraphQLClient",
+        field: str,
+        selection: str = "",
+        argument: str = "id",
+        argument_type: str = "ID!",
+        max_batch_size: int = 100,
+        cache: bool = True,
+    ):
+        """
+        Initialize a GraphQLLoader.
+
+        Args:
+            client: Asynchronous GraphQL client
+            field: Root query field returning one entity, e.g. ``"user"``
+            selection: Selection set of the field, e.g. ``"{ id name }"``
+            argument: Argument of the field receiving the key
+            argument_type: GraphQL type of the argument
+            max_batch_size: Maximum number of aliases per query
+            cache: Keep results for later loads of the same key
+        """
+        super().__init__(self._load_aliased, max_batch_size=max_batch_size, cache=cache)
+        self.client = client
+        self.field = field
+        self.selection = selection
+        self.argument = argument
+        self.argument_type = argument_type
+        self._queries: Dict[int, str] = {}
+
+    def query_for(self, count: int) -> str:
+        """
+        Return the aliased query loading ``count`` keys (built once per count).
+
+        Args:
+            count: Number of keys
+
+        Returns:
+            GraphQL query string
+        """
+        query = self._queries.get(count)
+        if query is None:
+            query = self._queries[count] = aliased_query(
+                self.field, self.selection, count, self.argument, self.argument_type
+            )
+        return query
+
+    async def _load_aliased(self, keys: List[Hashable]) -> List[Any]:
+        response = await self.client.query(self.query_for(len(keys)), alias_variables(keys))
+        return alias_values(response, len(keys))
+
+
+def aliased_query(
+    field: str, selection: str, count: int, argument: str = "id", argument_type: str = "ID!"
+) -> str:
+    """
+    Build a query selecting one root field once per key, under aliases ``k0``, ``k1``, ...
+
+    Args:
+        field: Root query field returning one entity, e.g. ``"user"``
+        selection: Selection set of the field, e.g. ``"{ id name }"``
+        count: Number of keys
+        argument: Argument of the field receiving the key
+        argument_type: GraphQL type of the argument
+
+    Returns:
+        GraphQL query string taking the keys as variables ``$k0``, ``$k1``, ...
+    """
+    variables = ", ".join(f"$k{i}: {argument_type}" for i in range(count))
+    fields = " ".join(
+        f"k{i}: {field}({argument}: $k{i}) {selection}".rstrip() for i in range(count)
+    )
+    return f"query Load({variables}) {{ {fields} }}"
+
+
+def alias_variables(keys: Sequence[Hashable]) -> Dict[str, Any]:
+    """Return the variables of an `aliased_query` for keys."""
+    return {f"k{i}": key for i, key in enumerate(keys)}
+
+
+def alias_values(response: Response, count: int) -> List[Any]:
+    """
+    Split the result of an `aliased_query` into one value per key.
+
+    Args:
+        response: Response to the query
+        count: Number of keys
+
+    Returns:
+        The data of each alias, or a GraphQLError for aliases reported in ``errors``
+
+    Raises:
+        HTTPError: If the response has an error status
+        GraphQLError: If the result has no data at all
+    """
+    response.raise_for_status()
+    result = response.json()
+    data = result.get("data")
+    errors = result.get("errors") or []
+    if data is None:
+        raise GraphQLError(_message(errors), errors)
+
+    alias_errors: Dict[str, List[Dict[str, Any]]] = {}
+    for error in errors:
+        path = error.get("path") or []
+        if path:
+            alias_errors.setdefault(str(path[0]), []).append(error)
+
+    values: List[Any] = []
+    for i in range(count):
+        alias = f"k{i}"
+        if alias in alias_errors:
+            values.append(GraphQLError(_message(alias_errors[alias]), alias_errors[alias]))
+        else:
+            values.append(data.get(alias))
+    return values
+
+
+def _message(errors: List[Dict[str, Any]]) -> str:
+    return "; ".join(str(error.get("message", error)) for error in errors) or "No data returned"
@@ -0,0 +1,186 @@
+"""
+Lookups of many entities by id, split into aliased queries the server accepts.
+
+A query selecting thousands of aliases exceeds the complexity, depth or size
+limits servers put on a single operation; the ids are sent in chunks of
+`aliased_query` instead, and the results merged into one mapping.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional
+
+from integrates.core.exceptions import GraphQLError
+from integrates.protocols.graphql.cost import CostEstimator
+from integrates.protocols.graphql.loader import alias_values, alias_variables, aliased_query
+
+if TYPE_CHECKING:
+    from integrates.protocols.graphql.client import AsyncGraphQLClient, GraphQLClient
+
+
+def lookup_chunk_size(
+    field: str,
+    selection: str = "",
+    argument: str = "id",
+    argument_type: str = "ID!",
+    chunk_size: int = 100,
+    max_cost: Optional[float] = None,
+    estimator: Optional[CostEstimator] = None,
+) -> int:
+    """
+    Return the number of ids to look up per query.
+
+    Args:
+        field: Root query field returning one entity
+        selection: Selection set of the field
+        argument: Argument of the field receiving the id
+        argument_type: GraphQL type of the argument
+        chunk_size: Maximum number of aliases per query
+        max_cost: Maximum estimated cost of a query, e.g. the server's complexity limit
+        estimator: Estimator of query costs (defaults to a CostEstimator without schema)
+
+    Returns:
+        Chunk size, at least 1
+
+    Raises:
+        ValueError: If chunk_size is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if max_cost is None:
+        return chunk_size
+    # Every alias repeats the same selection, so the cost grows linearly
+    per_id = (estimator or CostEstimator()).estimate(
+        aliased_query(field, selection, 1, argument, argument_type)
+    )
+    if per_id <= 0:
+        return chunk_size
+    return max(1, min(chunk_size, int(max_cost // per_id)))
+
+
+def _split(ids: Iterable[Hashable], size: int) -> List[List[Hashable]]:
+    # Duplicate ids are looked up once
+    unique = list(dict.fromkeys(ids))
+    return [unique[start : start + size] for start in range(0, len(unique), size)]
+
+
+def _merge(chunks: List[List[Hashable]], values: List[List[Any]], partial: bool) -> Dict[Any, Any]:
+    results: Dict[Any, Any] = {}
+    failures: List[GraphQLError] = []
+    for keys, chunk_values in zip(chunks, values):
+        for key, value in zip(keys, chunk_values):
+            results[key] = value
+            if isinstance(value, GraphQLError):
+                failures.append(value)
+    if failures and not partial:
+        errors = [error for failure in failures for error in failure.errors]
+        raise GraphQLError("; ".join(str(failure) for failure in failures), errors)
+    return results
+
+
+def lookup(
+    client: "GraphQLClient",
+    ids: Iterable[Hashable],
+    field: str,
+    selection: str = "",
+    argument: str = "id",
+    argument_type: str = "ID!",
+    chunk_size: int = 100,
+    max_cost: Optional[float] = None,
+    estimator: Optional[CostEstimator] = None,
+    partial: bool = False,
+) -> Dict[Any, Any]:
+    """
+    Look up entities by id with one aliased query per chunk of ids, sent in turn.
+
+    Args:
+        client: GraphQL client
+        ids: Ids to look up
+        field: Root query field returning one entity, e.g. ``"node"``
+        selection: Selection set of the field, e.g. ``"{ id name }"``
+        argument: Argument of the field receiving the id
+        argument_type: GraphQL type of the argument
+        chunk_size: Maximum number of ids per query
+        max_cost: Maximum estimated cost of a query (see `lookup_chunk_size`)
+        estimator: Estimator of query costs
+        partial: Map ids whose lookup reported errors to their GraphQLError
+            instead of raising
+
+    Returns:
+        Id mapped to the entity's data (None for ids the server did not resolve)
+
+    Raises:
+        GraphQLError: If the lookup of any id reported errors and ``partial`` is false
+    """
+    size = lookup_chunk_size(
+        field, selection, argument, argument_type, chunk_size, max_cost, estimator
+    )
+    chunks = _split(ids, size)
+    values = []
+    for keys in chunks:
+        query = aliased_query(field, selection, len(keys), argument, argument_type)
+        values.append(alias_values(client.query(query, alias_variables(keys)), len(keys)))
+    return _merge(chunks, values, partial)
+
+
+async def alookup(
+    client: "AsyncGraphQLClient",
+    ids: Iterable[Hashable],
+    field: str,
+    selection: str = "",
+    argument: str = "id",
+    argument_type: str = "ID!",
+    chunk_size: int = 100,
+    max_cost: Optional[float] = None,
+    estimator: Optional[CostEstimator] = None,
+    partial: bool = False,
+    concurrency: int = 4,
+) -> Dict[Any, Any]:
+    """
+    Look up entities by id with aliased queries, running up to ``concurrency`` at once.
+
+    See `lookup`.
+
+    Args:
+        client: Asynchronous GraphQL client
+        ids: Ids to look up
+        field: Root query field returning one entity, e.g. ``"node"``
+        selection: Selection set of the field, e.g. ``"{ id name }"``
+        argument: Argument of the field receiving the id
+        argument_type: GraphQL type of the argument
+        chunk_size: Maximum number of ids per query
+        max_cost: Maximum estimated cost of a query (see `lookup_chunk_size`)
+        estimator: Estimator of query costs
+        partial: Map ids whose lookup reported errors to their GraphQLError
+            instead of raising
+        concurrency: Maximum number of queries in flight
+
+    Returns:
+        Id mapped to the entity's data (None for ids the server did not resolve)
+
+    Raises:
+        GraphQLError: If the lookup of any id reported errors and ``partial`` is false
+        ValueError: If concurrency is less than 1
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    size = lookup_chunk_size(
+        field, selection, argument, argument_type, chunk_size, max_cost, estimator
+    )
+    chunks = _split(ids, size)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(keys: List[Hashable]) -> List[Any]:
+        query = aliased_query(field, selection, len(keys), argument, argument_type)
+        async with semaphore:
+            response = await client.query(query, alias_variables(keys))
+        return alias_values(response, len(keys))
+
+    tasks = [asyncio.ensure_future(send(keys)) for keys in chunks]
+    try:
+        values = await asyncio.gather(*tasks)
+    finally:
+        # A failed chunk fails the lookup; do not leave the others running
+        for task in tasks:
+            task.cancel()
+    return _merge(chunks, list(values), partial)
@@ -0,0 +1,121 @@
+"""
+Pagination over Relay-style connections.
+
+A connection holds its items as ``edges { node }`` (or ``nodes``) and reports
+``pageInfo { hasNextPage endCursor }``; the next page is requested by passing
+``endCursor`` as the query's cursor variable (``$after``).
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from integrates.core.exceptions import GraphQLError
+from integrates.core.response import Response
+from integrates.protocols.rest.pagination import dig
+
+PageFetcher = Callable[[Optional[str]], Response]
+AsyncPageFetcher = Callable[[Optional[str]], Awaitable[Response]]
+
+
+def connection(response: Response, path: str) -> Dict[str, Any]:
+    """
+    Return the connection at a path of a query result.
+
+    Args:
+        response: Response to the page query
+        path: Dotted path of the connection below ``data``, e.g. ``"repository.issues"``
+
+    Returns:
+        Connection object
+
+    Raises:
+        HTTPError: If the response has an error status
+        GraphQLError: If the result has no connection at the path
+    """
+    response.raise_for_status()
+    result = response.json()
+    found = dig(result.get("data"), path)
+    if not isinstance(found, dict):
+        errors = result.get("errors") or []
+        message = "; ".join(str(error.get("message", error)) for error in errors)
+        raise GraphQLError(message or f"No connection at {path!r}", errors)
+    return found
+
+
+def nodes(page: Dict[str, Any]) -> List[Any]:
+    """Return the nodes of a connection page."""
+    if page.get("edges") is not None:
+        return [edge.get("node") for edge in page["edges"]]
+    return list(page.get("nodes") or [])
+
+
+def next_cursor(page: Dict[str, Any]) -> Optional[str]:
+    """Return the cursor of the next page, or None on the last page."""
+    info = page.get("pageInfo") or {}
+    return info.get("endCursor") if info.get("hasNextPage") else None
+
+
+def iter_nodes(fetch: PageFetcher, path: str, max_pages: Optional[int] = None) -> Iterator[Any]:
+    """
+    Yield the nodes of a connection page by page.
+
+    Args:
+        fetch: Fetch the page after a cursor (None for the first page)
+        path: Dotted path of the connection below ``data``
+        max_pages: Maximum number of pages to fetch
+
+    Returns:
+        Iterator over nodes
+    """
+    cursor: Optional[str] = None
+    seen = set()
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        page = connection(fetch(cursor), path)
+        pages += 1
+        yield from nodes(page)
+        cursor = next_cursor(page)
+        # A repeated cursor would request the same page forever
+        if cursor is None or cursor in seen:
+            return
+        seen.add(cursor)
+
+
+async def aiter_nodes(
+    fetch: AsyncPageFetcher, path: str, max_pages: Optional[int] = None
+) -> AsyncIterator[Any]:
+    """
+    Yield the nodes of a connection, fetching each page while the previous one is consumed.
+
+    Args:
+        fetch: Fetch the page after a cursor (None for the first page)
+        path: Dotted path of the connection below ``data``
+        max_pages: Maximum number of pages to fetch
+
+    Returns:
+        Asynchronous iterator over nodes
+    """
+    import asyncio
+
+    if max_pages is not None and max_pages < 1:
+        return
+    pending = asyncio.ensure_future(fetch(None))
+    seen = set()
+    pages = 1
+    try:
+        while pending is not None:
+            page = connection(await pending, path)
+            pending = None
+            cursor = next_cursor(page)
+            if (
+                cursor is not None
+                and cursor not in seen
+                and (max_pages is None or pages < max_pages)
+            ):
+                seen.add(cursor)
+                pages += 1
+                pending = asyncio.ensure_future(fetch(cursor))
+            for node in nodes(page):
+                yield node
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,121 @@
+"""
+Automatic persisted queries (APQ).
+
+The client sends the SHA-256 hash of a query instead of its text. A server
+that does not know the hash yet answers ``PersistedQueryNotFound``, and the
+query is sent once more with its text so the server can register it.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from integrates.core.exceptions import GraphQLError
+from integrates.core.response import Response
+from integrates.protocols.graphql.document import parse
+
+NOT_FOUND = "PersistedQueryNotFound"
+NOT_SUPPORTED = "PersistedQueryNotSupported"
+
+_ERROR_CODES = {
+    "PERSISTED_QUERY_NOT_FOUND": NOT_FOUND,
+    "PERSISTED_QUERY_NOT_SUPPORTED": NOT_SUPPORTED,
+}
+
+
+@lru_cache(maxsize=1024)
+def query_hash(query: str) -> str:
+    """
+    Return the hex SHA-256 hash of a query, computed once per query string.
+
+    Args:
+        query: GraphQL query string
+
+    Returns:
+        Hash sent in the ``persistedQuery`` extension
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def is_query(query: str, operation_name: Optional[str] = None) -> bool:
+    """
+    Tell whether the operation a payload selects is a query, which may be sent as GET.
+
+    Args:
+        query: GraphQL document
+        operation_name: Operation selected from the document
+
+    Returns:
+        True for queries; False for mutations, subscriptions and documents
+        that cannot be parsed (those are sent as POST)
+    """
+    try:
+        return parse(query).operation(operation_name).kind == "query"
+    except GraphQLError:
+        return False
+
+
+def persisted_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the query text of a payload with its hash.
+
+    Args:
+        payload: Payload with ``query``, ``variables`` and optionally ``operationName``
+
+    Returns:
+        Payload with a ``persistedQuery`` extension and without ``query``
+    """
+    hashed = {key: value for key, value in payload.items() if key != "query"}
+    extensions = dict(payload.get("extensions") or {})
+    extensions["persistedQuery"] = {"version": 1, "sha256Hash": query_hash(payload["query"])}
+    hashed["extensions"] = extensions
+    return hashed
+
+
+def query_params(payload: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Encode a payload as query parameters for a GET request.
+
+    Args:
+        payload: Operation payload
+
+    Returns:
+        Query parameters, with ``variables`` and ``extensions`` as compact JSON
+    """
+    params = {}
+    for key, value in payload.items():
+        if key in ("variables", "extensions"):
+            if value:
+                params[key] = json.dumps(value, separators=(",", ":"), sort_keys=True)
+        elif value is not None:
+            params[key] = value
+    return params
+
+
+def persisted_error(response: Response) -> Optional[str]:
+    """
+    Detect a server asking for the full query text.
+
+    Args:
+        response: Response to a hashed query
+
+    Returns:
+        ``NOT_FOUND``, ``NOT_SUPPORTED`` or None for any other response
+    """
+    # Cheap test first, so ordinary results are not parsed twice
+    if b"PersistedQuery" not in response.content and b"PERSISTED_QUERY" not in response.content:
+        return None
+    try:
+        errors = response.json().get("errors") or []
+    except (ValueError, AttributeError):
+        return None
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        code = (error.get("extensions") or {}).get("code")
+        if code in _ERROR_CODES:
+            return _ERROR_CODES[code]
+        if error.get("message") in (NOT_FOUND, NOT_SUPPORTED):
+            return error["message"]
+    return None
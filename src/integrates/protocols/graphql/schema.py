@@ -0,0 +1,461 @@
+"""
+Schema introspection, on-disk schema cache and offline validation.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from integrates.core.exceptions import GraphQLError, GraphQLValidationError
+from integrates.core.response import Response
+from integrates.protocols.graphql.document import Document, Field, parse
+
+# Number of validation results kept per schema, matching the cache of parsed documents
+VALIDATION_CACHE_SIZE = 512
+
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+  __schema {
+    queryType { name }
+    mutationType { name }
+    subscriptionType { name }
+    types {
+      kind
+      name
+      fields(includeDeprecated: true) { name args { ...InputValue } type { ...TypeRef } }
+      inputFields { ...InputValue }
+      possibleTypes { name }
+      enumValues(includeDeprecated: true) { name }
+    }
+  }
+}
+
+fragment InputValue on __InputValue { name type { ...TypeRef } defaultValue }
+
+fragment TypeRef on __Type {
+  kind
+  name
+  ofType { kind name ofType { kind name ofType { kind name ofType { kind name ofType {
+    kind name ofType { kind name } } } } } }
+}
+"""
+
+# Error code servers such as Apollo Server report for queries the schema rejects
+VALIDATION_FAILED = b"GRAPHQL_VALIDATION_FAILED"
+
+# Types whose fields need a selection set
+_COMPOSITE = ("OBJECT", "INTERFACE", "UNION")
+_ROOT_META_FIELDS = ("__schema", "__type")
+
+
+def _datetime(value: str) -> datetime:
+    # fromisoformat only accepts a "Z" suffix from Python 3.11
+    return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+# Decoders applied by `Schema.decode` to custom scalars, by scalar name
+DEFAULT_SCALARS: Dict[str, Callable[[Any], Any]] = {
+    "DateTime": _datetime,
+    "Date": date.fromisoformat,
+    "BigInt": int,
+    "Long": int,
+    "Decimal": Decimal,
+}
+
+
+def type_string(ref: Dict[str, Any]) -> str:
+    """
+    Format an introspection type reference, e.g. ``[User!]!``.
+
+    Args:
+        ref: Type reference (``kind``, ``name``, ``ofType``)
+
+    Returns:
+        GraphQL type notation
+    """
+    if ref["kind"] == "NON_NULL":
+        return type_string(ref["ofType"]) + "!"
+    if ref["kind"] == "LIST":
+        return f"[{type_string(ref['ofType'])}]"
+    return ref["name"]
+
+
+def named_type(ref: Dict[str, Any]) -> str:
+    """Return the name of the type a reference wraps in lists and non-nulls."""
+    while ref.get("ofType") is not None and ref.get("name") is None:
+        ref = ref["ofType"]
+    return ref["name"]
+
+
+class Schema:
+    """GraphQL schema built from an introspection result."""
+
+    def __init__(self, introspection: Dict[str, Any], version: Optional[str] = None):
+        """
+        Initialize a Schema.
+
+        Args:
+            introspection: ``data`` of the introspection query
+            version: Schema version reported by the server, if any
+        """
+        self.introspection = introspection
+        self.version = version
+        schema = introspection["__schema"]
+        self.types: Dict[str, Dict[str, Any]] = {t["name"]: t for t in schema["types"]}
+        self.roots = {
+            "query": (schema.get("queryType") or {}).get("name"),
+            "mutation": (schema.get("mutationType") or {}).get("name"),
+            "subscription": (schema.get("subscriptionType") or {}).get("name"),
+        }
+        self._fields: Dict[str, Dict[str, Dict[str, Any]]] = {
+            name: {f["name"]: f for f in t.get("fields") or []} for name, t in self.types.items()
+        }
+        canonical = json.dumps(introspection, sort_keys=True, separators=(",", ":"))
+        self.hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        self._validated: "OrderedDict[Tuple[str, Optional[str]], List[str]]" = OrderedDict()
+
+    def field(self, type_name: str, field_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the introspection entry of a field.
+
+        Args:
+            type_name: Object or interface name
+            field_name: Field name
+
+        Returns:
+            Field entry (``name``, ``args``, ``type``), or None if there is no such field
+        """
+        return self._fields.get(type_name, {}).get(field_name)
+
+    def field_type(self, type_name: str, field_name: str) -> Optional[str]:
+        """
+        Return the type of a field in GraphQL notation, e.g. ``"[Issue!]!"``.
+
+        Args:
+            type_name: Object or interface name
+            field_name: Field name
+
+        Returns:
+            Type, or None if there is no such field
+        """
+        field = self.field(type_name, field_name)
+        return type_string(field["type"]) if field else None
+
+    def validate(
+        self, document: Union[str, Document], operation_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        Check an operation against the schema.
+
+        Checks that selected fields exist on their types, that arguments are
+        known and required ones are given, that leaf and composite fields have
+        (or lack) selection sets, and that fragment type conditions exist.
+        Results of the most recently validated documents and operations are
+        remembered.
+
+        Args:
+            document: Query string or parsed document
+            operation_name: Operation to check
+
+        Returns:
+            Error messages (empty if the operation is valid)
+        """
+        if isinstance(document, str):
+            document = parse(document)
+        key = (document.source, operation_name)
+        errors = self._validated.get(key)
+        if errors is not None:
+            try:
+                self._validated.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread in the meantime
+                pass
+        else:
+            errors = []
+            operation = document.operation(operation_name)
+            root = self.roots.get(operation.kind)
+            if root is None:
+                errors.append(f"Schema does not support {operation.kind} operations")
+            else:
+                self._check(root, document.selections(operation_name), errors, root=True)
+            self._validated[key] = errors
+            if len(self._validated) > VALIDATION_CACHE_SIZE:
+                self._validated.popitem(last=False)
+        return errors
+
+    def _check(
+        self, parent: str, selections: List[Any], errors: List[str], root: bool = False
+    ) -> None:
+        for selection in selections:
+            if not isinstance(selection, Field):
+                condition = selection.type_condition or parent
+                if condition not in self.types:
+                    errors.append(f"Unknown type {condition!r}")
+                else:
+                    self._check(condition, selection.selections, errors, root)
+                continue
+
+            if selection.name == "__typename" or (root and selection.name in _ROOT_META_FIELDS):
+                continue
+            field = self.field(parent, selection.name)
+            if field is None:
+                errors.append(f"Cannot query field {selection.name!r} on type {parent!r}")
+                continue
+
+            given = {name for name, _ in selection.arguments}
+            arguments = {argument["name"]: argument for argument in field["args"]}
+            for name in given - arguments.keys():
+                errors.append(f"Unknown argument {name!r} on field '{parent}.{selection.name}'")
+            for name, argument in arguments.items():
+                required = argument["type"]["kind"] == "NON_NULL"
+                if required and argument.get("defaultValue") is None and name not in given:
+                    errors.append(
+                        f"Field '{parent}.{selection.name}' argument {name!r} of type "
+                        f"{type_string(argument['type'])!r} is required"
+                    )
+
+            type_name = named_type(field["type"])
+            composite = self.types.get(type_name, {}).get("kind") in _COMPOSITE
+            if composite and selection.selections is None:
+                errors.append(
+                    f"Field {selection.name!r} of type {type_string(field['type'])!r} "
+                    "must have a selection of subfields"
+                )
+            elif not composite and selection.selections is not None:
+                errors.append(
+                    f"Field {selection.name!r} must not have a selection since type "
+                    f"{type_string(field['type'])!r} has no subfields"
+                )
+            elif composite:
+                self._check(type_name, selection.selections, errors)
+
+    def decode(
+        self,
+        document: Union[str, Document],
+        data: Dict[str, Any],
+        operation_name: Optional[str] = None,
+        scalars: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Convert custom scalar values of a result using the schema's field types.
+
+        Args:
+            document: Query string or parsed document the result answers
+            data: The result's ``data``
+            operation_name: Operation that produced the result
+            scalars: Decoders by scalar name, added to (or replacing) `DEFAULT_SCALARS`
+
+        Returns:
+            New ``data`` with decoded scalars
+        """
+        if isinstance(document, str):
+            document = parse(document)
+        decoders = {**DEFAULT_SCALARS, **(scalars or {})}
+        root = self.roots[document.operation(operation_name).kind]
+        return self._decode_object(root, document.selections(operation_name), data, decoders)
+
+    def _decode_object(
+        self,
+        parent: str,
+        selections: List[Any],
+        data: Dict[str, Any],
+        decoders: Dict[str, Callable[[Any], Any]],
+    ) -> Dict[str, Any]:
+        result = dict(data)
+        typename = data.get("__typename", parent)
+        for selection in selections:
+            if not isinstance(selection, Field):
+                condition = selection.type_condition or parent
+                if condition == typename or typename in self._possible_types(condition):
+                    result.update(
+                        self._decode_object(condition, selection.selections, data, decoders)
+                    )
+                continue
+            field = self.field(typename, selection.name) or self.field(parent, selection.name)
+            if field is None or selection.response_key not in data:
+                continue
+            type_name = named_type(field["type"])
+            result[selection.response_key] = self._decode_value(
+                type_name, selection, data[selection.response_key], decoders
+            )
+        return result
+
+    def _decode_value(
+        self,
+        type_name: str,
+        selection: Field,
+        value: Any,
+        decoders: Dict[str, Callable[[Any], Any]],
+    ) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [self._decode_value(type_name, selection, item, decoders) for item in value]
+        if selection.selections is not None and isinstance(value, dict):
+            return self._decode_object(type_name, selection.selections, value, decoders)
+        decoder = decoders.get(type_name)
+        return decoder(value) if decoder else value
+
+    def _possible_types(self, type_name: str) -> List[str]:
+        return [t["name"] for t in self.types.get(type_name, {}).get("possibleTypes") or []]
+
+
+def introspected_schema(response: Response, version_header: Optional[str] = None) -> Schema:
+    """
+    Build a Schema from the response to `INTROSPECTION_QUERY`.
+
+    Args:
+        response: Response to the introspection query
+        version_header: Response header carrying the schema version
+
+    Returns:
+        Schema
+
+    Raises:
+        HTTPError: If the response has an error status
+        GraphQLError: If the result has no schema, e.g. introspection is disabled
+    """
+    response.raise_for_status()
+    result = response.json()
+    data = result.get("data") or {}
+    if not data.get("__schema"):
+        errors = result.get("errors") or []
+        message = "; ".join(str(error.get("message", error)) for error in errors)
+        raise GraphQLError(message or "Introspection returned no schema", errors)
+    version = response.headers.get(version_header.lower()) if version_header else None
+    return Schema(data, version)
+
+
+def schema_changed(
+    response: Response, schema: Schema, version_header: Optional[str] = None
+) -> bool:
+    """
+    Tell whether a response signals that the endpoint's schema changed.
+
+    That is when it reports a schema version other than the cached one, or
+    when the server rejected a query that passed validation against the cache.
+
+    Args:
+        response: Response to a query validated against the schema
+        schema: Cached schema
+        version_header: Response header carrying the schema version
+
+    Returns:
+        True if the schema should be introspected again
+    """
+    if version_header:
+        version = response.headers.get(version_header.lower())
+        if version is not None and version != schema.version:
+            return True
+    # Streamed bodies are left unread
+    return response.is_stream_consumed and VALIDATION_FAILED in response.content
+
+
+def validation_error(errors: List[str]) -> GraphQLValidationError:
+    """Build the exception raised for a query that fails validation."""
+    return GraphQLValidationError("; ".join(errors), [{"message": error} for error in errors])
+
+
+def default_cache_dir() -> str:
+    """
+    Return the directory schemas are cached in by default.
+
+    ``$INTEGRATES_CACHE_DIR/graphql`` if set, else ``integrates/graphql`` in
+    ``$XDG_CACHE_HOME`` or ``~/.cache``.
+    """
+    base = os.environ.get("INTEGRATES_CACHE_DIR")
+    if base is None:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "integrates")
+    return os.path.join(base, "graphql")
+
+
+class SchemaStore:
+    """
+    Schemas cached on disk, one file per endpoint and schema hash.
+
+    Files are named ``<endpoint key>.<schema hash>.json``; saving a new schema
+    for an endpoint removes the files of its previous schemas.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize a SchemaStore.
+
+        Args:
+            directory: Cache directory (defaults to `default_cache_dir`)
+        """
+        self.directory = directory or default_cache_dir()
+
+    @staticmethod
+    def endpoint_key(endpoint: str) -> str:
+        """Return the file name prefix for an endpoint."""
+        return hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:16]
+
+    def _files(self, endpoint: str) -> List[str]:
+        prefix = self.endpoint_key(endpoint) + "."
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        paths = [
+            os.path.join(self.directory, name)
+            for name in names
+            if name.startswith(prefix) and name.endswith(".json")
+        ]
+        return sorted(paths, key=os.path.getmtime, reverse=True)
+
+    def load(self, endpoint: str) -> Optional[Schema]:
+        """
+        Load the most recently saved schema of an endpoint.
+
+        Args:
+            endpoint: GraphQL endpoint URL
+
+        Returns:
+            Schema, or None if none is cached (or the file is unreadable)
+        """
+        for path in self._files(endpoint):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    stored = json.load(file)
+                return Schema(stored["introspection"], stored.get("version"))
+            except (OSError, ValueError, KeyError):
+                continue
+        return None
+
+    def save(self, endpoint: str, schema: Schema) -> str:
+        """
+        Save a schema, replacing older schemas of the endpoint.
+
+        Args:
+            endpoint: GraphQL endpoint URL
+            schema: Schema to save
+
+        Returns:
+            Path of the schema file
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.endpoint_key(endpoint)}.{schema.hash}.json")
+        stale = [other for other in self._files(endpoint) if other != path]
+        stored = {
+            "endpoint": endpoint,
+            "version": schema.version,
+            "introspection": schema.introspection,
+        }
+        # Write to a temporary file first so readers never see a partial schema
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(temporary, path)
+        for other in stale:
+            try:
+                os.remove(other)
+            except OSError:
+                pass
+        return path
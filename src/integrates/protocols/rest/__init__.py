@@ -2,9 +2,24 @@
 REST protocol adapter for Integrates.
 """
 
+from integrates.protocols.rest.batching import BatchEndpoint, Batcher
 from integrates.protocols.rest.client import AsyncRestClient, RestClient
+from integrates.protocols.rest.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PagePagination,
+    Paginator,
+)
 
 __all__ = [
     "RestClient",
     "AsyncRestClient",
+    "BatchEndpoint",
+    "Batcher",
+    "Paginator",
+    "CursorPagination",
+    "PagePagination",
+    "OffsetPagination",
+    "LinkHeaderPagination",
 ]
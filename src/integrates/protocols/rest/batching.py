@@ -0,0 +1,183 @@
+"""
+Automatic batching of single-item lookups into bulk requests.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from integrates.core.response import Response
+from integrates.protocols.rest.pagination import dig
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from integrates.core.client import AsyncClient
+
+
+def ids_body(keys: List[str]) -> Dict[str, Any]:
+    """Default bulk request: ``{"ids": [...]}`` as a JSON body."""
+    return {"json": {"ids": keys}}
+
+
+class BatchEndpoint:
+    """
+    Bulk endpoint that fetches many items of a resource in one request.
+
+    ``request`` turns the collected keys into request arguments and ``split``
+    maps the parsed bulk response back to one item per key. By default the
+    keys are sent as ``{"ids": [...]}`` and the response items (at
+    ``items_path``) are matched on their ``id_field``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "POST",
+        request: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+        split: Optional[Callable[[Any, List[str]], Dict[str, Any]]] = None,
+        items_path: Optional[str] = None,
+        id_field: str = "id",
+        max_size: int = 100,
+        window: float = 0.005,
+    ):
+        """
+        Initialize a BatchEndpoint.
+
+        Args:
+            url: Bulk endpoint URL, relative to the client's base URL (``"items:batchGet"``
+                style custom methods are supported)
+            method: HTTP method of the bulk request
+            request: Build the request arguments (``json``, ``params``, ...) for a list of keys
+            split: Map the parsed bulk response and its keys to ``{key: item}``
+            items_path: Dotted path to the item list in the response (None for the body itself)
+            id_field: Item field matched against the keys by the default ``split``
+            max_size: Maximum number of keys per bulk request
+            window: Seconds to wait for more lookups after the first one of a batch
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ":" in url.split("/")[0] and "://" not in url:
+            # "items:batchGet" would otherwise be read as a URL scheme
+            url = f"./{url}"
+        self.url = url
+        self.method = method
+        self.request = request or ids_body
+        self.split = split or self._split_by_id
+        self.items_path = items_path
+        self.id_field = id_field
+        self.max_size = max_size
+        self.window = window
+
+    def _split_by_id(self, data: Any, keys: List[str]) -> Dict[str, Any]:
+        return {str(item[self.id_field]): item for item in dig(data, self.items_path) or []}
+
+
+class Batcher:
+    """
+    Collects lookups issued close together and sends them as bulk requests.
+
+    A batch is sent when ``window`` seconds have passed since its first lookup
+    or when it reaches ``max_size`` keys, whichever comes first. Duplicate keys
+    in a batch are requested once. Every caller gets a Response of its own: the
+    item as a JSON body with status 200, 404 if the bulk response did not
+    contain it, or the bulk response itself if that failed.
+    """
+
+    def __init__(self, client: "AsyncClient", endpoint: BatchEndpoint):
+        """
+        Initialize a Batcher.
+
+        Args:
+            client: Asynchronous client sending the bulk requests
+            endpoint: Bulk endpoint description
+        """
+        self.client = client
+        self.endpoint = endpoint
+        # Key mapped to the waiting callers and the URL each one looked up
+        self._pending: Dict[str, List[Tuple["asyncio.Future", str]]] = {}
+        self._timer: Optional["asyncio.TimerHandle"] = None
+        self._tasks: Set["asyncio.Task"] = set()
+
+    async def load(self, key: str, url: Optional[str] = None) -> Response:
+        """
+        Fetch one item as part of the next bulk request.
+
+        Args:
+            key: Item key
+            url: URL reported on the item's Response (relative ones are joined with
+                the client's base URL)
+
+        Returns:
+            Response for the item
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Item responses carry absolute URLs, like every other Response
+        url = self.client._url_resolver.resolve(url or key)
+        self._pending.setdefault(key, []).append((future, url))
+
+        if len(self._pending) >= self.endpoint.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.endpoint.window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Send the lookups collected so far without waiting for the window to pass."""
+        import asyncio
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._send(batch))
+        # Keep a reference so the task is not garbage collected while it runs
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: Dict[str, List[Tuple["asyncio.Future", str]]]) -> None:
+        keys = list(batch)
+        try:
+            response = await self.client.request(
+                self.endpoint.method, self.endpoint.url, **self.endpoint.request(keys)
+            )
+            items = self.endpoint.split(response.json(), keys) if response.ok else None
+        except BaseException as exc:
+            for waiters in batch.values():
+                for future, _ in waiters:
+                    if not future.done():
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for key, waiters in batch.items():
+            for future, url in waiters:
+                if future.done():
+                    # The caller was cancelled while the batch was in flight
+                    continue
+                if items is None:
+                    future.set_result(response)
+                else:
+                    future.set_result(_item_response(response, url, key, items))
+
+
+def _item_response(bulk: Response, url: str, key: str, items: Dict[str, Any]) -> Response:
+    found = key in items
+    item = items.get(key)
+    return Response(
+        status_code=200 if found else 404,
+        headers={"content-type": "application/json"} if found else {},
+        content=json.dumps(item).encode("utf-8") if found else b"",
+        url=url,
+        request_info={"method": "GET", "url": url, "batch": bulk.request_info},
+        encoding="utf-8",
+        elapsed=bulk.elapsed,
+    )
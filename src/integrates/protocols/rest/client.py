@@ -2,12 +2,16 @@
 REST client implementation.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from integrates.auth.base import Auth
 from integrates.core.client import AsyncClient, Client
+from integrates.core.prepared import AsyncPreparedRequest, PreparedRequest
 from integrates.core.response import Response
 from integrates.middleware.base import Middleware
+from integrates.protocols.rest.batching import BatchEndpoint, Batcher
+from integrates.protocols.rest.pagination import Paginator, aiter_items, get_paginator, iter_items
+from integrates.utils.url import join_path
 
 
 class RestClient(Client):
@@ -86,6 +90,8 @@ class AsyncRestClient(AsyncClient):
             verify=verify,
             **kwargs,
         )
+        # Resource path mapped to the batcher combining its item GETs
+        self._batchers: Dict[str, Batcher] = {}
 
     def resource(self, path: str) -> "AsyncResourceClient":
         """
@@ -99,6 +105,27 @@ class AsyncRestClient(AsyncClient):
         """
         return AsyncResourceClient(self, path)
 
+    def batch(self, path: str, endpoint: Union[str, BatchEndpoint], **options) -> Batcher:
+        """
+        Combine GETs of single items of a resource into bulk requests.
+
+        Once enabled, ``resource(path)(item_id).get()`` calls issued close
+        together are sent as one request to the bulk endpoint, and each caller
+        receives a Response holding its own item.
+
+        Args:
+            path: Resource path, e.g. ``"items"``
+            endpoint: Bulk endpoint URL (e.g. ``"items:batchGet"``) or a BatchEndpoint
+            **options: BatchEndpoint arguments when ``endpoint`` is a URL
+
+        Returns:
+            Batcher, whose ``load(item_id)`` can also be awaited directly
+        """
+        if isinstance(endpoint, str):
+            endpoint = BatchEndpoint(endpoint, **options)
+        batcher = self._batchers[path.strip("/")] = Batcher(self, endpoint)
+        return batcher
+
 
 class ResourceClient:
     """Client for a specific REST resource."""
@@ -139,9 +166,21 @@ class ResourceClient:
         Returns:
             Complete URL
         """
-        if path:
-            return f"{self.path}/{path.lstrip('/')}"
-        return self.path
+        return join_path(self.path, path)
+
+    def prepare(self, method: str, path: Optional[str] = None, **kwargs) -> PreparedRequest:
+        """
+        Prepare a request to the resource for repeated sending.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: Additional path
+            **kwargs: Additional keyword arguments passed to the client's ``prepare``
+
+        Returns:
+            Immutable prepared request
+        """
+        return self.client.prepare(method, self._url(path), **kwargs)
 
     def get(self, path: Optional[str] = None, **kwargs) -> Response:
         """
@@ -208,6 +247,60 @@ class ResourceClient:
         """
         return self.client.delete(self._url(path), **kwargs)
 
+    def iter_records(
+        self, path: Optional[str] = None, format: str = "ndjson", **kwargs
+    ) -> Iterator[Any]:
+        """
+        Stream a GET response and parse its records incrementally.
+
+        Args:
+            path: Additional path
+            format: ``"ndjson"`` (or ``"jsonl"``) or ``"csv"``
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Iterator over records
+        """
+        with self.get(path, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            yield from response.iter_records(format)
+
+    def paginate(
+        self,
+        pagination: Union[str, Paginator],
+        path: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = 4,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items of a paginated collection.
+
+        Pages are fetched ahead of consumption: the next page is requested while
+        the caller processes the current one, and when the first page reports a
+        total, remaining pages are fetched in parallel.
+
+        Args:
+            pagination: ``"cursor"``, ``"page"``, ``"offset"``, ``"link"`` or a Paginator
+            path: Additional path
+            params: Query parameters for the first page
+            concurrency: Maximum number of pages fetched at the same time
+            max_pages: Maximum number of pages to fetch
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Iterator over items
+        """
+        url = self._url(path)
+
+        def fetch(page_url: Optional[str], page_params: Optional[Dict[str, Any]]) -> Response:
+            response = self.client.get(page_url or url, params=page_params, **kwargs)
+            response.raise_for_status()
+            return response
+
+        return iter_items(fetch, get_paginator(pagination), params, concurrency, max_pages)
+
     def resource(self, path: str) -> "ResourceClient":
         """
         Create a sub-resource client.
@@ -260,14 +353,44 @@ class AsyncResourceClient:
         Returns:
             Complete URL
         """
-        if path:
-            return f"{self.path}/{path.lstrip('/')}"
-        return self.path
+        return join_path(self.path, path)
+
+    def prepare(self, method: str, path: Optional[str] = None, **kwargs) -> AsyncPreparedRequest:
+        """
+        Prepare a request to the resource for repeated sending.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: Additional path
+            **kwargs: Additional keyword arguments passed to the client's ``prepare``
+
+        Returns:
+            Immutable prepared request
+        """
+        return self.client.prepare(method, self._url(path), **kwargs)
+
+    def batch(self, endpoint: Union[str, BatchEndpoint], **options) -> Batcher:
+        """
+        Combine GETs of single items of this resource into bulk requests.
+
+        See `AsyncRestClient.batch`.
+
+        Args:
+            endpoint: Bulk endpoint URL or a BatchEndpoint
+            **options: BatchEndpoint arguments when ``endpoint`` is a URL
+
+        Returns:
+            Batcher for this resource
+        """
+        return self.client.batch(self.path, endpoint, **options)
 
     async def get(self, path: Optional[str] = None, **kwargs) -> Response:
         """
         Make a GET request to the resource.
 
+        A plain GET of an item whose collection has batching enabled is sent
+        as part of a bulk request.
+
         Args:
             path: Additional path
             **kwargs: Additional keyword arguments to pass to the underlying transport
@@ -275,6 +398,11 @@ class AsyncResourceClient:
         Returns:
             Response
         """
+        if path is None and not kwargs:
+            collection, _, item_id = self.path.rpartition("/")
+            batcher = self.client._batchers.get(collection)
+            if batcher is not None:
+                return await batcher.load(item_id, self.path)
         return await self.client.get(self._url(path), **kwargs)
 
     async def post(self, path: Optional[str] = None, **kwargs) -> Response:
@@ -329,6 +457,63 @@ class AsyncResourceClient:
         """
         return await self.client.delete(self._url(path), **kwargs)
 
+    async def iter_records(
+        self, path: Optional[str] = None, format: str = "ndjson", **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a GET response and parse its records incrementally.
+
+        Args:
+            path: Additional path
+            format: ``"ndjson"`` (or ``"jsonl"``) or ``"csv"``
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Asynchronous iterator over records
+        """
+        async with await self.get(path, stream=True, **kwargs) as response:
+            if not response.ok:
+                await response.aread()
+            response.raise_for_status()
+            async for record in response.aiter_records(format):
+                yield record
+
+    def paginate(
+        self,
+        pagination: Union[str, Paginator],
+        path: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = 4,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over the items of a paginated collection.
+
+        Pages are fetched ahead of consumption: the next page is requested while
+        the caller processes the current one, and when the first page reports a
+        total, remaining pages are fetched in parallel.
+
+        Args:
+            pagination: ``"cursor"``, ``"page"``, ``"offset"``, ``"link"`` or a Paginator
+            path: Additional path
+            params: Query parameters for the first page
+            concurrency: Maximum number of pages fetched at the same time
+            max_pages: Maximum number of pages to fetch
+            **kwargs: Additional keyword arguments to pass to the underlying transport
+
+        Returns:
+            Asynchronous iterator over items
+        """
+        url = self._url(path)
+
+        async def fetch(page_url: Optional[str], page_params: Optional[Dict[str, Any]]) -> Response:
+            response = await self.client.get(page_url or url, params=page_params, **kwargs)
+            response.raise_for_status()
+            return response
+
+        return aiter_items(fetch, get_paginator(pagination), params, concurrency, max_pages)
+
     def resource(self, path: str) -> "AsyncResourceClient":
         """
         Create a sub-resource client.
@@ -0,0 +1,480 @@
+"""
+Pagination strategies and prefetching page iterators for REST resources.
+"""
+
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from integrates.core.response import Response
+
+if TYPE_CHECKING:
+    import asyncio
+
+# A page request: an explicit URL (None for the resource URL) and query parameters
+PageRequest = Tuple[Optional[str], Optional[Dict[str, Any]]]
+
+_LINK_RE = re.compile(r"<([^>]*)>\s*((?:;\s*[^;,]+)*)")
+_REL_RE = re.compile(r"""rel\s*=\s*"?([^";]+)"?""", re.IGNORECASE)
+
+
+def dig(data: Any, path: Optional[str]) -> Any:
+    """
+    Look up a dotted path such as ``meta.next_cursor`` in parsed JSON.
+
+    Args:
+        data: Parsed JSON document
+        path: Dotted path, or None for the document itself
+
+    Returns:
+        Value at the path, or None if any component is missing
+    """
+    if not path:
+        return data
+    for key in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def parse_link_header(value: str) -> Dict[str, str]:
+    """
+    Parse an RFC 5988 ``Link`` header into a mapping of relation to URL.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Mapping such as ``{"next": "...", "last": "..."}``
+    """
+    links = {}
+    for match in _LINK_RE.finditer(value):
+        rel = _REL_RE.search(match.group(2))
+        if rel:
+            for name in rel.group(1).split():
+                links[name.lower()] = match.group(1)
+    return links
+
+
+class Paginator(ABC):
+    """Base class for pagination strategies."""
+
+    # True if any page can be requested without fetching the previous one
+    indexable = False
+
+    def __init__(self, items_path: Optional[str] = None):
+        """
+        Initialize a Paginator.
+
+        Args:
+            items_path: Dotted path to the list of items in each page (None if the
+                page body is the list itself)
+        """
+        self.items_path = items_path
+
+    def first_request(self, params: Optional[Dict[str, Any]]) -> PageRequest:
+        """Return the request for the first page."""
+        return None, dict(params or {})
+
+    def items(self, response: Response) -> List[Any]:
+        """Return the items contained in a page."""
+        return dig(response.json(), self.items_path) or []
+
+    @abstractmethod
+    def next_request(
+        self, response: Response, request: PageRequest, items: List[Any]
+    ) -> Optional[PageRequest]:
+        """Return the request for the page after `response`, or None if it was the last."""
+
+    def total_pages(self, response: Response, request: PageRequest) -> Optional[int]:
+        """Return the total number of pages if the first page reports it."""
+        return None
+
+    def page_request(self, index: int, first: PageRequest) -> PageRequest:
+        """
+        Return the request for the page at zero-based `index`.
+
+        Raises:
+            TypeError: If the strategy cannot address pages directly (not ``indexable``)
+        """
+        raise TypeError(f"{type(self).__name__} cannot request pages by index")
+
+
+class CursorPagination(Paginator):
+    """Pagination that passes an opaque cursor from each page to the next."""
+
+    def __init__(
+        self,
+        cursor_param: str = "cursor",
+        cursor_path: str = "next_cursor",
+        items_path: Optional[str] = "items",
+    ):
+        """
+        Initialize CursorPagination.
+
+        Args:
+            cursor_param: Query parameter carrying the cursor
+            cursor_path: Dotted path to the next cursor in each page
+            items_path: Dotted path to the list of items in each page
+        """
+        super().__init__(items_path)
+        self.cursor_param = cursor_param
+        self.cursor_path = cursor_path
+
+    def next_request(
+        self, response: Response, request: PageRequest, items: List[Any]
+    ) -> Optional[PageRequest]:
+        """Return the request carrying the next cursor."""
+        cursor = dig(response.json(), self.cursor_path)
+        if not cursor or not items:
+            return None
+        return request[0], {**(request[1] or {}), self.cursor_param: cursor}
+
+
+class PagePagination(Paginator):
+    """Pagination by page number."""
+
+    indexable = True
+
+    def __init__(
+        self,
+        page_param: str = "page",
+        size_param: Optional[str] = "per_page",
+        page_size: Optional[int] = None,
+        start: int = 1,
+        items_path: Optional[str] = "items",
+        total_path: Optional[str] = None,
+        total_pages_path: Optional[str] = None,
+    ):
+        """
+        Initialize PagePagination.
+
+        Args:
+            page_param: Query parameter carrying the page number
+            size_param: Query parameter carrying the page size
+            page_size: Page size to request (omitted if None)
+            start: Number of the first page
+            items_path: Dotted path to the list of items in each page
+            total_path: Dotted path to the total number of items, if reported
+            total_pages_path: Dotted path to the total number of pages, if reported
+        """
+        super().__init__(items_path)
+        self.page_param = page_param
+        self.size_param = size_param
+        self.page_size = page_size
+        self.start = start
+        self.total_path = total_path
+        self.total_pages_path = total_pages_path
+
+    def first_request(self, params: Optional[Dict[str, Any]]) -> PageRequest:
+        """Return the request for the first page."""
+        params = dict(params or {})
+        params.setdefault(self.page_param, self.start)
+        if self.size_param and self.page_size:
+            params.setdefault(self.size_param, self.page_size)
+        return None, params
+
+    def _size(self, request: PageRequest) -> Optional[int]:
+        size = (request[1] or {}).get(self.size_param) if self.size_param else None
+        return int(size) if size else self.page_size
+
+    def next_request(
+        self, response: Response, request: PageRequest, items: List[Any]
+    ) -> Optional[PageRequest]:
+        """Return the request for the next page number."""
+        size = self._size(request)
+        if not items or (size and len(items) < size):
+            return None
+        params = dict(request[1] or {})
+        params[self.page_param] = int(params[self.page_param]) + 1
+        return request[0], params
+
+    def total_pages(self, response: Response, request: PageRequest) -> Optional[int]:
+        """Return the total number of pages if the first page reports it."""
+        data = response.json()
+        if self.total_pages_path:
+            total_pages = dig(data, self.total_pages_path)
+            return int(total_pages) if total_pages is not None else None
+        size = self._size(request)
+        if self.total_path and size:
+            total = dig(data, self.total_path)
+            return math.ceil(int(total) / size) if total is not None else None
+        return None
+
+    def page_request(self, index: int, first: PageRequest) -> PageRequest:
+        """Return the request for the page at zero-based `index`."""
+        params = dict(first[1] or {})
+        params[self.page_param] = int(params[self.page_param]) + index
+        return first[0], params
+
+
+class OffsetPagination(Paginator):
+    """Pagination by item offset and limit."""
+
+    indexable = True
+
+    def __init__(
+        self,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        limit: int = 100,
+        items_path: Optional[str] = "items",
+        total_path: Optional[str] = None,
+    ):
+        """
+        Initialize OffsetPagination.
+
+        Args:
+            offset_param: Query parameter carrying the offset
+            limit_param: Query parameter carrying the page size
+            limit: Page size to request
+            items_path: Dotted path to the list of items in each page
+            total_path: Dotted path to the total number of items, if reported
+        """
+        super().__init__(items_path)
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.limit = limit
+        self.total_path = total_path
+
+    def first_request(self, params: Optional[Dict[str, Any]]) -> PageRequest:
+        """Return the request for the first page."""
+        params = dict(params or {})
+        params.setdefault(self.offset_param, 0)
+        params.setdefault(self.limit_param, self.limit)
+        return None, params
+
+    def next_request(
+        self, response: Response, request: PageRequest, items: List[Any]
+    ) -> Optional[PageRequest]:
+        """Return the request for the next offset."""
+        params = dict(request[1] or {})
+        limit = int(params[self.limit_param])
+        if len(items) < limit:
+            return None
+        params[self.offset_param] = int(params[self.offset_param]) + limit
+        return request[0], params
+
+    def total_pages(self, response: Response, request: PageRequest) -> Optional[int]:
+        """Return the total number of pages if the first page reports the item total."""
+        if not self.total_path:
+            return None
+        total = dig(response.json(), self.total_path)
+        if total is None:
+            return None
+        params = request[1] or {}
+        remaining = int(total) - int(params[self.offset_param])
+        return max(1, math.ceil(remaining / int(params[self.limit_param])))
+
+    def page_request(self, index: int, first: PageRequest) -> PageRequest:
+        """Return the request for the page at zero-based `index`."""
+        params = dict(first[1] or {})
+        params[self.offset_param] = int(params[self.offset_param]) + index * int(
+            params[self.limit_param]
+        )
+        return first[0], params
+
+
+class LinkHeaderPagination(Paginator):
+    """Pagination that follows the ``rel="next"`` URL of an RFC 5988 ``Link`` header."""
+
+    def next_request(
+        self, response: Response, request: PageRequest, items: List[Any]
+    ) -> Optional[PageRequest]:
+        """Return the request for the URL linked as next."""
+        header = next(
+            (value for name, value in response.headers.items() if name.lower() == "link"), None
+        )
+        next_url = parse_link_header(header).get("next") if header else None
+        if not next_url:
+            return None
+        return next_url, None
+
+
+PAGINATORS = {
+    "cursor": CursorPagination,
+    "page": PagePagination,
+    "offset": OffsetPagination,
+    "link": LinkHeaderPagination,
+}
+
+
+def get_paginator(pagination: Union[str, Paginator]) -> Paginator:
+    """
+    Resolve a pagination style name or instance.
+
+    Args:
+        pagination: ``"cursor"``, ``"page"``, ``"offset"``, ``"link"`` or a Paginator
+
+    Returns:
+        Paginator instance
+
+    Raises:
+        ValueError: If the style name is unknown
+    """
+    if isinstance(pagination, Paginator):
+        return pagination
+    try:
+        return PAGINATORS[pagination]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown pagination style {pagination!r}; expected one of {sorted(PAGINATORS)}"
+        ) from None
+
+
+def _page_limit(total: Optional[int], max_pages: Optional[int]) -> Optional[int]:
+    if total is None:
+        return max_pages
+    return min(total, max_pages) if max_pages is not None else total
+
+
+def iter_items(
+    fetch: Callable[[Optional[str], Optional[Dict[str, Any]]], Response],
+    paginator: Paginator,
+    params: Optional[Dict[str, Any]] = None,
+    concurrency: int = 4,
+    max_pages: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Yield items from successive pages, fetching ahead in worker threads.
+
+    The next page is requested before the items of the current one are
+    yielded. When the first page reports a total and the strategy can address
+    pages directly, the remaining pages are fetched in parallel with at most
+    `concurrency` requests in flight, and items are still yielded in order.
+
+    Args:
+        fetch: Function sending a page request and returning its response
+        paginator: Pagination strategy
+        params: Query parameters for the first page
+        concurrency: Maximum number of pages fetched at the same time
+        max_pages: Maximum number of pages to fetch
+
+    Returns:
+        Iterator over items
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if max_pages is not None and max_pages < 1:
+        return
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    pending: Deque = deque()
+    try:
+        first = paginator.first_request(params)
+        response = fetch(*first)
+        total = paginator.total_pages(response, first) if paginator.indexable else None
+        limit = _page_limit(total, max_pages)
+
+        if total is not None:
+            next_index = 1
+            while True:
+                while len(pending) < concurrency and next_index < limit:
+                    request = paginator.page_request(next_index, first)
+                    pending.append(executor.submit(fetch, *request))
+                    next_index += 1
+                yield from paginator.items(response)
+                if not pending:
+                    return
+                response = pending.popleft().result()
+
+        request = first
+        fetched = 1
+        while True:
+            items = paginator.items(response)
+            next_request = paginator.next_request(response, request, items)
+            if next_request is not None and (limit is None or fetched < limit):
+                pending.append(executor.submit(fetch, *next_request))
+                fetched += 1
+            yield from items
+            if not pending:
+                return
+            response = pending.popleft().result()
+            request = next_request
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_items(
+    fetch: Callable[[Optional[str], Optional[Dict[str, Any]]], Awaitable[Response]],
+    paginator: Paginator,
+    params: Optional[Dict[str, Any]] = None,
+    concurrency: int = 4,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """
+    Yield items from successive pages, fetching ahead in background tasks.
+
+    Asynchronous counterpart of `iter_items`.
+
+    Args:
+        fetch: Coroutine function sending a page request and returning its response
+        paginator: Pagination strategy
+        params: Query parameters for the first page
+        concurrency: Maximum number of pages fetched at the same time
+        max_pages: Maximum number of pages to fetch
+
+    Returns:
+        Asynchronous iterator over items
+    """
+    import asyncio
+
+    if max_pages is not None and max_pages < 1:
+        return
+    pending: "Deque[asyncio.Task]" = deque()
+    try:
+        first = paginator.first_request(params)
+        response = await fetch(*first)
+        total = paginator.total_pages(response, first) if paginator.indexable else None
+        limit = _page_limit(total, max_pages)
+
+        if total is not None:
+            next_index = 1
+            while True:
+                while len(pending) < concurrency and next_index < limit:
+                    request = paginator.page_request(next_index, first)
+                    pending.append(asyncio.ensure_future(fetch(*request)))
+                    next_index += 1
+                for item in paginator.items(response):
+                    yield item
+                if not pending:
+                    return
+                response = await pending.popleft()
+
+        request = first
+        fetched = 1
+        while True:
+            items = paginator.items(response)
+            next_request = paginator.next_request(response, request, items)
+            if next_request is not None and (limit is None or fetched < limit):
+                pending.append(asyncio.ensure_future(fetch(*next_request)))
+                fetched += 1
+            for item in items:
+                yield item
+            if not pending:
+                return
+            response = await pending.popleft()
+            request = next_request
+    finally:
+        for task in pending:
+            task.cancel()
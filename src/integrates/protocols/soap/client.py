@@ -4,16 +4,50 @@ SOAP client implementation.
 This is a minimal SOAP client adapter providing basic SOAP protocol support.
 """
 
-import re
-import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional, Union
 
 from integrates.auth.base import Auth
+from integrates.core.body import ChainBody, StreamBody
 from integrates.core.client import AsyncClient, Client
 from integrates.core.response import Response
 from integrates.middleware.base import Middleware
 
 
+def _local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix ElementTree puts on qualified tags."""
+    return tag.rpartition("}")[2]
+
+
+def _streaming_envelope(
+    namespace: str, operation: str, op_namespace: str, params: Dict[str, Any]
+) -> ChainBody:
+    """
+    Build a SOAP envelope whose streaming parameter values are sent without buffering.
+
+    Streaming values are written into their element verbatim, so they must
+    already be XML-safe (e.g. base64-encoded attachments).
+    """
+    parts: List[Union[str, StreamBody]] = [
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{namespace}">
+    <soap:Header></soap:Header>
+    <soap:Body>
+        <{operation} xmlns="{op_namespace}">
+            """
+    ]
+    for key, value in params.items():
+        parts.extend(
+            [f"<{key}>", value if isinstance(value, StreamBody) else str(value), f"</{key}>"]
+        )
+    parts.append(
+        f"""
+        </{operation}>
+    </soap:Body>
+</soap:Envelope>"""
+    )
+    return ChainBody(parts)
+
+
 class SoapClient(Client):
     """SOAP client for making SOAP integrates."""
 
@@ -53,7 +87,9 @@ class SoapClient(Client):
         self.wsdl_url = wsdl_url
         self._wsdl_cache = None
 
-        # Register XML namespaces
+        # Register XML namespaces (ElementTree is only imported by SOAP clients)
+        import xml.etree.ElementTree as ET
+
         ET.register_namespace("soap", namespace)
         ET.register_namespace("xsi", "http://www.w3.org/2001/XMLSchema-instance")
         ET.register_namespace("xsd", "http://www.w3.org/2001/XMLSchema")
@@ -101,18 +137,22 @@ class SoapClient(Client):
         op_namespace = namespace or self.namespace
         params_xml = ""
 
-        if params:
-            for key, value in params.items():
-                # Simple conversion of parameters to XML
-                # For complex types, this would need enhancement
-                params_xml += f"<{key}>{value}</{key}>"
-
-        operation_xml = f"""<{operation} xmlns="{op_namespace}">
+        if params and any(isinstance(value, StreamBody) for value in params.values()):
+            # Stream large values instead of building the whole envelope in memory
+            body = {"content": _streaming_envelope(self.namespace, operation, op_namespace, params)}
+        else:
+            if params:
+                for key, value in params.items():
+                    # Simple conversion of parameters to XML
+                    # For complex types, this would need enhancement
+                    params_xml += f"<{key}>{value}</{key}>"
+
+            operation_xml = f"""<{operation} xmlns="{op_namespace}">
             {params_xml}
         </{operation}>"""
 
-        # Create full SOAP envelope
-        soap_envelope = self._create_envelope(operation_xml)
+            # Create full SOAP envelope
+            body = {"data": self._create_envelope(operation_xml)}
 
         # Set up headers
         headers = kwargs.pop("headers", {})
@@ -123,7 +163,7 @@ class SoapClient(Client):
 
         # Send the request
         response = self.post(
-            "", data=soap_envelope, headers=headers, **kwargs  # We use base_url as the endpoint
+            "", headers=headers, **body, **kwargs  # We use base_url as the endpoint
         )
 
         return response
@@ -139,6 +179,8 @@ class SoapClient(Client):
         Returns:
             Extracted data as a dictionary
         """
+        import xml.etree.ElementTree as ET
+
         # Parse the XML response
         root = ET.fromstring(response.content)
         result = {}
@@ -155,11 +197,11 @@ class SoapClient(Client):
         # Convert elements to dictionary
         for element in elements:
             # Remove namespace prefixes for cleaner keys
-            tag = re.sub(r"\{.*?\}", "", element.tag)
+            tag = _local_name(element.tag)
 
             if len(element) > 0:
                 # Element has children, recursively process them
-                result[tag] = {re.sub(r"\{.*?\}", "", child.tag): child.text for child in element}
+                result[tag] = {_local_name(child.tag): child.text for child in element}
             else:
                 # Leaf element
                 result[tag] = element.text
@@ -206,7 +248,9 @@ class AsyncSoapClient(AsyncClient):
         self.wsdl_url = wsdl_url
         self._wsdl_cache = None
 
-        # Register XML namespaces
+        # Register XML namespaces (ElementTree is only imported by SOAP clients)
+        import xml.etree.ElementTree as ET
+
         ET.register_namespace("soap", namespace)
         ET.register_namespace("xsi", "http://www.w3.org/2001/XMLSchema-instance")
         ET.register_namespace("xsd", "http://www.w3.org/2001/XMLSchema")
@@ -254,17 +298,21 @@ class AsyncSoapClient(AsyncClient):
         op_namespace = namespace or self.namespace
         params_xml = ""
 
-        if params:
-            for key, value in params.items():
-                # Simple conversion of parameters to XML
-                params_xml += f"<{key}>{value}</{key}>"
+        if params and any(isinstance(value, StreamBody) for value in params.values()):
+            # Stream large values instead of building the whole envelope in memory
+            body = {"content": _streaming_envelope(self.namespace, operation, op_namespace, params)}
+        else:
+            if params:
+                for key, value in params.items():
+                    # Simple conversion of parameters to XML
+                    params_xml += f"<{key}>{value}</{key}>"
 
-        operation_xml = f"""<{operation} xmlns="{op_namespace}">
+            operation_xml = f"""<{operation} xmlns="{op_namespace}">
             {params_xml}
         </{operation}>"""
 
-        # Create full SOAP envelope
-        soap_envelope = self._create_envelope(operation_xml)
+            # Create full SOAP envelope
+            body = {"data": self._create_envelope(operation_xml)}
 
         # Set up headers
         headers = kwargs.pop("headers", {})
@@ -275,7 +323,7 @@ class AsyncSoapClient(AsyncClient):
 
         # Send the request
         response = await self.post(
-            "", data=soap_envelope, headers=headers, **kwargs  # We use base_url as the endpoint
+            "", headers=headers, **body, **kwargs  # We use base_url as the endpoint
         )
 
         return response
@@ -291,6 +339,8 @@ class AsyncSoapClient(AsyncClient):
         Returns:
             Extracted data as a dictionary
         """
+        import xml.etree.ElementTree as ET
+
         # Parse the XML response
         root = ET.fromstring(response.content)
         result = {}
@@ -307,11 +357,11 @@ class AsyncSoapClient(AsyncClient):
         # Convert elements to dictionary
         for element in elements:
             # Remove namespace prefixes for cleaner keys
-            tag = re.sub(r"\{.*?\}", "", element.tag)
+            tag = _local_name(element.tag)
 
             if len(element) > 0:
                 # Element has children, recursively process them
-                result[tag] = {re.sub(r"\{.*?\}", "", child.tag): child.text for child in element}
+                result[tag] = {_local_name(child.tag): child.text for child in element}
             else:
                 # Leaf element
                 result[tag] = element.text
@@ -1,3 +1,11 @@
 """
 Utility functions for Integrates.
 """
+
+from integrates.utils.url import URLResolver, expand_path, join_path
+
+__all__ = [
+    "URLResolver",
+    "expand_path",
+    "join_path",
+]
@@ -0,0 +1,39 @@
+"""
+Lazy attribute loading for package namespaces.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, Tuple[str, Optional[str]]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` functions that import on first access.
+
+    Args:
+        package: Name of the package defining the attributes
+        attributes: Attribute name mapped to ``(module, name in module)``; a name
+            of None exposes the module itself
+
+    Returns:
+        ``(__getattr__, __dir__)`` pair to assign in the package's ``__init__``
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        module = importlib.import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+        # Later lookups find the attribute directly and skip this function
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,369 @@
+"""
+Incremental record decoders for streamed response bodies.
+"""
+
+import codecs
+import csv
+import io
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+
+
+class RecordDecoder(ABC):
+    """
+    Base class for push-style record decoders.
+
+    Bytes are fed in arbitrary chunks as they arrive from the network; every
+    call returns the records completed so far. Partial records are kept until
+    the rest of them arrives, so memory is bounded by the chunk size plus the
+    longest record.
+    """
+
+    @abstractmethod
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Decode a chunk of the body.
+
+        Args:
+            chunk: Next chunk of bytes
+
+        Returns:
+            Records completed by this chunk
+        """
+
+    @abstractmethod
+    def close(self) -> List[Any]:
+        """
+        Finish decoding at the end of the body.
+
+        Returns:
+            Records still held in the buffer
+        """
+
+
+class NDJSONDecoder(RecordDecoder):
+    """Decoder for newline-delimited JSON (NDJSON / JSON Lines)."""
+
+    def __init__(self):
+        """Initialize an NDJSONDecoder."""
+        self._pending: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Decode a chunk of the body."""
+        if b"\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+
+        lines = chunk.split(b"\n")
+        if self._pending:
+            self._pending.append(lines[0])
+            lines[0] = b"".join(self._pending)
+        tail = lines.pop()
+        self._pending = [tail] if tail else []
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def close(self) -> List[Any]:
+        """Finish decoding at the end of the body."""
+        line = b"".join(self._pending)
+        self._pending = []
+        return [json.loads(line)] if line.strip() else []
+
+
+class CSVDecoder(RecordDecoder):
+    """
+    Decoder for CSV bodies.
+
+    Quoted fields may span lines and chunk boundaries: a row is only parsed
+    once the quotes seen so far are balanced.
+    """
+
+    def __init__(self, encoding: str = "utf-8", header: bool = True, **fmtparams):
+        """
+        Initialize a CSVDecoder.
+
+        Args:
+            encoding: Text encoding of the body
+            header: Treat the first row as field names and return dictionaries
+            **fmtparams: Formatting parameters for `csv.reader` (delimiter, quotechar, ...)
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        self._header = header
+        self._fieldnames: Optional[List[str]] = None
+        self._fmtparams = fmtparams
+        self._quotechar = fmtparams.get("quotechar", '"')
+        self._buffer = ""
+
+    def _rows(self, text: str) -> List[Any]:
+        rows = list(csv.reader(io.StringIO(text, newline=""), **self._fmtparams))
+        if not self._header:
+            return [row for row in rows if row]
+        if self._fieldnames is None and rows:
+            self._fieldnames = rows.pop(0)
+        return [dict(zip(self._fieldnames, row)) for row in rows if row]
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Decode a chunk of the body."""
+        text = self._buffer + self._decoder.decode(chunk)
+
+        # Cut after the last newline at which the quotes are balanced
+        if self._quotechar not in text:
+            cut = text.rfind("\n") + 1
+            self._buffer = text[cut:]
+            return self._rows(text[:cut]) if cut else []
+
+        cut = 0
+        quotes = 0
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            if end == -1:
+                break
+            quotes += text.count(self._quotechar, start, end)
+            start = end + 1
+            if quotes % 2 == 0:
+                cut = start
+
+        self._buffer = text[cut:]
+        return self._rows(text[:cut]) if cut else []
+
+    def close(self) -> List[Any]:
+        """Finish decoding at the end of the body."""
+        text = self._buffer + self._decoder.decode(b"", final=True)
+        self._buffer = ""
+        return self._rows(text) if text.strip() else []
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_KEY = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*', re.S)
+_STRUCTURE = re.compile(r'["{}\[\]]')
+# Loose on purpose: skipped scalars are not validated, only stepped over
+_SCALAR = re.compile(r"[-+0-9.eE]+|[a-z]+")
+
+
+class JSONItemDecoder(RecordDecoder):
+    """
+    Decoder that yields the values found at a path inside one large JSON document.
+
+    The path uses dotted keys, with ``item`` standing for every element of an
+    array: ``data.item`` yields each element of ``{"data": [...]}`` and ``item``
+    each element of a top-level array. Only the element being parsed is held in
+    memory; everything outside the path is skipped as it streams past.
+    """
+
+    def __init__(self, path: str = "item", encoding: str = "utf-8"):
+        """
+        Initialize a JSONItemDecoder.
+
+        Args:
+            path: Dotted path of the values to yield
+            encoding: Text encoding of the body
+        """
+        self._target: Tuple[str, ...] = tuple(path.split(".")) if path else ()
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        self._buffer = ""
+        self._pos = 0
+        # One [kind, key] frame per open container; arrays use the key "item"
+        self._stack: List[List[str]] = []
+        self._state = "value"
+        self._skipping = False
+        self._skip_depth = 0
+        self._skip_in_string = False
+        # Text of the target element being captured, and where it starts in the buffer
+        self._parts: Optional[List[str]] = None
+        self._start = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Decode a chunk of the body."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish decoding at the end of the body."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError("Incomplete JSON document")
+        return items
+
+    def _error(self) -> ValueError:
+        return ValueError(f"Invalid JSON near {self._buffer[self._pos : self._pos + 20]!r}")
+
+    def _decode_captured(self, buffer: str) -> Any:
+        text = "".join(self._parts) + buffer[self._start : self._pos]
+        self._parts = None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON element near {text[:20]!r}") from None
+
+    def _after_value(self) -> None:
+        self._state = "comma_or_end" if self._stack else "done"
+
+    def _skip(self) -> bool:
+        """Advance over a value being skipped; return True once it is complete."""
+        buffer = self._buffer
+        while True:
+            if self._skip_in_string:
+                end = _STRING_REST.match(buffer, self._pos).end()
+                if end == len(buffer) or buffer[end] != '"':
+                    self._pos = end
+                    return False
+                self._pos = end + 1
+                self._skip_in_string = False
+            if self._skip_depth == 0:
+                return True
+            match = _STRUCTURE.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                return False
+            self._pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_in_string = True
+            elif char in "{[":
+                self._skip_depth += 1
+            else:
+                self._skip_depth -= 1
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        target = self._target
+        while True:
+            if self._skipping:
+                if not self._skip():
+                    if self._parts is not None:
+                        # Only the new text is scanned; the element is decoded once it closes
+                        self._parts.append(buffer[self._start : self._pos])
+                        self._start = 0
+                    break
+                self._skipping = False
+                if self._parts is not None:
+                    items.append(self._decode_captured(buffer))
+                self._after_value()
+                continue
+
+            self._pos = _WHITESPACE.match(buffer, self._pos).end()
+            if self._pos == len(buffer):
+                break
+            char = buffer[self._pos]
+            state = self._state
+
+            if state == "value":
+                path = tuple(frame[1] for frame in self._stack)
+                if path == target and char not in '{["':
+                    match = _SCALAR.match(buffer, self._pos)
+                    if match is None:
+                        raise self._error()
+                    if match.end() == len(buffer) and not final:
+                        # A number or literal may continue in the next chunk
+                        break
+                    try:
+                        items.append(json.loads(match.group()))
+                    except json.JSONDecodeError:
+                        raise self._error() from None
+                    self._pos = match.end()
+                    self._after_value()
+                elif path == target:
+                    # Find the end of the element with the skip scanner, then decode it
+                    self._parts = []
+                    self._start = self._pos
+                    self._skipping = True
+                    self._skip_depth = 0 if char == '"' else 1
+                    self._skip_in_string = char == '"'
+                    self._pos += 1
+                elif char in "{[" and path == target[: len(path)]:
+                    self._stack.append([char, "item" if char == "[" else ""])
+                    self._pos += 1
+                    self._state = "value_or_end" if char == "[" else "key_or_end"
+                elif char in "{[":
+                    self._skipping = True
+                    self._skip_depth = 1
+                    self._pos += 1
+                elif char == '"':
+                    self._skipping = True
+                    self._skip_depth = 0
+                    self._skip_in_string = True
+                    self._pos += 1
+                else:
+                    match = _SCALAR.match(buffer, self._pos)
+                    if match is None:
+                        raise self._error()
+                    if match.end() == len(buffer) and not final:
+                        break
+                    self._pos = match.end()
+                    self._after_value()
+            elif state == "value_or_end":
+                if char == "]":
+                    self._stack.pop()
+                    self._pos += 1
+                    self._after_value()
+                else:
+                    self._state = "value"
+            elif state in ("key_or_end", "key"):
+                if char == "}" and state == "key_or_end":
+                    self._stack.pop()
+                    self._pos += 1
+                    self._after_value()
+                elif char == '"':
+                    match = _KEY.match(buffer, self._pos)
+                    if match is None:
+                        break
+                    self._stack[-1][1] = json.loads(match.group())
+                    self._pos = match.end()
+                    self._state = "colon"
+                else:
+                    raise self._error()
+            elif state == "colon":
+                if char != ":":
+                    raise self._error()
+                self._pos += 1
+                self._state = "value"
+            elif state == "comma_or_end":
+                frame = self._stack[-1]
+                if char == ",":
+                    self._pos += 1
+                    self._state = "value" if frame[0] == "[" else "key"
+                elif char == ("]" if frame[0] == "[" else "}"):
+                    self._stack.pop()
+                    self._pos += 1
+                    self._after_value()
+                else:
+                    raise self._error()
+            else:
+                raise self._error()
+
+        return items
+
+
+def get_record_decoder(format: str, encoding: Optional[str] = None, **options) -> RecordDecoder:
+    """
+    Create a decoder for a record format.
+
+    Args:
+        format: ``"ndjson"`` (or ``"jsonl"``), ``"csv"`` or ``"json"`` (values at
+            the ``path`` option inside a single JSON document)
+        encoding: Text encoding of the body (CSV and JSON)
+        **options: Options for the decoder
+
+    Returns:
+        Record decoder
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if format in ("ndjson", "jsonl"):
+        return NDJSONDecoder()
+    if format == "csv":
+        return CSVDecoder(encoding=encoding or "utf-8", **options)
+    if format == "json":
+        return JSONItemDecoder(encoding=encoding or "utf-8", **options)
+    raise ValueError(
+        f"Unknown record format {format!r}; expected 'ndjson', 'jsonl', 'csv' or 'json'"
+    )
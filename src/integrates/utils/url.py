@@ -0,0 +1,133 @@
+"""
+URL resolution helpers with caching.
+"""
+
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+_formatter = Formatter()
+
+
+def _plain(url: str) -> bool:
+    """Return True if the URL has no whitespace or control characters."""
+    return " " not in url and url.isprintable()
+
+
+class URLResolver:
+    """
+    Resolve request URLs against a base URL.
+
+    The base URL is parsed once. Resolved URLs are kept in an LRU cache, so a
+    URL that has been seen before costs a single dictionary lookup. Results are
+    identical to ``urllib.parse.urljoin(base_url, url)``.
+    """
+
+    def __init__(self, base_url: str = "", maxsize: int = 1024):
+        """
+        Initialize a URLResolver.
+
+        Args:
+            base_url: Base URL that relative URLs are resolved against
+            maxsize: Maximum number of resolved URLs to cache
+        """
+        self.base_url = base_url
+        parts = urlsplit(base_url)
+        self._origin = f"{parts.scheme}://{parts.netloc}" if parts.netloc else None
+        # Directory of the base path: relative paths replace its last segment
+        self._directory = parts.path[: parts.path.rfind("/") + 1] or "/"
+        # urljoin strips whitespace and control characters and collapses empty
+        # segments of the base path; such bases always go through urljoin
+        self._simple_base = (
+            bool(self._origin)
+            and _plain(base_url)
+            and not parts.query
+            and not parts.fragment
+            and ";" not in parts.path
+            and "//" not in parts.path
+            and not ({".", ".."} & set(parts.path.split("/")))
+        )
+        self.resolve = lru_cache(maxsize=maxsize)(self._resolve)
+
+    def _resolve(self, url: str) -> str:
+        if not url:
+            return self.base_url
+        if not self.base_url or "://" in url:
+            return urljoin(self.base_url, url)
+
+        if (
+            self._simple_base
+            and not any(char in url for char in "?#:;")
+            and "//" not in url
+            and _plain(url)
+        ):
+            segments = url.split("/")
+            if "." not in segments and ".." not in segments:
+                if url[0] == "/":
+                    return self._origin + url
+                return self._origin + self._directory + url
+
+        return urljoin(self.base_url, url)
+
+    def expand(self, template: str, path_params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Fill a path template such as ``users/{id}/orders`` and resolve it.
+
+        Values are percent-encoded as single path segments.
+
+        Args:
+            template: Path template with ``{name}`` placeholders
+            path_params: Values for the placeholders
+
+        Returns:
+            Resolved URL
+        """
+        return self.resolve(expand_path(template, path_params or {}))
+
+
+@lru_cache(maxsize=256)
+def _parse_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    return tuple((literal, field) for literal, field, _, _ in _formatter.parse(template))
+
+
+def expand_path(template: str, path_params: Dict[str, Any]) -> str:
+    """
+    Fill a path template such as ``users/{id}/orders``.
+
+    The template is parsed once and cached. Values are percent-encoded as
+    single path segments, so they cannot inject extra ``/`` or ``?``.
+
+    Args:
+        template: Path template with ``{name}`` placeholders
+        path_params: Values for the placeholders
+
+    Returns:
+        Expanded path
+
+    Raises:
+        KeyError: If a placeholder has no value
+    """
+    parts = []
+    for literal, field in _parse_template(template):
+        parts.append(literal)
+        if field is not None:
+            parts.append(quote(str(path_params[field]), safe=""))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def join_path(base: str, path: Optional[str] = None) -> str:
+    """
+    Append a sub-path to a resource path.
+
+    Args:
+        base: Resource path without surrounding slashes
+        path: Additional path
+
+    Returns:
+        Combined path
+    """
+    if path:
+        return f"{base}/{path.lstrip('/')}"
+    return base
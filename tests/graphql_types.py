@@ -0,0 +1,21 @@
+"""Builders for introspection results used by the GraphQL schema and cost tests."""
+
+
+def named(kind, name):
+    return {"kind": kind, "name": name, "ofType": None}
+
+
+def non_null(ref):
+    return {"kind": "NON_NULL", "name": None, "ofType": ref}
+
+
+def list_of(ref):
+    return {"kind": "LIST", "name": None, "ofType": ref}
+
+
+def field(name, ref, args=()):
+    return {"name": name, "type": ref, "args": list(args)}
+
+
+def argument(name, ref, default=None):
+    return {"name": name, "type": ref, "defaultValue": default}
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import httpx
@@ -107,9 +108,62 @@ class TestAsyncClient:
 
     async def test_client_context_manager(self):
         """Test that the async client can be used as a context manager."""
-        with patch("httpx.AsyncClient.aclose") as mock_close:
+        response = httpx.Response(200, request=httpx.Request("GET", "https://api.example.com"))
+        with patch("httpx.AsyncClient.aclose") as mock_close, patch(
+            "httpx.AsyncClient.request", return_value=response
+        ):
             async with AsyncClient() as client:
                 assert client is not None
+                # The transport only exists once a request has been made
+                await client.get("https://api.example.com")
 
             # Verify client.close() was called
             mock_close.assert_called_once()
+
+    @patch("httpx.AsyncClient.request")
+    async def test_prepared_request(self, mock_request):
+        """Test that an async prepared request can be sent repeatedly."""
+        mock_request.return_value = httpx.Response(
+            status_code=200,
+            content=b"",
+            request=httpx.Request("GET", "https://api.example.com/poll"),
+        )
+
+        async with AsyncClient(base_url="https://api.example.com") as client:
+            prepared = client.prepare("GET", "poll", params={"since": 0})
+            await prepared.send()
+            await prepared.send(params={"cursor": "abc"})
+
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]["url"] == "https://api.example.com/poll"
+        assert mock_request.call_args[1]["params"] == {"since": 0, "cursor": "abc"}
+
+    async def test_warmup_opens_connections(self, local_server):
+        """Test that an async warmup opens pooled connections reused by later requests."""
+        base_url = f"http://127.0.0.1:{local_server.server_port}"
+        async with AsyncClient(base_url=base_url) as client:
+            warmed = await client.warmup(connections=2)
+
+            assert warmed == {base_url: 2}
+            assert len(local_server.connections) == 2
+
+            await client.get("/status")
+            assert len(local_server.connections) == 2
+
+    async def test_keep_warm(self):
+        """Test that an async keep-warm task runs until the client is closed."""
+        client = AsyncClient(base_url="https://api.example.com")
+        rounds = asyncio.Event()
+
+        async def fake_warm(*args):
+            rounds.set()
+            return {}
+
+        with patch("integrates.core.warmup.awarm", side_effect=fake_warm):
+            await client.warmup(keep_warm=True, interval=0.01)
+            await asyncio.wait_for(rounds.wait(), 1.0)
+            task = client._keep_warm
+            await client.close()
+
+        await asyncio.sleep(0)
+        assert task.cancelled()
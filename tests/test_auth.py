@@ -1,12 +1,19 @@
 import base64
-from unittest.mock import MagicMock
+import hashlib
+import io
+import time
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from integrates.auth.api_key import ApiKeyAuth, ApiKeyLocation
 from integrates.auth.basic import BasicAuth
 from integrates.auth.bearer import BearerAuth
 from integrates.auth.oauth2 import OAuth2
+from integrates.auth.signing import HMACAuth, hash_body
+from integrates.auth.token_store import FileTokenStore, MemoryTokenStore, Token
+from integrates.core.client import Client
 
 
 class TestAuth:
@@ -91,3 +98,196 @@ class TestAuth:
         # Verify the headers were modified correctly
         assert "Authorization" in signed_headers
         assert signed_headers["Authorization"] == "Bearer oauth-token"
+
+    def test_oauth2_fetches_token_with_client_credentials(self):
+        """Test that OAuth2 fetches a token from the token endpoint when it has none."""
+        token_response = httpx.Response(
+            200,
+            json={"access_token": "fresh-token", "token_type": "Bearer", "expires_in": 3600},
+            request=httpx.Request("POST", "https://auth.example.com/token"),
+        )
+
+        with patch("httpx.post", return_value=token_response) as mock_post:
+            oauth_auth = OAuth2(
+                token_url="https://auth.example.com/token",
+                client_id="client",
+                client_secret="secret",
+            )
+            first = oauth_auth.sign("GET", "https://api.example.com", {})
+            second = oauth_auth.sign("GET", "https://api.example.com", {})
+
+        assert first["Authorization"] == "Bearer fresh-token"
+        assert second["Authorization"] == "Bearer fresh-token"
+        mock_post.assert_called_once()
+        assert mock_post.call_args[1]["data"]["grant_type"] == "client_credentials"
+
+    def test_oauth2_shares_token_through_file_store(self, tmp_path):
+        """Test that OAuth2 instances sharing a FileTokenStore only fetch one token."""
+        store = FileTokenStore(str(tmp_path))
+        token_response = httpx.Response(
+            200,
+            json={"access_token": "shared-token", "expires_in": 3600},
+            request=httpx.Request("POST", "https://auth.example.com/token"),
+        )
+
+        with patch("httpx.post", return_value=token_response) as mock_post:
+            workers = [
+                OAuth2(token_url="https://auth.example.com/token", client_id="c", token_store=store)
+                for _ in range(3)
+            ]
+            signed = [worker.sign("GET", "https://api.example.com", {}) for worker in workers]
+
+        mock_post.assert_called_once()
+        assert all(headers["Authorization"] == "Bearer shared-token" for headers in signed)
+        assert (
+            FileTokenStore(str(tmp_path)).get(workers[0].store_key).access_token == "shared-token"
+        )
+
+    def test_file_token_store_default_directory_is_per_user(self, tmp_path, monkeypatch):
+        """Test that tokens are kept in the user's runtime directory by default."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        store = FileTokenStore()
+
+        assert store.directory == str(tmp_path / "integrates-tokens")
+        assert (tmp_path / "integrates-tokens").stat().st_mode & 0o777 == 0o700
+
+    def test_file_token_store_refuses_shared_directory(self, tmp_path):
+        """Test that a directory other users can access is not used for tokens."""
+        shared = tmp_path / "shared"
+        shared.mkdir(mode=0o777)
+        shared.chmod(0o777)
+
+        with pytest.raises(PermissionError):
+            FileTokenStore(str(shared))
+
+    def test_oauth2_async_refresh_does_not_block(self):
+        """Test that asign fetches the token with an asynchronous HTTP client."""
+        import asyncio
+
+        token_response = httpx.Response(
+            200,
+            json={"access_token": "async-token", "expires_in": 3600},
+            request=httpx.Request("POST", "https://auth.example.com/token"),
+        )
+        oauth_auth = OAuth2(token_url="https://auth.example.com/token", client_id="c")
+
+        async def run():
+            return await asyncio.gather(
+                *(oauth_auth.asign("GET", "https://api.example.com", {}) for _ in range(3))
+            )
+
+        with patch("httpx.post") as mock_post, patch(
+            "httpx.AsyncClient.post", return_value=token_response
+        ) as mock_async_post:
+            signed = asyncio.run(run())
+
+        mock_post.assert_not_called()
+        mock_async_post.assert_called_once()
+        assert all(headers["Authorization"] == "Bearer async-token" for headers in signed)
+
+    def test_async_client_uses_asign(self):
+        """Test that AsyncClient signs through the asynchronous auth path."""
+        import asyncio
+
+        from integrates.core.client import AsyncClient
+
+        class AsyncOnlyAuth(BearerAuth):
+            # Not reusable, so prepared requests sign on every send
+            reusable = False
+
+            def sign(self, method, url, headers, body=None):
+                raise AssertionError("sign must not be called by AsyncClient")
+
+            async def asign(self, method, url, headers, body=None):
+                return {**headers, "Authorization": "Bearer async"}
+
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200)
+
+        async def run():
+            async with AsyncClient(
+                base_url="https://api.example.com",
+                auth=AsyncOnlyAuth("unused"),
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                await client.get("/items")
+                await client.prepare("GET", "/items").send()
+
+        asyncio.run(run())
+        assert [r.headers["Authorization"] for r in received] == ["Bearer async"] * 2
+
+    def test_oauth2_refreshes_expired_token(self):
+        """Test that an expired token in the store triggers a refresh."""
+        store = MemoryTokenStore()
+        oauth_auth = OAuth2(token_url="https://auth.example.com/token", token_store=store)
+        store.set(oauth_auth.store_key, Token("stale", expires_at=time.time() - 1))
+        token_response = httpx.Response(
+            200,
+            json={"access_token": "renewed", "expires_in": 60},
+            request=httpx.Request("POST", "https://auth.example.com/token"),
+        )
+
+        with patch("httpx.post", return_value=token_response) as mock_post:
+            signed = oauth_auth.sign("GET", "https://api.example.com", {})
+
+        mock_post.assert_called_once()
+        assert signed["Authorization"] == "Bearer renewed"
+        assert store.get(oauth_auth.store_key).access_token == "renewed"
+
+    def test_hmac_auth_signing_key_is_derived_once(self):
+        """Test that HMACAuth derives the documented SigV4 key and caches it."""
+        hmac_auth = HMACAuth(
+            access_key="AKID",
+            secret_key="wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+            region="us-east-1",
+            service="iam",
+        )
+
+        key = hmac_auth.signing_key("20120215")
+
+        assert key.hex() == "f4780e2d9f65fa895f9c67b32ce1baf0b0d8a43505a000a1a9e090d414db404d"
+        assert hmac_auth.signing_key("20120215") is key
+
+    def test_hmac_auth_signs_body_hash(self):
+        """Test that HMACAuth adds the content hash and an Authorization header."""
+        hmac_auth = HMACAuth(access_key="AKID", secret_key="secret", region="eu", service="api")
+
+        signed_headers = hmac_auth.sign("POST", "https://api.example.com/items?b=2&a=1", {}, b"{}")
+
+        assert signed_headers["X-Amz-Content-Sha256"] == hashlib.sha256(b"{}").hexdigest()
+        assert signed_headers["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=AKID/")
+        assert (
+            "SignedHeaders=host;x-amz-content-sha256;x-amz-date" in signed_headers["Authorization"]
+        )
+
+    def test_hmac_auth_hashes_file_body_without_consuming_it(self):
+        """Test that file bodies are hashed incrementally and rewound."""
+        body = io.BytesIO(b"x" * 200_000)
+
+        assert hash_body(body, chunk_size=1024) == hashlib.sha256(b"x" * 200_000).hexdigest()
+        assert body.tell() == 0
+        assert hash_body(chunk for chunk in [b"a"]) is None
+
+    @patch("httpx.Client.request")
+    def test_client_passes_serialised_body_to_signing_auth(self, mock_request):
+        """Test that the client serialises JSON once and signs the exact bytes sent."""
+        mock_request.return_value = httpx.Response(
+            200, request=httpx.Request("POST", "https://api.example.com/items")
+        )
+        hmac_auth = HMACAuth(access_key="AKID", secret_key="secret", region="eu", service="api")
+
+        client = Client(base_url="https://api.example.com", auth=hmac_auth)
+        client.post("/items", json={"name": "widget"}, params={"dry_run": "1"})
+
+        sent = mock_request.call_args[1]
+        assert sent["json"] is None
+        assert sent["params"] is None
+        assert sent["url"] == "https://api.example.com/items?dry_run=1"
+        assert (
+            sent["headers"]["X-Amz-Content-Sha256"] == hashlib.sha256(sent["content"]).hexdigest()
+        )
+        assert sent["headers"]["Content-Type"] == "application/json"
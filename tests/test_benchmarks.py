@@ -0,0 +1,104 @@
+import subprocess
+import sys
+from urllib.parse import urljoin
+
+import httpx
+import pytest
+
+from integrates.core.client import Client
+from integrates.protocols.graphql.document import Document, build_payload
+from integrates.utils.url import URLResolver
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.performance
+
+BASE_URL = "https://api.example.com/v1/"
+
+
+class TestURLBenchmarks:
+    def test_urljoin_baseline(self, benchmark):
+        """Benchmark the previous urljoin-per-request path."""
+        result = benchmark(urljoin, BASE_URL, "users/123/orders")
+        assert result == "https://api.example.com/v1/users/123/orders"
+
+    def test_cached_resolver(self, benchmark):
+        """Benchmark resolving a repeated URL through the cached resolver."""
+        resolver = URLResolver(BASE_URL)
+        result = benchmark(resolver.resolve, "users/123/orders")
+        assert result == "https://api.example.com/v1/users/123/orders"
+
+    def test_cached_template(self, benchmark):
+        """Benchmark expanding and resolving a path template."""
+        resolver = URLResolver(BASE_URL)
+        result = benchmark(resolver.expand, "users/{id}/orders", {"id": 123})
+        assert result == "https://api.example.com/v1/users/123/orders"
+
+
+class TestImportBenchmarks:
+    @staticmethod
+    def import_in_subprocess(statement):
+        subprocess.run([sys.executable, "-c", statement], check=True)
+
+    def test_interpreter_baseline(self, benchmark):
+        """Benchmark starting an interpreter without importing anything."""
+        benchmark(self.import_in_subprocess, "pass")
+
+    def test_import_package(self, benchmark):
+        """Benchmark a bare ``import integrates`` in a fresh interpreter."""
+        benchmark(self.import_in_subprocess, "import integrates")
+
+    def test_import_rest_client(self, benchmark):
+        """Benchmark importing only the REST client in a fresh interpreter."""
+        benchmark(self.import_in_subprocess, "from integrates import RestClient")
+
+
+class TestClientBenchmarks:
+    def test_construct_client(self, benchmark):
+        """Benchmark creating a client, which defers building its transport."""
+        benchmark(Client, base_url=BASE_URL)
+
+    def test_construct_transport(self, benchmark):
+        """Benchmark creating a client and its transport with a shared SSL context."""
+
+        def construct():
+            client = Client(base_url=BASE_URL)
+            client._client
+            client.close()
+
+        benchmark(construct)
+
+    def test_construct_transport_unshared(self, benchmark):
+        """Benchmark the previous behaviour: a new SSL context for every transport."""
+
+        def construct():
+            httpx.Client(verify=True).close()
+
+        benchmark(construct)
+
+
+QUERY = """
+query Repository($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    ...RepositoryFields
+    issues(first: 50, states: [OPEN]) {
+      edges { node { id title author { login } labels(first: 10) { nodes { name } } } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+
+fragment RepositoryFields on Repository { id name description stargazerCount }
+"""
+
+
+class TestGraphQLDocumentBenchmarks:
+    def test_parse_document(self, benchmark):
+        """Benchmark parsing and minifying a query that has not been seen before."""
+        result = benchmark(lambda: Document(QUERY).print())
+        assert len(result) < len(QUERY)
+
+    def test_cached_payload(self, benchmark):
+        """Benchmark building the payload of a query that was sent before."""
+        result = benchmark(build_payload, QUERY, {"owner": "o", "name": "n"})
+        assert result["operationName"] == "Repository"
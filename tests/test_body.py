@@ -0,0 +1,205 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from integrates.core.body import ChainBody, FileBody, GeneratorBody, MmapBody, StreamBody
+from integrates.core.client import AsyncClient, Client
+from integrates.middleware.retry import RetryMiddleware
+from integrates.protocols.soap import SoapClient
+
+
+def recording_transport(received, statuses=None):
+    """Build a transport that records request bodies and replies with the given statuses."""
+    statuses = list(statuses or [])
+
+    def handler(request):
+        received.append((request.headers.copy(), request.read()))
+        return httpx.Response(statuses.pop(0) if statuses else 200)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def payload_file(tmp_path):
+    path = tmp_path / "payload.bin"
+    path.write_bytes(bytes(range(256)) * 1000)
+    return path
+
+
+class TestStreamBodies:
+    def test_file_body_reiterable(self, payload_file):
+        """Test that a FileBody yields the whole file on every iteration."""
+        body = FileBody(payload_file, chunk_size=1000)
+
+        assert body.length == 256000
+        assert b"".join(body) == payload_file.read_bytes()
+        assert b"".join(body) == payload_file.read_bytes()
+
+    def test_file_body_range(self, payload_file):
+        """Test that a FileBody can send part of a file."""
+        body = FileBody(payload_file, offset=10, length=5)
+
+        assert b"".join(body) == payload_file.read_bytes()[10:15]
+
+    def test_mmap_body_yields_views(self, payload_file):
+        """Test that an MmapBody yields memoryview slices of the file."""
+        body = MmapBody(payload_file, chunk_size=4096)
+        chunks = list(body)
+
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"".join(chunks) == payload_file.read_bytes()
+
+    def test_generator_body_calls_factory_per_iteration(self):
+        """Test that a GeneratorBody restarts its generator on every iteration."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            yield "a"
+            yield b"b"
+
+        body = GeneratorBody(factory)
+
+        assert b"".join(body) == b"ab"
+        assert b"".join(body) == b"ab"
+        assert len(calls) == 2
+        assert body.length is None
+
+    def test_stream_body_requires_iter(self):
+        """Test that a StreamBody subclass must define how to iterate over the body."""
+
+        class Incomplete(StreamBody):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_chain_body_length(self, payload_file):
+        """Test that a ChainBody concatenates parts and sums their lengths."""
+        body = ChainBody(["<a>", FileBody(payload_file, length=3), b"</a>"])
+
+        assert body.length == 10
+        assert b"".join(body) == b"<a>\x00\x01\x02</a>"
+
+
+class TestStreamingUploads:
+    def test_upload_file_with_content_length(self, payload_file):
+        """Test that a file body is sent with its Content-Length."""
+        received = []
+        client = Client(base_url="https://api.example.com", transport=recording_transport(received))
+
+        response = client.put("/upload", content=FileBody(payload_file))
+
+        assert response.status_code == 200
+        headers, body = received[0]
+        assert headers["Content-Length"] == "256000"
+        assert body == payload_file.read_bytes()
+
+    def test_upload_path(self, payload_file):
+        """Test that a path passed as content is streamed from disk."""
+        received = []
+        client = Client(base_url="https://api.example.com", transport=recording_transport(received))
+
+        client.put("/upload", content=payload_file)
+
+        assert received[0][1] == payload_file.read_bytes()
+
+    def test_upload_str_is_not_a_path(self, payload_file):
+        """Test that str content is sent as text even when it names a file."""
+        received = []
+        client = Client(base_url="https://api.example.com", transport=recording_transport(received))
+
+        client.put("/upload", content=str(payload_file))
+        client.put("/upload", content=FileBody(str(payload_file)))
+
+        assert received[0][1] == str(payload_file).encode()
+        assert received[1][1] == payload_file.read_bytes()
+
+    def test_upload_generator_chunked(self):
+        """Test that a body of unknown length is sent chunked."""
+        received = []
+        client = Client(base_url="https://api.example.com", transport=recording_transport(received))
+
+        client.post("/upload", content=GeneratorBody(lambda: iter([b"a", b"b"])))
+
+        headers, body = received[0]
+        assert headers["Transfer-Encoding"] == "chunked"
+        assert body == b"ab"
+
+    @patch("time.sleep")
+    def test_retry_resends_full_body(self, mock_sleep, payload_file):
+        """Test that a retried upload sends the whole body again."""
+        received = []
+        client = Client(
+            base_url="https://api.example.com",
+            middlewares=[RetryMiddleware(retries=2)],
+            transport=recording_transport(received, [500, 200]),
+        )
+
+        response = client.put("/upload", content=MmapBody(payload_file))
+
+        assert response.status_code == 200
+        assert len(received) == 2
+        assert received[0][1] == received[1][1] == payload_file.read_bytes()
+
+    @patch("time.sleep")
+    def test_retry_rewinds_file_object(self, mock_sleep, payload_file):
+        """Test that an open file object is rewound before a retry."""
+        received = []
+        client = Client(
+            base_url="https://api.example.com",
+            middlewares=[RetryMiddleware(retries=2)],
+            transport=recording_transport(received, [503, 200]),
+        )
+
+        with open(payload_file, "rb") as f:
+            client.put("/upload", content=f)
+
+        assert received[1][1] == payload_file.read_bytes()
+
+    def test_soap_streams_envelope(self, payload_file):
+        """Test that SOAP calls with streaming parameters send the envelope without buffering."""
+        received = []
+        client = SoapClient("https://api.example.com/soap", transport=recording_transport(received))
+
+        client.call("Upload", params={"name": "a.bin", "data": FileBody(payload_file, length=4)})
+
+        headers, body = received[0]
+        assert headers["Content-Length"] == str(len(body))
+        assert b"<name>a.bin</name><data>\x00\x01\x02\x03</data>" in body
+        assert body.endswith(b"</soap:Envelope>")
+
+
+@pytest.mark.asyncio
+class TestAsyncStreamingUploads:
+    async def test_upload_async_generator(self):
+        """Test that an AsyncClient streams an async generator body."""
+        received = []
+
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        client = AsyncClient(
+            base_url="https://api.example.com", transport=recording_transport(received)
+        )
+        await client.post("/upload", content=GeneratorBody(chunks))
+
+        assert received[0][1] == b"ab"
+
+    @patch("asyncio.sleep")
+    async def test_upload_file_retry(self, mock_sleep, payload_file):
+        """Test that an AsyncClient re-reads a file body when retrying."""
+        received = []
+        client = AsyncClient(
+            base_url="https://api.example.com",
+            middlewares=[RetryMiddleware(retries=2)],
+            transport=recording_transport(received, [500, 200]),
+        )
+
+        response = await client.put("/upload", content=FileBody(payload_file))
+
+        assert response.status_code == 200
+        assert received[0][0]["Content-Length"] == "256000"
+        assert received[0][1] == received[1][1] == payload_file.read_bytes()
@@ -1,10 +1,13 @@
 import datetime
+import threading
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from integrates.auth.bearer import BearerAuth
 from integrates.core.client import Client
+from integrates.core.tls import clear_ssl_contexts, get_ssl_context
 
 
 class TestClient:
@@ -119,9 +122,177 @@ class TestClient:
 
     def test_client_context_manager(self):
         """Test that the client can be used as a context manager."""
-        with patch("httpx.Client.close") as mock_close:
+        with patch("httpx.Client.close") as mock_close, patch("httpx.Client.request"):
             with Client() as client:
                 assert client is not None
+                # The transport only exists once a request has been made
+                client.get("https://api.example.com")
 
             # Verify client.close() was called
             mock_close.assert_called_once()
+
+    def test_transport_created_on_first_request(self):
+        """Test that the httpx client is only built when it is first needed."""
+        with patch.object(Client, "_http_class") as mock_httpx_client:
+            client = Client(base_url="https://api.example.com")
+            mock_httpx_client.assert_not_called()
+
+            client.get("/status")
+            client.get("/status")
+
+        mock_httpx_client.assert_called_once()
+
+    def test_closed_unused_client(self):
+        """Test that closing an unused client creates no transport and blocks later requests."""
+        with patch.object(Client, "_http_class") as mock_httpx_client:
+            client = Client(base_url="https://api.example.com")
+            client.close()
+
+            with pytest.raises(RuntimeError):
+                client.get("/status")
+
+        mock_httpx_client.assert_not_called()
+
+    def test_ssl_context_shared(self):
+        """Test that clients with the same TLS settings share one SSL context."""
+        clear_ssl_contexts()
+        with patch("httpx.create_ssl_context", wraps=httpx.create_ssl_context) as mock_create:
+            clients = [Client(base_url="https://api.example.com") for _ in range(3)]
+            for client in clients:
+                client._client
+            Client(verify=False)._client
+
+        assert mock_create.call_count == 2
+        assert get_ssl_context() is get_ssl_context(True)
+
+    def test_ssl_context_per_http_version(self):
+        """Test that HTTP/1.1 and HTTP/2 clients do not share a context's ALPN setting."""
+        clear_ssl_contexts()
+        assert get_ssl_context(http2=True) is not get_ssl_context(http2=False)
+        assert get_ssl_context(http2=True) is get_ssl_context(http2=True)
+
+    def test_ssl_context_unhashable_cert(self):
+        """Test that an unhashable cert builds an uncached context instead of failing."""
+        clear_ssl_contexts()
+        with patch("httpx.create_ssl_context") as mock_create:
+            get_ssl_context(cert={"certfile": "client.pem"})
+            get_ssl_context(cert={"certfile": "client.pem"})
+
+        assert mock_create.call_count == 2
+
+    @patch("httpx.Client.request")
+    def test_prepared_request_signs_once(self, mock_request):
+        """Test that a prepared request reuses its URL and signed headers."""
+        mock_request.return_value = httpx.Response(
+            200, request=httpx.Request("GET", "https://api.example.com/status")
+        )
+        client = Client(base_url="https://api.example.com", auth=BearerAuth("token"))
+
+        with patch.object(BearerAuth, "sign", wraps=client.auth.sign) as mock_sign:
+            prepared = client.prepare("GET", "/status", headers={"Accept": "application/json"})
+            prepared.send(params={"page": 1})
+            prepared.send(params={"page": 2})
+
+        mock_sign.assert_called_once()
+        assert mock_request.call_count == 2
+        sent = mock_request.call_args[1]
+        assert sent["url"] == "https://api.example.com/status"
+        assert sent["params"] == {"page": 2}
+        assert sent["headers"]["Authorization"] == "Bearer token"
+        assert prepared.headers["Accept"] == "application/json"
+
+    def test_prepared_request_is_immutable(self):
+        """Test that prepared requests cannot be modified."""
+        prepared = Client(base_url="https://api.example.com").prepare("GET", "/status")
+
+        with pytest.raises(AttributeError):
+            prepared.url = "https://other.example.com"
+        with pytest.raises(TypeError):
+            prepared.headers["X-Extra"] = "1"
+
+    @patch("httpx.Client.request")
+    def test_prepared_request_resigns_dynamic_auth(self, mock_request):
+        """Test that auth methods without static signatures are signed on every send."""
+        mock_request.return_value = httpx.Response(
+            200, request=httpx.Request("POST", "https://api.example.com/events")
+        )
+        mock_auth = MagicMock()
+        mock_auth.requires_body = False
+        mock_auth.reusable = False
+        mock_auth.sign.side_effect = lambda method, url, headers: {**headers, "X-Sig": "s"}
+
+        client = Client(base_url="https://api.example.com", auth=mock_auth)
+        prepared = client.prepare("POST", "/events")
+        prepared.send(json={"n": 1})
+        prepared.send(json={"n": 2})
+
+        assert mock_auth.sign.call_count == 2
+        assert mock_request.call_args[1]["json"] == {"n": 2}
+
+
+class TestWarmup:
+    def test_warmup_opens_connections(self, local_server):
+        """Test that warmup opens pooled connections reused by later requests."""
+        base_url = f"http://127.0.0.1:{local_server.server_port}"
+        with Client(base_url=base_url) as client:
+            warmed = client.warmup(connections=3)
+
+            assert warmed == {base_url: 3}
+            assert len(local_server.connections) == 3
+
+            client.get("/status")
+            assert len(local_server.connections) == 3
+
+    def test_warmup_ignores_unreachable_origins(self, local_server):
+        """Test that origins that cannot be reached are reported with zero connections."""
+        base_url = f"http://127.0.0.1:{local_server.server_port}"
+        with Client(base_url=base_url, timeout=1.0) as client:
+            warmed = client.warmup(["http://127.0.0.1:1/"])
+
+        assert warmed == {base_url: 1, "http://127.0.0.1:1/": 0}
+
+    def test_warmup_requires_target(self):
+        """Test that warmup needs a base URL or origins."""
+        with pytest.raises(ValueError):
+            Client().warmup()
+
+    def test_keep_warm(self):
+        """Test that keep-warm repeats the warm-up until stopped."""
+        client = Client(base_url="https://api.example.com")
+        rounds = threading.Event()
+
+        def fake_warm(*args):
+            rounds.set()
+            return {}
+
+        with patch("integrates.core.warmup.warm", side_effect=fake_warm):
+            client.warmup(keep_warm=True, interval=0.01)
+            assert rounds.wait(1.0)
+            thread = client._keep_warm
+            client.close()
+
+        thread.join(1.0)
+        assert not thread.is_alive()
+        assert client._keep_warm is None
+
+    def test_keep_warm_survives_errors(self, caplog):
+        """Test that a failing warm-up round is logged and the next round still runs."""
+        client = Client(base_url="https://api.example.com")
+        calls = []
+        recovered = threading.Event()
+
+        def fake_warm(*args):
+            calls.append(1)
+            # The first call is the immediate warm-up; the first background round fails
+            if len(calls) == 2:
+                raise RuntimeError("boom")
+            if len(calls) > 2:
+                recovered.set()
+            return {}
+
+        with patch("integrates.core.warmup.warm", side_effect=fake_warm):
+            client.warmup(keep_warm=True, interval=0.01)
+            assert recovered.wait(1.0)
+            client.close()
+
+        assert "Keep-warm round failed" in caplog.text
@@ -0,0 +1,202 @@
+import os
+import re
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from integrates.core.client import AsyncClient, Client
+from integrates.core.download import _DownloadState
+from integrates.core.exceptions import DownloadError, TransportError
+
+DATA = os.urandom(3 * 1024 * 1024 + 123)
+
+
+class RangeServer:
+    """Mock server for a single file, honouring Range and If-Range."""
+
+    def __init__(self, data=DATA, etag='"v1"', ranges=True, fail_at=None):
+        self.data = data
+        self.etag = etag
+        self.ranges = ranges
+        # Offset at which one response breaks off, simulating a dropped connection
+        self.fail_at = fail_at
+        self.requests = []
+        self.asynchronous = False
+
+    def handler(self, request):
+        self.requests.append(request)
+        size = len(self.data)
+        match = re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if_range = request.headers.get("If-Range")
+        if not self.ranges or not match or (if_range and if_range != self.etag):
+            return httpx.Response(200, headers={"ETag": self.etag}, content=self.data)
+
+        start, end = int(match.group(1)), min(int(match.group(2)), size - 1)
+        headers = {"ETag": self.etag, "Content-Range": f"bytes {start}-{end}/{size}"}
+        body = self.data[start : end + 1]
+        if self.fail_at is not None and start < self.fail_at <= end:
+            cut = self.fail_at - start
+            self.fail_at = None
+
+            def broken():
+                yield body[:cut]
+                raise httpx.ReadError("connection reset")
+
+            async def abroken():
+                for chunk in broken():
+                    yield chunk
+
+            content = abroken() if self.asynchronous else broken()
+            return httpx.Response(206, headers=headers, content=content)
+        return httpx.Response(206, headers=headers, content=body)
+
+    def client(self, cls=Client):
+        self.asynchronous = cls is AsyncClient
+        return cls(
+            base_url="https://files.example.com", transport=httpx.MockTransport(self.handler)
+        )
+
+
+class TestDownload:
+    def test_parallel_download(self, tmp_path):
+        """Test that a file is fetched in ranges and assembled correctly."""
+        server = RangeServer()
+        dest = tmp_path / "artifact.bin"
+
+        result = server.client().download("/artifact.bin", dest, parts=3)
+
+        assert dest.read_bytes() == DATA
+        assert result.size == result.downloaded == len(DATA)
+        assert result.etag == '"v1"'
+        assert result.throughput > 0
+        assert not result.resumed
+        ranges = sorted(r.headers["Range"] for r in server.requests[1:])
+        assert len(ranges) == 3
+        assert all(r.headers["If-Range"] == '"v1"' for r in server.requests[1:])
+        assert not os.path.exists(f"{dest}.part")
+        assert not os.path.exists(f"{dest}.part.json")
+
+    @patch("time.sleep")
+    def test_retry_continues_part(self, mock_sleep, tmp_path):
+        """Test that a dropped part is continued from the last written byte."""
+        server = RangeServer(fail_at=2 * 1024 * 1024)
+        dest = tmp_path / "artifact.bin"
+
+        result = server.client().download("/artifact.bin", dest, parts=3)
+
+        assert dest.read_bytes() == DATA
+        assert result.downloaded == len(DATA)
+        # The retry starts after the bytes already written, not at the start of the part
+        part_start = -(-len(DATA) // 3)
+        starts = [int(r.headers["Range"][6:].split("-")[0]) for r in server.requests[1:]]
+        assert len(starts) == 4
+        assert any(part_start < start <= 2 * 1024 * 1024 for start in starts)
+
+    def test_resume_after_failure(self, tmp_path):
+        """Test that a failed download resumes from its saved state."""
+        dest = tmp_path / "artifact.bin"
+        with pytest.raises(TransportError):
+            RangeServer(fail_at=len(DATA) - 10).client().download(
+                "/artifact.bin", dest, parts=3, retries=0
+            )
+        assert os.path.exists(f"{dest}.part.json")
+
+        result = RangeServer().client().download("/artifact.bin", dest, parts=3)
+
+        assert result.resumed
+        assert result.downloaded < len(DATA)
+        assert dest.read_bytes() == DATA
+
+    def test_changed_resource_restarts(self, tmp_path):
+        """Test that saved state for another version of the file is ignored."""
+        dest = tmp_path / "artifact.bin"
+        with pytest.raises(TransportError):
+            RangeServer(fail_at=len(DATA) - 10).client().download("/artifact.bin", dest, retries=0)
+
+        data = os.urandom(len(DATA))
+        result = RangeServer(data=data, etag='"v2"').client().download("/artifact.bin", dest)
+
+        assert not result.resumed
+        assert dest.read_bytes() == data
+
+    def test_change_during_download(self, tmp_path):
+        """Test that a resource changing between ranges is reported."""
+        server = RangeServer()
+        original = server.handler
+
+        def handler(request):
+            if len(server.requests) == 1:
+                server.etag = '"v2"'
+            return original(request)
+
+        server.handler = handler
+        with pytest.raises(DownloadError):
+            server.client().download("/artifact.bin", tmp_path / "artifact.bin", retries=0)
+
+    def test_without_range_support(self, tmp_path):
+        """Test that servers without range support are downloaded in one stream."""
+        server = RangeServer(ranges=False)
+        dest = tmp_path / "artifact.bin"
+
+        result = server.client().download("/artifact.bin", dest, parts=4)
+
+        assert dest.read_bytes() == DATA
+        assert len(server.requests) == 1
+        assert result.size == len(DATA)
+
+    def test_progress(self, tmp_path):
+        """Test that the progress callback reaches the total size."""
+        calls = []
+
+        RangeServer().client().download(
+            "/artifact.bin",
+            tmp_path / "artifact.bin",
+            progress=lambda done, total: calls.append((done, total)),
+        )
+
+        assert max(calls) == (len(DATA), len(DATA))
+
+
+@pytest.mark.asyncio
+class TestAsyncDownload:
+    async def test_parallel_download(self, tmp_path):
+        """Test that an AsyncClient fetches ranges concurrently."""
+        server = RangeServer()
+        dest = tmp_path / "artifact.bin"
+
+        result = await server.client(AsyncClient).download("/artifact.bin", dest, parts=3)
+
+        assert dest.read_bytes() == DATA
+        assert result.downloaded == len(DATA)
+        assert len(server.requests) == 4
+
+    @patch("asyncio.sleep")
+    async def test_retry_continues_part(self, mock_sleep, tmp_path):
+        """Test that an AsyncClient continues a dropped part."""
+        server = RangeServer(fail_at=1024 * 1024 + 5)
+        dest = tmp_path / "artifact.bin"
+
+        await server.client(AsyncClient).download("/artifact.bin", dest, parts=3)
+
+        assert dest.read_bytes() == DATA
+
+    async def test_state_saved_off_event_loop(self, tmp_path):
+        """Test that the resume state is written in worker threads, not on the event loop."""
+        server = RangeServer(fail_at=1024 * 1024 + 5)
+        dest = tmp_path / "artifact.bin"
+        threads = []
+        save = _DownloadState.save
+
+        def recording_save(state):
+            threads.append(threading.current_thread())
+            save(state)
+
+        with patch.object(_DownloadState, "save", recording_save):
+            with pytest.raises(TransportError):
+                await server.client(AsyncClient).download("/artifact.bin", dest, retries=0)
+
+        assert threads
+        assert threading.main_thread() not in threads
+        assert os.path.exists(str(dest) + ".part.json")
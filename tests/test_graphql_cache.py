@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from integrates.protocols.graphql import AsyncGraphQLClient, GraphQLClient, NormalizedCache
+from integrates.protocols.graphql.cache import ROOT_QUERY
+from integrates.protocols.graphql.document import parse
+
+USER_QUERY = "query User($id: ID!) { user(id: $id) { id name email } }"
+USERS = {
+    "1": {"__typename": "User", "id": "1", "name": "Ada", "email": "ada@example.com"},
+    "2": {"__typename": "User", "id": "2", "name": "Alan", "email": "alan@example.com"},
+}
+
+
+class Server:
+    """Mock GraphQL server answering with canned data and counting requests."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.payloads = []
+
+    def __call__(self, request):
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        return httpx.Response(200, json=self.answer(payload))
+
+
+def cached_client(answer, **options):
+    server = Server(answer)
+    client = GraphQLClient(
+        "https://api.example.com/graphql",
+        cache=NormalizedCache(),
+        transport=httpx.MockTransport(server),
+        **options,
+    )
+    return client, server
+
+
+def user_answer(payload):
+    return {"data": {"user": USERS[payload["variables"]["id"]]}}
+
+
+class TestNormalizedCache:
+    def test_write_normalizes_entities(self):
+        """Test that results are split into records keyed by __typename and id."""
+        cache = NormalizedCache()
+        document = parse(
+            "{ viewer { id __typename name friends(first: 2) { __typename id name } } }"
+        )
+        cache.write(
+            document,
+            {
+                "viewer": {
+                    "__typename": "User",
+                    "id": "1",
+                    "name": "Ada",
+                    "friends": [{"__typename": "User", "id": "2", "name": "Alan"}],
+                }
+            },
+        )
+
+        assert cache.entity(ROOT_QUERY) == {"viewer": {"__ref": "User:1"}}
+        assert cache.entity("User:1")['friends({"first":2})'] == [{"__ref": "User:2"}]
+        assert cache.entity("User:2") == {"__typename": "User", "id": "2", "name": "Alan"}
+
+    def test_read_needs_every_field(self):
+        """Test that a query is answered only when all its fields are cached."""
+        cache = NormalizedCache()
+        cache.write(parse(USER_QUERY), {"user": USERS["1"]}, variables={"id": "1"})
+
+        full = cache.read(parse(USER_QUERY), variables={"id": "1"})
+        partial = cache.read(parse("query($id: ID!) { user(id: $id) { name } }"), None, {"id": "1"})
+        missing = cache.read(
+            parse("query($id: ID!) { user(id: $id) { phone } }"), None, {"id": "1"}
+        )
+        other = cache.read(parse(USER_QUERY), variables={"id": "2"})
+
+        assert full == {"user": {"id": "1", "name": "Ada", "email": "ada@example.com"}}
+        assert partial == {"user": {"name": "Ada"}}
+        assert missing is None and other is None
+
+    def test_partial_results_are_merged(self):
+        """Test that fields of one entity fetched by different queries add up."""
+        cache = NormalizedCache()
+        cache.write(
+            parse("{ me { __typename id name } }"),
+            {"me": {"__typename": "User", "id": "1", "name": "Ada"}},
+        )
+        cache.write(
+            parse("{ user(id: 1) { __typename id email } }"),
+            {"user": {"__typename": "User", "id": "1", "email": "ada@example.com"}},
+        )
+
+        assert cache.read(parse("{ me { name email } }")) == {
+            "me": {"name": "Ada", "email": "ada@example.com"}
+        }
+
+    def test_fragments_and_type_conditions(self):
+        """Test that fragments are read back and unknown type conditions are misses."""
+        cache = NormalizedCache()
+        query = parse(
+            "{ node(id: 1) { __typename id ...F ... on Admin { level } } } "
+            "fragment F on User { name }"
+        )
+        cache.write(query, {"node": {"__typename": "User", "id": "1", "name": "Ada"}})
+
+        assert cache.read(query) == {"node": {"__typename": "User", "id": "1", "name": "Ada"}}
+        assert cache.read(parse("{ node(id: 1) { ... on Moderator { since } } }")) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used records are evicted beyond max_entities."""
+        cache = NormalizedCache(max_entities=2)
+        document = parse(USER_QUERY)
+        cache.write(document, {"user": USERS["1"]}, variables={"id": "1"})
+        cache.write(document, {"user": USERS["2"]}, variables={"id": "2"})
+
+        assert len(cache) == 2
+        assert "User:1" not in cache
+        assert cache.read(document, variables={"id": "1"}) is None
+        assert cache.read(document, variables={"id": "2"}) is not None
+
+
+class TestClientCache:
+    def test_cache_first_answers_from_cache(self):
+        """Test that a repeated query is answered without a request."""
+        client, server = cached_client(user_answer)
+
+        first = client.query(USER_QUERY, {"id": "1"})
+        second = client.query(USER_QUERY, {"id": "1"})
+
+        assert len(server.payloads) == 1
+        assert "__typename" in server.payloads[0]["query"]
+        assert second.request_info["cache"] == "hit"
+        assert second.json()["data"]["user"]["name"] == "Ada"
+        assert first.json()["data"]["user"]["email"] == second.json()["data"]["user"]["email"]
+
+    def test_other_query_served_from_entities(self):
+        """Test that an entity fetched by one query answers another query."""
+        client, server = cached_client(
+            lambda payload: (
+                {"data": {"users": list(USERS.values())}}
+                if "users" in payload["query"]
+                else user_answer(payload)
+            )
+        )
+
+        client.query("{ users { id name email } }")
+        response = client.query("query Lookup { users { name } }")
+
+        assert len(server.payloads) == 1
+        assert response.json() == {"data": {"users": [{"name": "Ada"}, {"name": "Alan"}]}}
+
+    def test_network_only_refreshes_cache(self):
+        """Test that network-only always sends the query and updates the cache."""
+        client, server = cached_client(user_answer)
+
+        client.query(USER_QUERY, {"id": "1"})
+        USERS["1"]["name"] = "Ada L."
+        try:
+            client.query(USER_QUERY, {"id": "1"}, fetch_policy="network-only")
+            response = client.query(USER_QUERY, {"id": "1"})
+        finally:
+            USERS["1"]["name"] = "Ada"
+
+        assert len(server.payloads) == 2
+        assert response.json()["data"]["user"]["name"] == "Ada L."
+
+    def test_mutation_results_update_entities(self):
+        """Test that entities in a mutation result update cached queries."""
+
+        def answer(payload):
+            if payload["query"].startswith("mutation"):
+                return {"data": {"rename": {"__typename": "User", "id": "1", "name": "Countess"}}}
+            return user_answer(payload)
+
+        client, server = cached_client(answer)
+
+        client.query(USER_QUERY, {"id": "1"})
+        client.mutation("mutation { rename(id: 1) { id name } }")
+        response = client.query(USER_QUERY, {"id": "1"})
+
+        assert len(server.payloads) == 2
+        assert response.json()["data"]["user"]["name"] == "Countess"
+
+    def test_errors_are_not_cached(self):
+        """Test that results with errors are not written to the cache."""
+        client, server = cached_client(
+            lambda payload: {"data": {"user": None}, "errors": [{"message": "boom"}]}
+        )
+
+        client.query(USER_QUERY, {"id": "1"})
+        client.query(USER_QUERY, {"id": "1"})
+
+        assert len(server.payloads) == 2
+
+    def test_invalid_fetch_policy(self):
+        """Test that an unknown fetch policy is rejected."""
+        with pytest.raises(ValueError):
+            GraphQLClient("https://api.example.com/graphql", fetch_policy="cache-only")
+
+    @pytest.mark.asyncio
+    async def test_async_cache_and_network(self):
+        """Test that cache-and-network returns cached data and refreshes it in the background."""
+        server = Server(user_answer)
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            cache=NormalizedCache(),
+            fetch_policy="cache-and-network",
+            transport=httpx.MockTransport(server),
+        )
+
+        await client.query(USER_QUERY, {"id": "2"})
+        response = await client.query(USER_QUERY, {"id": "2"})
+        await asyncio.gather(*client._refreshes)
+
+        assert response.request_info["cache"] == "hit"
+        assert len(server.payloads) == 2
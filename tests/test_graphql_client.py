@@ -1,6 +1,12 @@
+import asyncio
+import hashlib
+import json
+
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
-from integrates.protocols.graphql.client import GraphQLClient
+from integrates.core.exceptions import GraphQLError
+from integrates.protocols.graphql.client import AsyncGraphQLClient, GraphQLClient
 
 
 class TestGraphQLClient:
@@ -35,7 +41,12 @@ class TestGraphQLClient:
 
         mock_post.assert_called_once()
         assert mock_post.call_args[0][0] == ""  # The endpoint is already in base_url
-        assert mock_post.call_args[1]["json"]["query"] == query
+        # Sent minified, with the operation name taken from the document
+        assert (
+            mock_post.call_args[1]["json"]["query"]
+            == "query GetUser($id:ID!){user(id:$id){id name}}"
+        )
+        assert mock_post.call_args[1]["json"]["operationName"] == "GetUser"
         assert mock_post.call_args[1]["json"]["variables"] == variables
 
     @patch("integrates.core.client.Client.post")
@@ -63,7 +74,9 @@ class TestGraphQLClient:
 
         mock_post.assert_called_once()
         assert mock_post.call_args[0][0] == ""  # The endpoint is already in base_url
-        assert mock_post.call_args[1]["json"]["query"] == mutation
+        assert mock_post.call_args[1]["json"]["query"] == (
+            "mutation CreateUser($input:UserInput!){createUser(input:$input){id name}}"
+        )
         assert mock_post.call_args[1]["json"]["variables"] == variables
 
     @patch("integrates.core.client.Client.post")
@@ -118,3 +131,432 @@ class TestGraphQLClient:
 
         mock_post.assert_called_once()
         assert mock_post.call_args[1]["json"]["operationName"] == operation_name
+
+    @patch("httpx.Client.request")
+    def test_prepare_query(self, mock_request):
+        """Test that a prepared query only varies its variables between sends."""
+        mock_request.return_value = httpx.Response(
+            200,
+            content=b'{"data": {"user": {"id": "1"}}}',
+            request=httpx.Request("POST", "https://api.example.com/graphql"),
+        )
+        client = GraphQLClient(endpoint="https://api.example.com/graphql")
+        prepared = client.prepare_query(
+            "query GetUser($id: ID!) { user(id: $id) { id } }", "GetUser"
+        )
+
+        prepared.send({"id": "1"})
+        response = prepared.send({"id": "2"})
+
+        assert mock_request.call_count == 2
+        sent = mock_request.call_args[1]
+        assert sent["url"] == "https://api.example.com/graphql"
+        assert sent["json"]["variables"] == {"id": "2"}
+        assert sent["json"]["operationName"] == "GetUser"
+        assert response.json()["data"]["user"]["id"] == "1"
+
+    def test_prepared_query_is_immutable(self):
+        """Test that prepared queries cannot be modified, on either client."""
+        for client_class in (GraphQLClient, AsyncGraphQLClient):
+            client = client_class(endpoint="https://api.example.com/graphql")
+            prepared = client.prepare_query("query A { a } query B { b }", "A")
+
+            assert prepared.operation_name == "A"
+            with pytest.raises(AttributeError):
+                prepared.operation_name = "B"
+            with pytest.raises(AttributeError):
+                prepared.query = "{ c }"
+            with pytest.raises(AttributeError):
+                prepared.extra = 1
+
+    def test_query_stream_items(self):
+        """Test that a streamed query result can be consumed element by element."""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=iter([b'{"data": {"users": [{"id": "1"}, {"i', b'd": "2"}]}}'])
+            )
+
+        client = GraphQLClient(
+            endpoint="https://api.example.com/graphql", transport=httpx.MockTransport(handler)
+        )
+
+        response = client.query("{ users { id } }", stream=True)
+
+        assert list(response.iter_items("data.users.item")) == [{"id": "1"}, {"id": "2"}]
+
+
+def batch_handler(batches):
+    """Mock server answering each operation of a batch with its variables."""
+
+    def handler(request):
+        operations = json.loads(request.content)
+        batches.append(operations)
+        return httpx.Response(200, json=[{"data": op["variables"]} for op in operations])
+
+    return handler
+
+
+class TestBatch:
+    def test_batch_sends_operations_in_one_request(self):
+        """Test that batch() posts a JSON array and splits the results per operation."""
+        batches = []
+        client = GraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(batch_handler(batches))
+        )
+
+        responses = client.batch(
+            [
+                "{ viewer { id } }",
+                ("query Q($n: Int) { n }", {"n": 1}),
+                {"query": "query Named { a }", "variables": {"a": 2}, "operationName": "Named"},
+            ]
+        )
+
+        assert len(batches) == 1
+        assert batches[0][0] == {"query": "{viewer{id}}", "variables": {}}
+        assert batches[0][2]["operationName"] == "Named"
+        assert [r.json() for r in responses] == [
+            {"data": {}},
+            {"data": {"n": 1}},
+            {"data": {"a": 2}},
+        ]
+
+    def test_batch_is_chunked(self):
+        """Test that operations above batch_size are split over several requests."""
+        batches = []
+        client = GraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(batch_handler(batches))
+        )
+
+        responses = client.batch([("{ n }", {"n": n}) for n in range(5)], batch_size=2)
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [r.json()["data"]["n"] for r in responses] == [0, 1, 2, 3, 4]
+
+    def test_batch_unsupported_by_server(self):
+        """Test that a non-array answer is returned for every operation of the batch."""
+
+        def handler(request):
+            return httpx.Response(400, json={"errors": [{"message": "Batching not supported"}]})
+
+        client = GraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(handler)
+        )
+
+        responses = client.batch(["{ a }", "{ b }"])
+
+        assert [r.status_code for r in responses] == [400, 400]
+        assert responses[0] is responses[1]
+
+    def test_batch_rejects_invalid_size(self):
+        """Test that a batch size below one is rejected."""
+        client = GraphQLClient("https://api.example.com/graphql")
+
+        with pytest.raises(ValueError):
+            client.batch(["{ a }"], batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_async_batch_keeps_order(self):
+        """Test that async batches are sent concurrently and results keep their order."""
+        batches = []
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(batch_handler(batches))
+        )
+
+        responses = await client.batch([("{ n }", {"n": n}) for n in range(5)], batch_size=3)
+
+        assert sorted(len(batch) for batch in batches) == [2, 3]
+        assert [r.json()["data"]["n"] for r in responses] == [0, 1, 2, 3, 4]
+
+
+class APQServer:
+    """Mock server implementing automatic persisted queries."""
+
+    def __init__(self, supported=True):
+        self.supported = supported
+        self.store = {}
+        self.requests = []
+
+    def __call__(self, request):
+        if request.method == "GET":
+            payload = {
+                key: json.loads(value) if key in ("variables", "extensions") else value
+                for key, value in request.url.params.items()
+            }
+        else:
+            payload = json.loads(request.content)
+        self.requests.append((request.method, payload))
+
+        persisted = payload.get("extensions", {}).get("persistedQuery")
+        if persisted and not self.supported:
+            return httpx.Response(200, json={"errors": [{"message": "PersistedQueryNotSupported"}]})
+        query = payload.get("query")
+        if persisted:
+            if query is not None:
+                self.store[persisted["sha256Hash"]] = query
+            query = self.store.get(persisted["sha256Hash"])
+            if query is None:
+                return httpx.Response(
+                    200,
+                    json={
+                        "errors": [
+                            {
+                                "message": "PersistedQueryNotFound",
+                                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                            }
+                        ]
+                    },
+                )
+        return httpx.Response(200, json={"data": {"query": query}})
+
+
+class TestPersistedQueries:
+    QUERY = "query Viewer{viewer{login}}"
+
+    def test_hash_is_registered_once(self):
+        """Test that an unknown hash is registered with the query text, then sent alone."""
+        server = APQServer()
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            persisted_queries=True,
+            transport=httpx.MockTransport(server),
+        )
+
+        first = client.query(self.QUERY)
+        second = client.query(self.QUERY)
+
+        assert first.json() == second.json() == {"data": {"query": self.QUERY}}
+        sent = [payload for _, payload in server.requests]
+        assert [("query" in payload) for payload in sent] == [False, True, False]
+        digest = sent[0]["extensions"]["persistedQuery"]["sha256Hash"]
+        assert digest == hashlib.sha256(self.QUERY.encode()).hexdigest()
+
+    def test_hashed_queries_use_get(self):
+        """Test that hashed queries are sent as GET, while mutations and registrations use POST."""
+        server = APQServer()
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            persisted_queries=True,
+            get_persisted=True,
+            transport=httpx.MockTransport(server),
+        )
+
+        client.query(self.QUERY, {"id": 1})
+        client.query(self.QUERY, {"id": 1})
+        client.mutation("# create\nmutation { create }")
+
+        assert [method for method, _ in server.requests] == ["GET", "POST", "GET", "POST", "POST"]
+        assert server.requests[2][1]["variables"] == {"id": 1}
+
+    def test_selected_mutation_uses_post(self):
+        """Test that GET vs POST follows the selected operation, not the first definition."""
+        server = APQServer()
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            persisted_queries=True,
+            get_persisted=True,
+            minify=False,
+            transport=httpx.MockTransport(server),
+        )
+
+        client.mutation("fragment F on User { id } mutation Delete { delete { ...F } }")
+        client.query("query Read { viewer { id } } mutation Write { write }", None, "Write")
+        client.query("query Read { viewer { id } } mutation Write { write }", None, "Read")
+
+        # The document registered by the mutation is then read with GET
+        assert [method for method, _ in server.requests] == ["POST", "POST", "POST", "POST", "GET"]
+
+    def test_unsupported_server_disables_apq(self):
+        """Test that a server without APQ support gets the full query from then on."""
+        server = APQServer(supported=False)
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            persisted_queries=True,
+            transport=httpx.MockTransport(server),
+        )
+
+        response = client.query(self.QUERY)
+        client.query(self.QUERY)
+
+        assert response.json() == {"data": {"query": self.QUERY}}
+        assert client.persisted_queries is False
+        assert len(server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_persisted_query(self):
+        """Test that the async client registers and reuses persisted queries."""
+        server = APQServer()
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            persisted_queries=True,
+            get_persisted=True,
+            transport=httpx.MockTransport(server),
+        )
+
+        await client.query(self.QUERY)
+        response = await client.query(self.QUERY)
+
+        assert response.json() == {"data": {"query": self.QUERY}}
+        assert [method for method, _ in server.requests] == ["GET", "POST", "GET"]
+
+
+ISSUES_QUERY = """
+query Issues($owner: String!, $after: String) {
+  repository(owner: $owner) {
+    issues(first: 2, after: $after) {
+      edges { node { number } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def issues_server(requests, total=5, page_size=2):
+    """Mock server paging through issues 1..total with cursors "c<last number>"."""
+
+    def handler(request):
+        variables = json.loads(request.content)["variables"]
+        requests.append(variables)
+        start = int(variables["after"][1:]) if variables.get("after") else 0
+        numbers = list(range(start + 1, min(start + page_size, total) + 1))
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "repository": {
+                        "issues": {
+                            "edges": [{"node": {"number": n}} for n in numbers],
+                            "pageInfo": {
+                                "hasNextPage": numbers[-1] < total,
+                                "endCursor": f"c{numbers[-1]}",
+                            },
+                        }
+                    }
+                }
+            },
+        )
+
+    return handler
+
+
+class TestPaginate:
+    def test_paginate_yields_all_nodes(self):
+        """Test that pages are followed through endCursor until hasNextPage is false."""
+        requests = []
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(issues_server(requests)),
+        )
+
+        numbers = [
+            node["number"]
+            for node in client.paginate(ISSUES_QUERY, "repository.issues", {"owner": "o"})
+        ]
+
+        assert numbers == [1, 2, 3, 4, 5]
+        assert [r["after"] for r in requests] == [None, "c2", "c4"]
+        assert all(r["owner"] == "o" for r in requests)
+
+    def test_paginate_is_lazy_and_limited(self):
+        """Test that pages are fetched only as nodes are consumed, up to max_pages."""
+        requests = []
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(issues_server(requests)),
+        )
+
+        nodes = client.paginate(ISSUES_QUERY, "repository.issues", {"owner": "o"}, max_pages=2)
+        assert next(nodes) == {"number": 1}
+        assert len(requests) == 1
+        assert [node["number"] for node in nodes] == [2, 3, 4]
+
+    def test_paginate_nodes_and_errors(self):
+        """Test the nodes shorthand, and that a missing connection raises GraphQLError."""
+        responses = [
+            {
+                "data": {
+                    "users": {
+                        "nodes": [{"id": 1}],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "x"},
+                    }
+                }
+            },
+            {"data": None, "errors": [{"message": "rate limited"}]},
+        ]
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=responses.pop(0))
+            ),
+        )
+
+        nodes = client.paginate(
+            "query($after: String) { users(after: $after) { nodes { id } } }", "users"
+        )
+
+        assert next(nodes) == {"id": 1}
+        with pytest.raises(GraphQLError, match="rate limited"):
+            next(nodes)
+
+    @pytest.mark.asyncio
+    async def test_async_paginate_prefetches_next_page(self):
+        """Test that the async iterator requests the next page before the current one is consumed."""
+        requests = []
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(issues_server(requests)),
+        )
+
+        nodes = client.paginate(ISSUES_QUERY, "repository.issues", {"owner": "o"})
+        first = await nodes.__anext__()
+        await asyncio.sleep(0)
+
+        assert first == {"number": 1}
+        assert len(requests) == 2
+        assert [node["number"] async for node in nodes] == [2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_max_pages_agree(self):
+        """Test that both clients fetch the same pages for a given max_pages, including none."""
+        sync_requests, async_requests = [], []
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(issues_server(sync_requests)),
+        )
+        async_client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(issues_server(async_requests)),
+        )
+
+        for max_pages, expected in ((0, []), (1, [1, 2]), (2, [1, 2, 3, 4])):
+            sync_nodes = client.paginate(ISSUES_QUERY, "repository.issues", max_pages=max_pages)
+            async_nodes = async_client.paginate(
+                ISSUES_QUERY, "repository.issues", max_pages=max_pages
+            )
+            assert [node["number"] for node in sync_nodes] == expected
+            assert [node["number"] async for node in async_nodes] == expected
+            assert len(async_requests) == len(sync_requests)
+
+
+class TestLookup:
+    def test_lookup_sends_chunks_in_turn(self):
+        """Test that the sync client looks ids up in aliased chunks and merges the results."""
+        queries = []
+
+        def handler(request):
+            payload = json.loads(request.content)
+            queries.append(payload)
+            data = {alias: {"id": user_id} for alias, user_id in payload["variables"].items()}
+            return httpx.Response(200, json={"data": data})
+
+        client = GraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(handler)
+        )
+
+        users = client.lookup(range(7), "node", "{ id }", argument_type="ID!", chunk_size=3)
+
+        assert users == {i: {"id": i} for i in range(7)}
+        assert [len(query["variables"]) for query in queries] == [3, 3, 1]
+        assert queries[-1]["query"] == "query Load($k0:ID!){k0:node(id:$k0){id}}"
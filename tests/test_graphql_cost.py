@@ -0,0 +1,189 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from integrates.auth.signing import HMACAuth
+from integrates.protocols.graphql import (
+    AsyncGraphQLClient,
+    CostEstimator,
+    CostLimiterMiddleware,
+    GraphQLClient,
+    Schema,
+)
+from graphql_types import field, list_of, named
+
+ISSUES_QUERY = """
+query Issues($count: Int!) {
+  repository(name: "api") {
+    issues(first: $count) { edges { node { title labels(first: 5) { nodes { name } } } } }
+  }
+}
+"""
+
+
+def throttled(available, cost=10, maximum=1000.0, rate=50.0):
+    return {
+        "data": {"shop": {"name": "x"}},
+        "extensions": {
+            "cost": {
+                "requestedQueryCost": cost,
+                "actualQueryCost": cost,
+                "throttleStatus": {
+                    "maximumAvailable": maximum,
+                    "currentlyAvailable": available,
+                    "restoreRate": rate,
+                },
+            }
+        },
+    }
+
+
+class TestCostEstimator:
+    def test_connections_multiply_by_page_size(self):
+        """Test that first/last arguments multiply the cost of the selection below."""
+        estimator = CostEstimator()
+        # repository 1 + 50 * (issues' edges 1 + node 1 + 5 * (labels' nodes 1) + labels 1)
+        assert estimator.estimate(ISSUES_QUERY, {"count": 50}) == 1 + 1 + 50 * (1 + 1 + 1 + 5)
+        assert estimator.estimate(ISSUES_QUERY, {"count": 1}) < estimator.estimate(
+            ISSUES_QUERY, {"count": 2}
+        )
+
+    def test_weights(self):
+        """Test that weights override fields by qualified name, bare name and type."""
+        query = "{ user(id: 1) { name friends { name } } }"
+        assert CostEstimator().estimate(query) == 2
+        assert CostEstimator(weights={"Query.user": 5}).estimate(query) == 6
+        assert CostEstimator(weights={"friends": 3, "name": 1}).estimate(query) == 1 + 1 + 3 + 1
+        assert CostEstimator(scalar_weight=1).estimate(query) == 4
+        assert CostEstimator().estimate("mutation { addStar(id: 1) { id } }") == 1
+        assert (
+            CostEstimator(weights={"Mutation.addStar": 10}).estimate(
+                "mutation { addStar(id: 1) { id } }"
+            )
+            == 10
+        )
+
+    def test_schema_types(self):
+        """Test that a schema gives parent types for weights and sizes unpaged lists."""
+        user = named("OBJECT", "User")
+        schema = Schema(
+            {
+                "__schema": {
+                    "queryType": {"name": "Query"},
+                    "types": [
+                        {"kind": "OBJECT", "name": "Query", "fields": [field("viewer", user)]},
+                        {
+                            "kind": "OBJECT",
+                            "name": "User",
+                            "fields": [
+                                field("name", named("SCALAR", "String")),
+                                field("friends", list_of(user)),
+                            ],
+                        },
+                    ],
+                }
+            }
+        )
+        estimator = CostEstimator(schema, weights={"User": 2}, list_size=10)
+        # viewer (User) 2 + friends (User, list of 10) 2 + 10 * friends.friends 2
+        assert estimator.estimate("{ viewer { name friends { friends { name } } } }") == 2 + 2 + 20
+
+
+class TestCostLimiterMiddleware:
+    def test_request_cost(self):
+        """Test that request costs cover batches and persisted GET queries."""
+        limiter = CostLimiterMiddleware()
+        payload = {"query": ISSUES_QUERY, "variables": {"count": 1}}
+        single = limiter.cost({"json": payload})
+        assert single == 10
+        assert limiter.cost({"json": [payload, payload]}) == 20
+        params = {"query": ISSUES_QUERY, "variables": json.dumps({"count": 1})}
+        assert limiter.cost({"params": params}) == 10
+        assert limiter.cost({"json": {"extensions": {"persistedQuery": {}}}}) == 1
+        assert limiter.cost({"json": {"query": "{ broken"}}) == 0
+
+    def test_request_cost_with_body_signing(self):
+        """Test that bodies serialised for signing are still estimated, unless compressed."""
+        payloads = []
+
+        def handler(request):
+            payloads.append(json.loads(request.content))
+            return httpx.Response(200, json={"data": {}})
+
+        limiter = CostLimiterMiddleware()
+        client = GraphQLClient(
+            "https://shop.example.com/graphql",
+            auth=HMACAuth(access_key="AKID", secret_key="secret", region="eu", service="api"),
+            middlewares=[limiter],
+            transport=httpx.MockTransport(handler),
+        )
+        client.query(ISSUES_QUERY, {"count": 1})
+
+        assert payloads[0]["variables"] == {"count": 1}
+        assert limiter.maximum - limiter.available == pytest.approx(10, abs=0.1)
+
+        compressed = {"content": b"\x1f\x8b", "headers": {"Content-Encoding": "gzip"}}
+        assert limiter.cost(compressed) == 1
+
+    @patch("time.sleep")
+    def test_waits_for_budget(self, mock_sleep):
+        """Test that requests wait once their cost exceeds the remaining budget."""
+        limiter = CostLimiterMiddleware(maximum=20, restore_rate=10)
+        request = {"json": {"query": "{ a { b } c { d } }"}}
+        for _ in range(10):
+            limiter.pre_request(request)
+        mock_sleep.assert_not_called()
+        limiter.pre_request(request)
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.2, abs=0.01)
+
+    @patch("time.sleep")
+    def test_follows_server_budget(self, mock_sleep):
+        """Test that the reported throttle status replaces the local account."""
+
+        def handler(request):
+            return httpx.Response(200, json=throttled(available=5, cost=40, rate=10))
+
+        limiter = CostLimiterMiddleware(maximum=100, restore_rate=100)
+        client = GraphQLClient(
+            "https://shop.example.com/graphql",
+            middlewares=[limiter],
+            transport=httpx.MockTransport(handler),
+        )
+        client.query("{ shop { name } }")
+        mock_sleep.assert_not_called()
+        assert limiter.maximum == 1000
+        assert limiter.restore_rate == 10
+        assert limiter.last_cost == 40
+        assert limiter.available == 5
+
+        client.query("{ a { b } c { d } e { f } g { h } h { i } j { k } }")
+        # 6 points needed, 5 available, 1 point restored in 0.1 s
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.1, abs=0.01)
+
+    def test_async_client(self):
+        """Test that the asynchronous client waits without blocking the event loop."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        def handler(request):
+            return httpx.Response(200, json={"data": {"a": {"b": 1}}})
+
+        limiter = CostLimiterMiddleware(maximum=1, restore_rate=4)
+
+        async def run():
+            async with AsyncGraphQLClient(
+                "https://shop.example.com/graphql",
+                middlewares=[limiter],
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                with patch("asyncio.sleep", fake_sleep):
+                    await asyncio.gather(*(client.query("{ a { b } }") for _ in range(3)))
+
+        asyncio.run(run())
+        # The second and third requests queue behind the first
+        assert sleeps == [pytest.approx(0.25, abs=0.02), pytest.approx(0.5, abs=0.02)]
@@ -0,0 +1,106 @@
+import pytest
+
+from integrates.core.exceptions import GraphQLSyntaxError
+from integrates.protocols.graphql.document import build_payload, parse, tokenize
+
+DOCUMENT = '''
+# Fetch a user
+query GetUser($id: ID!, $filter: Filter = {tags: ["a", "b"]}) {
+  user(id: $id) {
+    ...UserFields
+    posts(first: 10) { ... on Post { title } }
+  }
+}
+
+fragment UserFields on User { id ...Names }
+fragment Names on User { name bio(format: """plain "text" """) }
+fragment Unused on User { email }
+
+mutation Rename($name: String) { rename(name: $name) { id } }
+'''
+
+
+class TestDocument:
+    def test_minify(self):
+        """Test that whitespace, commas and comments are dropped but tokens stay apart."""
+        document = parse("query Q($a: Int = -1.5e3) {\n  a(x: $a, y: [1, 2])  # note\n  b }")
+
+        assert document.print() == "query Q($a:Int=-1.5e3){a(x:$a y:[1 2])b}"
+
+    def test_strings_are_kept_verbatim(self):
+        """Test that string and block string contents are not altered."""
+        document = parse('{ a(s: "x,  # y", t: """ line\n  \\""" """) }')
+
+        assert document.print() == '{a(s:"x,  # y"t:""" line\n  \\""" """)}'
+
+    def test_operation_with_used_fragments_only(self):
+        """Test that printing an operation keeps only the fragments it uses, transitively."""
+        document = parse(DOCUMENT)
+
+        assert document.print("GetUser") == (
+            'query GetUser($id:ID!$filter:Filter={tags:["a" "b"]})'
+            "{user(id:$id){...UserFields posts(first:10){...on Post{title}}}}"
+            "fragment UserFields on User{id...Names}"
+            'fragment Names on User{name bio(format:"""plain "text" """)}'
+        )
+        assert document.print("Rename") == "mutation Rename($name:String){rename(name:$name){id}}"
+
+    def test_operation_name(self):
+        """Test that the operation name is found for single-operation documents."""
+        assert parse("query Named { a }").operation_name == "Named"
+        assert parse("{ a }").operation_name is None
+        assert parse(DOCUMENT).operation_name is None
+        assert parse(DOCUMENT).operation("Rename").kind == "mutation"
+
+    def test_parse_is_cached(self):
+        """Test that the same source string is parsed once."""
+        assert parse(DOCUMENT) is parse(DOCUMENT)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "{ a ",
+            "{ a ) }",
+            "query { a } }",
+            '{ a(s: "unterminated) }',
+            "{ a ? }",
+            "fragment F on T { a }",
+            "{ ...Missing }",
+        ],
+    )
+    def test_syntax_errors(self, source):
+        """Test that malformed documents are rejected locally."""
+        with pytest.raises(GraphQLSyntaxError):
+            parse(source)
+
+    def test_operation_name_required_for_several_operations(self):
+        """Test that a multi-operation document needs an operation name."""
+        with pytest.raises(GraphQLSyntaxError):
+            parse(DOCUMENT).print()
+        with pytest.raises(GraphQLSyntaxError):
+            parse(DOCUMENT).print("Missing")
+
+    def test_tokenize(self):
+        """Test that tokens are classified by kind."""
+        assert tokenize("...on $x: 1") == [
+            ("spread", "..."),
+            ("name", "on"),
+            ("punct", "$"),
+            ("name", "x"),
+            ("punct", ":"),
+            ("number", "1"),
+        ]
+
+
+class TestBuildPayload:
+    def test_payload_is_minified_and_named(self):
+        """Test that the payload holds the minified operation and its name."""
+        payload = build_payload("query Q { a }", {"x": 1})
+
+        assert payload == {"query": "query Q{a}", "variables": {"x": 1}, "operationName": "Q"}
+
+    def test_payload_without_minify(self):
+        """Test that minify=False sends the document verbatim."""
+        payload = build_payload("query Q { a }", minify=False)
+
+        assert payload == {"query": "query Q { a }", "variables": {}}
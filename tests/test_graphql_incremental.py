@@ -0,0 +1,164 @@
+import httpx
+import pytest
+
+from integrates.core.exceptions import GraphQLError, HTTPError
+from integrates.protocols.graphql import AsyncGraphQLClient, GraphQLClient, IncrementalResult
+from integrates.protocols.graphql.incremental import MultipartDecoder, multipart_boundary
+
+QUERY = "{ user(id: 1) { name ... @defer { friends { name } } posts @stream(initialCount: 1) } }"
+
+PARTS = [
+    b'{"data":{"user":{"name":"Ada","posts":["a"]}},"hasNext":true}',
+    b'{"incremental":[{"data":{"friends":[{"name":"Alan"}]},"path":["user"]}],"hasNext":true}',
+    b'{"incremental":[{"items":["b","c"],"path":["user","posts",1]}],"hasNext":false}',
+]
+
+
+def multipart_body(parts, boundary="-"):
+    body = b""
+    for part in parts:
+        body += b"\r\n--" + boundary.encode() + b"\r\n"
+        body += b"content-type: application/json; charset=utf-8\r\n\r\n" + part
+    return body + b"\r\n--" + boundary.encode() + b"--\r\n"
+
+
+def chunked(data, size=7):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestMultipartDecoder:
+    def test_parts_split_across_chunks(self):
+        """Test that parts are decoded however the body is split into chunks."""
+        decoder = MultipartDecoder("-")
+        payloads = []
+        for chunk in chunked(b"preamble" + multipart_body(PARTS), 5):
+            payloads.extend(decoder.feed(chunk))
+
+        assert [p["hasNext"] for p in payloads] == [True, True, False]
+        assert decoder.done
+
+    def test_large_part_in_single_bytes(self):
+        """Test that a large part fed byte by byte is decoded once, with a long boundary."""
+        decoder = MultipartDecoder("graphql-boundary")
+        large = b'{"data":{"text":"' + b"x" * 20000 + b'"},"hasNext":false}'
+        payloads = []
+        for chunk in chunked(multipart_body([large], "graphql-boundary"), 1):
+            payloads.extend(decoder.feed(chunk))
+
+        assert [len(p["data"]["text"]) for p in payloads] == [20000]
+        assert decoder.done
+
+    def test_delimiter_like_text_in_body(self):
+        """Test that a boundary inside a JSON string does not split the part."""
+        decoder = MultipartDecoder("-")
+
+        payloads = decoder.feed(multipart_body([b'{"data":{"text":"a---b"},"hasNext":false}']))
+
+        assert payloads == [{"data": {"text": "a---b"}, "hasNext": False}]
+
+    def test_boundary_parameter(self):
+        """Test that the boundary is read from the content type."""
+        assert multipart_boundary('multipart/mixed; boundary="graphql"; deferSpec=20220824') == (
+            "graphql"
+        )
+        assert multipart_boundary("multipart/mixed") == "-"
+        assert multipart_boundary("application/json") is None
+
+
+class TestIncrementalResult:
+    def test_patches_are_merged(self):
+        """Test that deferred data and streamed items are merged into the initial data."""
+        result = IncrementalResult()
+        decoder = MultipartDecoder()
+        for payload in decoder.feed(multipart_body(PARTS)):
+            result.apply(payload)
+
+        assert result.data == {
+            "user": {"name": "Ada", "posts": ["a", "b", "c"], "friends": [{"name": "Alan"}]}
+        }
+        assert result.has_next is False
+
+    def test_legacy_format_and_errors(self):
+        """Test the earlier patch format and that patch errors are collected."""
+        result = IncrementalResult()
+        result.apply({"data": {"user": {"name": "Ada"}}, "hasNext": True})
+        result.apply(
+            {
+                "data": {"bio": None},
+                "path": ["user"],
+                "errors": [{"message": "bio failed"}],
+                "hasNext": False,
+            }
+        )
+
+        assert result.data == {"user": {"name": "Ada", "bio": None}}
+        with pytest.raises(GraphQLError):
+            result.raise_for_errors()
+
+
+class TestQueryIncremental:
+    def test_payloads_are_yielded_as_they_arrive(self):
+        """Test that the sync client yields each payload of a multipart response."""
+        seen = {}
+
+        def handler(request):
+            seen["accept"] = request.headers["accept"]
+            return httpx.Response(
+                200,
+                headers={"content-type": 'multipart/mixed; boundary="-"'},
+                content=iter(chunked(multipart_body(PARTS))),
+            )
+
+        client = GraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(handler)
+        )
+
+        payloads = list(client.query_incremental(QUERY))
+
+        assert len(payloads) == 3
+        assert payloads[0]["data"]["user"]["name"] == "Ada"
+        assert seen["accept"].startswith("multipart/mixed")
+
+    def test_plain_json_answer(self):
+        """Test that a server without incremental delivery yields its single result."""
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"data": {"user": {"name": "Ada"}}})
+            ),
+        )
+
+        assert list(client.query_incremental(QUERY)) == [{"data": {"user": {"name": "Ada"}}}]
+
+    def test_error_status(self):
+        """Test that an error status is raised."""
+        client = GraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500, text="down")),
+        )
+
+        with pytest.raises(HTTPError):
+            list(client.query_incremental(QUERY))
+
+    @pytest.mark.asyncio
+    async def test_async_payloads(self):
+        """Test that the async client yields each payload of a multipart response."""
+
+        async def body():
+            for chunk in chunked(multipart_body(PARTS)):
+                yield chunk
+
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, headers={"content-type": "multipart/mixed"}, content=body()
+                )
+            ),
+        )
+
+        result = IncrementalResult()
+        async for payload in client.query_incremental(QUERY):
+            result.apply(payload)
+
+        assert result.data["user"]["posts"] == ["a", "b", "c"]
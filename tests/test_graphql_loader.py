@@ -0,0 +1,209 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from integrates.core.exceptions import GraphQLError
+from integrates.protocols.graphql import AsyncGraphQLClient, DataLoader
+
+pytestmark = pytest.mark.asyncio
+
+
+def user_server(queries):
+    """Mock server resolving aliased ``user(id:)`` fields; id "0" does not exist."""
+
+    def handler(request):
+        payload = json.loads(request.content)
+        queries.append(payload)
+        data, errors = {}, []
+        for alias, user_id in payload["variables"].items():
+            if user_id == "0":
+                data[alias] = None
+                errors.append({"message": f"User {user_id} not found", "path": [alias]})
+            else:
+                data[alias] = {"id": user_id, "name": f"user {user_id}"}
+        return httpx.Response(200, json={"data": data, "errors": errors})
+
+    return handler
+
+
+class TestDataLoader:
+    async def test_loads_in_one_tick_are_batched_and_deduplicated(self):
+        """Test that concurrent loads become one batch call with unique keys."""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return [key * 10 for key in keys]
+
+        loader = DataLoader(batch_load)
+
+        values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+        assert values == [10, 20, 10]
+        assert calls == [[1, 2]]
+
+    async def test_results_are_cached(self):
+        """Test that a cached key is not loaded again until it is cleared."""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return keys
+
+        loader = DataLoader(batch_load)
+        loader.prime("p", "primed")
+
+        await loader.load("a")
+        await loader.load_many(["a", "b", "p"])
+        loader.clear("a")
+        await loader.load("a")
+
+        assert calls == [["a"], ["b"], ["a"]]
+        assert await loader.load("p") == "primed"
+
+    async def test_max_batch_size_and_errors(self):
+        """Test that batches are split and per-key exceptions reach only their callers."""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return [ValueError(key) if key == 2 else key for key in keys]
+
+        loader = DataLoader(batch_load, max_batch_size=2)
+
+        results = await asyncio.gather(*(loader.load(k) for k in range(3)), return_exceptions=True)
+
+        assert calls == [[0, 1], [2]]
+        assert results[:2] == [0, 1] and isinstance(results[2], ValueError)
+
+    async def test_wrong_number_of_values(self):
+        """Test that a batch function returning the wrong number of values fails every key."""
+
+        async def batch_load(keys):
+            return []
+
+        loader = DataLoader(batch_load)
+
+        with pytest.raises(ValueError):
+            await loader.load("a")
+
+
+class TestGraphQLLoader:
+    async def test_lookups_become_one_aliased_query(self):
+        """Test that lookups of one tick are sent as a single aliased query."""
+        queries = []
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(user_server(queries))
+        )
+        users = client.loader("user", "{ id name }")
+
+        results = await asyncio.gather(*(users.load(i) for i in ["1", "2", "1"]))
+
+        assert [user["name"] for user in results] == ["user 1", "user 2", "user 1"]
+        assert len(queries) == 1
+        assert queries[0]["query"] == (
+            "query Load($k0:ID!$k1:ID!){k0:user(id:$k0){id name}k1:user(id:$k1){id name}}"
+        )
+        assert queries[0]["variables"] == {"k0": "1", "k1": "2"}
+
+    async def test_alias_errors_are_raised_per_key(self):
+        """Test that an error for one alias is raised only to that key's callers."""
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(user_server([]))
+        )
+        users = client.loader("user", "{ id }")
+
+        found, missing = await asyncio.gather(
+            users.load("1"), users.load("0"), return_exceptions=True
+        )
+
+        assert found == {"id": "1", "name": "user 1"}
+        assert isinstance(missing, GraphQLError)
+        assert missing.errors[0]["path"] == ["k1"]
+
+    async def test_http_error_fails_the_batch(self):
+        """Test that an HTTP error response is raised to every caller of the batch."""
+        client = AsyncGraphQLClient(
+            "https://api.example.com/graphql",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500, text="boom")),
+        )
+        users = client.loader("user", "{ id }", cache=False)
+
+        results = await asyncio.gather(users.load("1"), users.load("2"), return_exceptions=True)
+
+        assert all(isinstance(result, Exception) for result in results)
+
+
+class TestLookup:
+    async def test_ids_are_split_into_chunks_and_merged(self):
+        """Test that a large lookup runs as aliased chunks and returns one mapping."""
+        queries = []
+        ids = [str(i) for i in range(1, 251)]
+        async with AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(user_server(queries))
+        ) as client:
+            users = await client.lookup(ids + ["1"], "user", "{ id name }", chunk_size=100)
+
+        assert list(users) == ids
+        assert users["250"] == {"id": "250", "name": "user 250"}
+        assert sorted(len(query["variables"]) for query in queries) == [50, 100, 100]
+
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than ``concurrency`` chunk queries are in flight."""
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(request)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(request)
+            variables = json.loads(request.content)["variables"]
+            return httpx.Response(200, json={"data": {alias: {} for alias in variables}})
+
+        async with AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(handler)
+        ) as client:
+            users = await client.lookup(range(40), "user", chunk_size=5, concurrency=3)
+
+        assert len(users) == 40
+        assert max(peak) == 3
+
+    async def test_chunk_size_from_cost_limit(self):
+        """Test that max_cost sizes chunks by the estimated cost of one alias."""
+        queries = []
+        async with AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(user_server(queries))
+        ) as client:
+            # Each alias costs 1 + 1 + 10 * 1 (user, friends and the posts of 10 friends)
+            await client.lookup(
+                [str(i) for i in range(1, 31)],
+                "user",
+                "{ id friends(first: 10) { id posts { id } } }",
+                max_cost=100,
+            )
+
+        assert [len(query["variables"]) for query in queries] == [8, 8, 8, 6]
+
+    async def test_errors(self):
+        """Test that per-id errors raise, or are returned with partial=True."""
+        queries = []
+        async with AsyncGraphQLClient(
+            "https://api.example.com/graphql", transport=httpx.MockTransport(user_server(queries))
+        ) as client:
+            with pytest.raises(GraphQLError, match="User 0 not found") as excinfo:
+                await client.lookup(["1", "0"], "user", "{ id }")
+            assert excinfo.value.errors[0]["path"] == ["k1"]
+
+            users = await client.lookup(["1", "0"], "user", "{ id }", partial=True)
+        assert users["1"] == {"id": "1", "name": "user 1"}
+        assert isinstance(users["0"], GraphQLError)
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"concurrency": 0}])
+    async def test_invalid_options(self, options):
+        """Test that chunk sizes and concurrency below 1 are rejected."""
+        async with AsyncGraphQLClient("https://api.example.com/graphql") as client:
+            with pytest.raises(ValueError):
+                await client.lookup(["1"], "user", **options)
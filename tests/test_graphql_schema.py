@@ -0,0 +1,279 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from integrates.core.exceptions import GraphQLError, GraphQLValidationError
+from integrates.protocols.graphql import AsyncGraphQLClient, GraphQLClient, Schema, SchemaStore
+from graphql_types import argument, field, list_of, named, non_null
+
+ENDPOINT = "https://api.example.com/graphql"
+
+ID = non_null(named("SCALAR", "ID"))
+STRING = named("SCALAR", "String")
+USER = named("OBJECT", "User")
+
+
+def introspection(extra_user_fields=()):
+    user_fields = [
+        field("id", ID),
+        field("name", STRING),
+        field("createdAt", named("SCALAR", "DateTime")),
+        field("friends", list_of(USER), [argument("first", named("SCALAR", "Int"), "10")]),
+        *extra_user_fields,
+    ]
+    return {
+        "__schema": {
+            "queryType": {"name": "Query"},
+            "mutationType": None,
+            "subscriptionType": None,
+            "types": [
+                {
+                    "kind": "OBJECT",
+                    "name": "Query",
+                    "fields": [
+                        field("user", USER, [argument("id", ID)]),
+                        field("node", named("INTERFACE", "Node"), [argument("id", ID)]),
+                    ],
+                },
+                {"kind": "OBJECT", "name": "User", "fields": user_fields},
+                {
+                    "kind": "INTERFACE",
+                    "name": "Node",
+                    "fields": [field("id", ID)],
+                    "possibleTypes": [{"name": "User"}],
+                },
+                {"kind": "SCALAR", "name": "ID"},
+                {"kind": "SCALAR", "name": "String"},
+                {"kind": "SCALAR", "name": "Int"},
+                {"kind": "SCALAR", "name": "DateTime"},
+            ],
+        }
+    }
+
+
+class Server:
+    """Mock GraphQL server answering introspection and user queries."""
+
+    def __init__(self, schema=None, version="1"):
+        self.schema = schema or introspection()
+        self.version = version
+        self.introspections = 0
+        self.queries = 0
+        self.reject = False
+
+    def __call__(self, request):
+        payload = json.loads(request.content)
+        headers = {"X-Schema-Version": self.version}
+        if "__schema" in payload["query"]:
+            self.introspections += 1
+            return httpx.Response(200, json={"data": self.schema}, headers=headers)
+        self.queries += 1
+        if self.reject:
+            errors = [{"message": "x", "extensions": {"code": "GRAPHQL_VALIDATION_FAILED"}}]
+            return httpx.Response(400, json={"errors": errors})
+        return httpx.Response(200, json={"data": {"user": {"id": "1"}}}, headers=headers)
+
+
+def client_for(server, tmp_path, client_class=GraphQLClient, **options):
+    return client_class(
+        ENDPOINT,
+        validate=True,
+        schema_store=SchemaStore(str(tmp_path)),
+        transport=httpx.MockTransport(server),
+        **options,
+    )
+
+
+class TestSchema:
+    def test_field_type(self):
+        """Test that field types are reported in GraphQL notation."""
+        schema = Schema(introspection())
+        assert schema.field_type("Query", "user") == "User"
+        assert schema.field_type("User", "id") == "ID!"
+        assert schema.field_type("User", "friends") == "[User]"
+        assert schema.field_type("User", "missing") is None
+
+    def test_validate_accepts_valid_query(self):
+        """Test that a query matching the schema has no errors."""
+        schema = Schema(introspection())
+        query = """
+            query User($id: ID!) {
+              user(id: $id) { id name friends { ...Friend } }
+              node(id: $id) { __typename id ... on User { name } }
+            }
+            fragment Friend on User { id createdAt }
+        """
+        assert schema.validate(query) == []
+
+    def test_validate_reports_errors(self):
+        """Test unknown fields and arguments, missing arguments and selection errors."""
+        schema = Schema(introspection())
+        errors = schema.validate("{ user(id: 1, limit: 2) { id age name { first } } }")
+        assert "Cannot query field 'age' on type 'User'" in errors
+        assert "Unknown argument 'limit' on field 'Query.user'" in errors
+        assert any("must not have a selection" in error for error in errors)
+
+        errors = schema.validate("{ user }")
+        assert errors == [
+            "Field 'Query.user' argument 'id' of type 'ID!' is required",
+            "Field 'user' of type 'User' must have a selection of subfields",
+        ]
+        assert schema.validate("mutation { deleteUser }") == [
+            "Schema does not support mutation operations"
+        ]
+        assert schema.validate("{ node(id: 1) { ... on Robot { id } } }") == [
+            "Unknown type 'Robot'"
+        ]
+
+    def test_validation_results_are_bounded(self):
+        """Test that remembered validation results are capped, evicting the oldest."""
+        schema = Schema(introspection())
+        with patch("integrates.protocols.graphql.schema.VALIDATION_CACHE_SIZE", 2):
+            for alias in ("a", "b", "a", "c"):
+                schema.validate(f"{{ {alias}: user(id: 1) {{ id }} }}")
+
+        assert [source for source, _ in schema._validated] == [
+            "{ a: user(id: 1) { id } }",
+            "{ c: user(id: 1) { id } }",
+        ]
+
+    def test_decode_converts_custom_scalars(self):
+        """Test that custom scalars are decoded by type, through lists and fragments."""
+        schema = Schema(introspection())
+        query = "{ node(id: 1) { ... on User { createdAt friends { at: createdAt } } } }"
+        data = {
+            "node": {
+                "__typename": "User",
+                "createdAt": "2024-01-02T03:04:05Z",
+                "friends": [{"at": "2024-02-03T00:00:00+00:00"}, {"at": None}],
+            }
+        }
+        decoded = schema.decode(query, data)
+        assert decoded["node"]["createdAt"] == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert decoded["node"]["friends"][0]["at"].month == 2
+        assert decoded["node"]["friends"][1]["at"] is None
+        # The input is left untouched
+        assert data["node"]["createdAt"] == "2024-01-02T03:04:05Z"
+
+        custom = schema.decode(query, data, scalars={"DateTime": len})
+        assert custom["node"]["createdAt"] == 20
+
+
+class TestSchemaStore:
+    def test_round_trip(self, tmp_path):
+        """Test that saved schemas are loaded back with their version."""
+        store = SchemaStore(str(tmp_path))
+        assert store.load(ENDPOINT) is None
+        schema = Schema(introspection(), version="7")
+        path = store.save(ENDPOINT, schema)
+        assert os.path.basename(path) == f"{store.endpoint_key(ENDPOINT)}.{schema.hash}.json"
+
+        loaded = store.load(ENDPOINT)
+        assert loaded.hash == schema.hash
+        assert loaded.version == "7"
+        assert store.load("https://other.example.com/graphql") is None
+
+    def test_new_schema_replaces_old(self, tmp_path):
+        """Test that saving a changed schema removes the endpoint's previous file."""
+        store = SchemaStore(str(tmp_path))
+        store.save(ENDPOINT, Schema(introspection()))
+        changed = Schema(introspection([field("email", STRING)]))
+        store.save(ENDPOINT, changed)
+        assert len(os.listdir(tmp_path)) == 1
+        assert store.load(ENDPOINT).hash == changed.hash
+
+
+class TestClientValidation:
+    def test_invalid_query_fails_without_request(self, tmp_path):
+        """Test that invalid queries raise before a request is made."""
+        server = Server()
+        client = client_for(server, tmp_path)
+        with pytest.raises(GraphQLValidationError) as excinfo:
+            client.query("{ user(id: 1) { id age } }")
+        assert excinfo.value.errors == [{"message": "Cannot query field 'age' on type 'User'"}]
+        assert server.queries == 0
+
+        client.query("{ user(id: 1) { id } }")
+        assert server.queries == 1
+        assert server.introspections == 1
+
+    def test_schema_is_cached_on_disk(self, tmp_path):
+        """Test that a new client reuses the stored schema instead of introspecting."""
+        stored = client_for(Server(), tmp_path).schema()
+        server = Server()
+        client = client_for(server, tmp_path)
+        client.query("{ user(id: 1) { id } }")
+        assert server.introspections == 0
+        assert client.schema().hash == stored.hash
+
+    def test_stale_stored_schema_is_refreshed_on_failure(self, tmp_path):
+        """Test that a query using a field unknown to the stored schema re-introspects once."""
+        client_for(Server(), tmp_path).schema()
+        server = Server(introspection([field("email", STRING)]), version="2")
+        client = client_for(server, tmp_path)
+        client.query("{ user(id: 1) { email } }")
+        assert server.introspections == 1
+        assert server.queries == 1
+
+        with pytest.raises(GraphQLValidationError):
+            client.query("{ user(id: 1) { phone } }")
+        assert server.introspections == 1
+
+    def test_version_header_signals_change(self, tmp_path):
+        """Test that a changed schema version makes the next query re-introspect."""
+        server = Server()
+        client = client_for(server, tmp_path, schema_version_header="X-Schema-Version")
+        client.query("{ user(id: 1) { id } }")
+        client.query("{ user(id: 1) { id } }")
+        assert server.introspections == 1
+
+        server.version = "2"
+        server.schema = introspection([field("email", STRING)])
+        client.query("{ user(id: 1) { id } }")
+        client.query("{ user(id: 1) { email } }")
+        assert server.introspections == 2
+        assert client.schema().version == "2"
+
+    def test_server_validation_failure_signals_change(self, tmp_path):
+        """Test that the server rejecting a locally valid query marks the schema stale."""
+        server = Server()
+        server.reject = True
+        client = client_for(server, tmp_path)
+        client.query("{ user(id: 1) { id } }")
+        client.query("{ user(id: 1) { id } }")
+        assert server.introspections == 2
+
+    def test_introspection_disabled(self, tmp_path):
+        """Test that a server refusing introspection raises GraphQLError."""
+
+        def handler(request):
+            return httpx.Response(200, json={"errors": [{"message": "Introspection disabled"}]})
+
+        client = GraphQLClient(
+            ENDPOINT,
+            validate=True,
+            schema_store=SchemaStore(str(tmp_path)),
+            transport=httpx.MockTransport(handler),
+        )
+        with pytest.raises(GraphQLError, match="Introspection disabled"):
+            client.query("{ user(id: 1) { id } }")
+
+    def test_async_validation(self, tmp_path):
+        """Test that the asynchronous client validates against the cached schema."""
+        server = Server()
+
+        async def run():
+            async with client_for(server, tmp_path, AsyncGraphQLClient) as client:
+                await client.query("{ user(id: 1) { id } }")
+                with pytest.raises(GraphQLValidationError):
+                    await client.query("{ user(id: 1) { age } }")
+                return (await client.schema()).field_type("User", "createdAt")
+
+        assert asyncio.run(run()) == "DateTime"
+        assert server.introspections == 1
+        assert server.queries == 1
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import integrates
+
+
+def loaded_modules(statement):
+    """Run a statement in a fresh interpreter and return the modules it loaded."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    def test_import_package_is_light(self):
+        """Test that importing the package loads no transport or protocol modules."""
+        modules = loaded_modules("import integrates")
+
+        for heavy in ("httpx", "asyncio", "xml.etree.ElementTree", "integrates.protocols"):
+            assert heavy not in modules
+
+    def test_rest_client_skips_other_protocols(self):
+        """Test that using the REST client does not load SOAP, GraphQL or asyncio."""
+        modules = loaded_modules("from integrates import RestClient")
+
+        assert "integrates.protocols.rest.client" in modules
+        for unused in (
+            "integrates.protocols.soap",
+            "integrates.protocols.graphql",
+            "xml.etree.ElementTree",
+            "asyncio",
+            "integrates.auth.oauth2",
+        ):
+            assert unused not in modules
+
+    def test_lazy_attributes(self):
+        """Test that lazy attributes resolve to the real objects."""
+        from integrates.protocols.soap.client import SoapClient
+
+        assert integrates.SoapClient is SoapClient
+        assert integrates.auth.BearerAuth.__name__ == "BearerAuth"
+        assert "RestClient" in dir(integrates)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            integrates.NoSuchClient
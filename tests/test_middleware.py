@@ -1,10 +1,17 @@
+import gzip
+import hashlib
+import json
+import threading
 import time
+import zlib
 from unittest.mock import MagicMock, call, patch
 
 import httpx
 import pytest
 
-from integrates.core.client import Client
+from integrates.auth.signing import HMACAuth
+from integrates.core.client import AsyncClient, Client
+from integrates.middleware.compression import CompressionMiddleware
 from integrates.middleware.logging import LoggingMiddleware
 from integrates.middleware.retry import RetryMiddleware
 
@@ -114,3 +121,132 @@ class TestMiddleware:
         assert execution_order[1] == "middleware2_pre"
         assert execution_order[2] == "middleware1_post"
         assert execution_order[3] == "middleware2_post"
+
+
+class TestCompressionMiddleware:
+    @staticmethod
+    def recording_client(received, cls=Client, status=200, response_headers=None, **kwargs):
+        def handler(request):
+            received.append(request)
+            return httpx.Response(status, headers=response_headers or {})
+
+        return cls(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler), **kwargs
+        )
+
+    def test_compresses_large_json(self):
+        """Test that JSON bodies above the threshold are sent gzip-encoded."""
+        received = []
+        payload = {"items": [{"id": i, "name": f"item {i}"} for i in range(1000)]}
+        client = self.recording_client(received, middlewares=[CompressionMiddleware()])
+
+        client.post("/ingest", json=payload)
+
+        request = received[0]
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert request.headers["Content-Type"] == "application/json"
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert json.loads(gzip.decompress(request.content)) == payload
+
+    def test_signing_auth_signs_compressed_body(self):
+        """Test that body-signing auth signs the compressed bytes that are sent."""
+        received = []
+        hmac_auth = HMACAuth(access_key="AKID", secret_key="secret", region="eu", service="api")
+        payload = {"items": [{"id": i} for i in range(1000)]}
+        client = self.recording_client(
+            received, auth=hmac_auth, middlewares=[CompressionMiddleware()]
+        )
+
+        client.post("/ingest", json=payload)
+
+        request = received[0]
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert (
+            request.headers["X-Amz-Content-Sha256"] == hashlib.sha256(request.content).hexdigest()
+        )
+
+    def test_compression_drops_stream_content_length(self):
+        """Test that a Content-Length set for the uncompressed body is not sent."""
+        received = []
+        client = self.recording_client(received, middlewares=[CompressionMiddleware(threshold=1)])
+
+        client.post("/ingest", content=b"x" * 100, headers={"Content-Length": "100"})
+
+        assert int(received[0].headers["Content-Length"]) == len(received[0].content) != 100
+
+    def test_small_json_uncompressed(self):
+        """Test that JSON bodies below the threshold are sent as they are."""
+        received = []
+        client = self.recording_client(received, middlewares=[CompressionMiddleware()])
+
+        client.post("/ingest", json={"id": 1})
+
+        assert "Content-Encoding" not in received[0].headers
+        assert json.loads(received[0].content) == {"id": 1}
+
+    def test_deflate_raw_body(self):
+        """Test that raw bodies can be deflate-encoded."""
+        middleware = CompressionMiddleware(threshold=10, encoding="deflate")
+        request_kwargs = middleware.pre_request(
+            {"method": "POST", "url": "https://api.example.com/soap", "data": "<a>" * 100}
+        )
+
+        assert request_kwargs["headers"]["Content-Encoding"] == "deflate"
+        assert "data" not in request_kwargs
+        assert zlib.decompress(request_kwargs["content"]) == b"<a>" * 100
+
+    def test_existing_encoding_untouched(self):
+        """Test that bodies that are already encoded are left alone."""
+        middleware = CompressionMiddleware(threshold=1)
+        request_kwargs = {
+            "url": "https://api.example.com",
+            "headers": {"Content-Encoding": "br"},
+            "content": b"x" * 100,
+        }
+
+        assert middleware.pre_request(dict(request_kwargs)) == request_kwargs
+
+    def test_invalid_encoding(self):
+        """Test that unsupported encodings are rejected."""
+        with pytest.raises(ValueError):
+            CompressionMiddleware(encoding="br")
+
+    def test_learns_rejecting_host(self):
+        """Test that hosts rejecting encoded bodies get identity or an accepted encoding."""
+        received = []
+        middleware = CompressionMiddleware(threshold=1)
+        client = self.recording_client(
+            received,
+            status=415,
+            response_headers={"Accept-Encoding": "deflate"},
+            middlewares=[middleware],
+        )
+
+        for _ in range(3):
+            client.post("/ingest", content=b"x" * 100)
+
+        assert received[0].headers["Content-Encoding"] == "gzip"
+        # Falls back to the advertised encoding, then to none once that is rejected too
+        assert received[1].headers["Content-Encoding"] == "deflate"
+        assert "Content-Encoding" not in received[2].headers
+        assert middleware.encoding_for("https://other.example.com") == "gzip"
+
+    @pytest.mark.asyncio
+    async def test_async_compression_offloaded(self):
+        """Test that an AsyncClient compresses in a worker thread."""
+        received = []
+        payload = {"data": "x" * 10000}
+        middleware = CompressionMiddleware()
+        client = self.recording_client(received, cls=AsyncClient, middlewares=[middleware])
+        threads = []
+        encode_json = middleware._encode_json
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return encode_json(*args)
+
+        with patch.object(middleware, "_encode_json", side_effect=record_thread):
+            await client.post("/ingest", json=payload)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert json.loads(gzip.decompress(received[0].content)) == payload
@@ -0,0 +1,99 @@
+import httpx
+import pytest
+
+from integrates.auth.bearer import BearerAuth
+from integrates.core.client import AsyncClient, Client
+from integrates.core.pool import ConnectionPool, shared_pool
+from integrates.protocols.graphql import GraphQLClient
+from integrates.protocols.rest import RestClient
+from integrates.protocols.soap import SoapClient
+
+
+def recording_pool(received, **kwargs):
+    """Build a pool whose transport records the requests it sends."""
+
+    def handler(request):
+        received.append(request)
+        return httpx.Response(200, json={"data": {}})
+
+    return ConnectionPool(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestConnectionPool:
+    def test_protocol_clients_share_transport(self):
+        """Test that REST, GraphQL and SOAP clients on one pool share one httpx client."""
+        received = []
+        pool = recording_pool(received)
+        rest = RestClient("https://gateway.example.com/api/", auth=BearerAuth("a"), pool=pool)
+        graphql = GraphQLClient("https://gateway.example.com/graphql", pool=pool)
+        soap = SoapClient("https://gateway.example.com/soap", pool=pool)
+
+        rest.get("users")
+        graphql.query("{ viewer { id } }")
+
+        assert rest._client is graphql._client is soap._client
+        assert str(received[0].url) == "https://gateway.example.com/api/users"
+        assert received[0].headers["Authorization"] == "Bearer a"
+        assert str(received[1].url) == "https://gateway.example.com/graphql"
+        assert "Authorization" not in received[1].headers
+
+    def test_each_client_keeps_its_timeout(self):
+        """Test that requests through a pool use the sending client's timeout."""
+        received = []
+        pool = recording_pool(received, timeout=30.0)
+
+        Client(base_url="https://api.example.com", timeout=2.0, pool=pool).get("/a")
+
+        assert received[0].extensions["timeout"]["read"] == 2.0
+
+    def test_reference_counted_close(self):
+        """Test that the shared transport is only closed with its last client."""
+        pool = recording_pool([])
+        first = Client(base_url="https://api.example.com", pool=pool)
+        second = Client(base_url="https://api.example.com", pool=pool)
+        http = first._client
+
+        first.close()
+        first.close()
+        assert not http.is_closed
+        second.get("/still-open")
+
+        second.close()
+        assert http.is_closed
+
+    def test_shared_pool_registry(self):
+        """Test that named pools are shared until every client is closed."""
+        pool = shared_pool("test-gateway", transport=httpx.MockTransport(lambda r: None))
+        client = Client(pool="test-gateway")
+
+        assert client._pool is pool
+        assert shared_pool("test-gateway") is pool
+
+        client.close()
+        assert shared_pool("test-gateway") is not pool
+
+    @pytest.mark.asyncio
+    async def test_async_clients_share_transport(self):
+        """Test that async clients share the pool's async httpx client."""
+        received = []
+
+        async def handler(request):
+            received.append(request)
+            return httpx.Response(200)
+
+        pool = ConnectionPool(transport=httpx.MockTransport(handler))
+        first = AsyncClient(base_url="https://a.example.com", pool=pool)
+        second = AsyncClient(base_url="https://b.example.com", pool=pool)
+
+        await first.get("/1")
+        await second.get("/2")
+        assert first._client is second._client
+
+        await first.close()
+        assert not second._client.is_closed
+        await second.close()
+        assert pool.get(httpx.AsyncClient) is not first._http
+        assert [str(request.url) for request in received] == [
+            "https://a.example.com/1",
+            "https://b.example.com/2",
+        ]
@@ -1,6 +1,12 @@
 import pytest
 import json
+import httpx
+
+from integrates.core.client import AsyncClient, Client
+from integrates.core.exceptions import HTTPError
 from integrates.core.response import Response
+from integrates.utils.records import JSONItemDecoder
+from integrates.protocols.rest.client import AsyncRestClient
 
 
 class TestResponse:
@@ -76,3 +82,126 @@ class TestResponse:
         # This would require mocking an httpx.Response, which is complex
         # For now, we'll skip this test
         pass
+
+    def test_iter_records_ndjson_across_chunks(self):
+        """Test that NDJSON records split across chunk boundaries are reassembled."""
+        body = b'{"id": 1}\n{"id": 2, "name": "two"}\n\n{"id": 3}'
+        response = Response(status_code=200, headers={}, content=body, url="https://x.test")
+
+        records = list(response.iter_records("ndjson", chunk_size=5))
+
+        assert records == [{"id": 1}, {"id": 2, "name": "two"}, {"id": 3}]
+
+    def test_iter_records_csv_with_quoted_newlines(self):
+        """Test that CSV rows with quoted newlines survive arbitrary chunking."""
+        body = 'id,note\r\n1,"multi\nline, quoted"\r\n2,"say ""hi"""\r\n3,plain\r\n'.encode()
+        response = Response(status_code=200, headers={}, content=body, url="https://x.test")
+
+        for chunk_size in (1, 3, 7, len(body)):
+            assert list(response.iter_records("csv", chunk_size=chunk_size)) == [
+                {"id": "1", "note": "multi\nline, quoted"},
+                {"id": "2", "note": 'say "hi"'},
+                {"id": "3", "note": "plain"},
+            ]
+
+    def test_iter_records_csv_without_header(self):
+        """Test that CSV rows are returned as lists when there is no header."""
+        response = Response(
+            status_code=200, headers={}, content=b"a;b\nc;d\n", url="https://x.test"
+        )
+
+        assert list(response.iter_records("csv", header=False, delimiter=";")) == [
+            ["a", "b"],
+            ["c", "d"],
+        ]
+
+    def test_iter_records_unknown_format(self):
+        """Test that an unknown record format is rejected."""
+        response = Response(status_code=200, headers={}, content=b"", url="https://x.test")
+
+        with pytest.raises(ValueError):
+            list(response.iter_records("xml"))
+
+    def test_streamed_response_is_read_lazily(self):
+        """Test that a streamed response only reads its body when iterated."""
+
+        def handler(request):
+            return httpx.Response(200, content=iter([b'{"n": 1}\n{"n"', b": 2}\n"]))
+
+        client = Client(transport=httpx.MockTransport(handler))
+        response = client.get("https://x.test/export", stream=True)
+
+        assert not response.is_stream_consumed
+        assert list(response.iter_records()) == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_async_streamed_records_from_resource(self):
+        """Test that async resources can stream records straight from a GET."""
+
+        async def body():
+            yield b"id,name\n1,a\n2,"
+            yield b"b\n"
+
+        def handler(request):
+            return httpx.Response(200, content=body())
+
+        client = AsyncRestClient(base_url="https://x.test", transport=httpx.MockTransport(handler))
+
+        records = [record async for record in client.resource("export").iter_records(format="csv")]
+
+        assert records == [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_async_streamed_body_must_be_read(self):
+        """Test that sync accessors of an unread async stream ask for aread()."""
+
+        def handler(request):
+            return httpx.Response(503, content=b'{"error": "busy"}')
+
+        async with AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await client.get("https://x.test/export", stream=True)
+
+            with pytest.raises(RuntimeError, match="aread"):
+                response.json()
+            with pytest.raises(HTTPError, match="^HTTP Error 503$"):
+                response.raise_for_status()
+
+            assert await response.aread() == b'{"error": "busy"}'
+            assert response.json() == {"error": "busy"}
+            with pytest.raises(HTTPError, match="busy"):
+                response.raise_for_status()
+
+    def test_iter_items_from_large_document(self):
+        """Test that array elements at a path are yielded from a chunked JSON body."""
+        body = json.dumps(
+            {"meta": {"skip": ["]", {"x": "}"}]}, "data": [{"id": i} for i in range(5)], "n": 1}
+        ).encode()
+        response = Response(status_code=200, headers={}, content=body, url="https://x.test")
+
+        assert list(response.iter_items("data.item", chunk_size=3)) == [{"id": i} for i in range(5)]
+
+    def test_iter_items_split_elements(self):
+        """Test that elements split across many chunks are decoded once complete."""
+        body = json.dumps({"data": [{"s": 'a"}]\\', "n": [1, {"x": None}]}, "b\\c", 7]}).encode()
+        response = Response(status_code=200, headers={}, content=body, url="https://x.test")
+
+        assert list(response.iter_items("data.item", chunk_size=1)) == [
+            {"s": 'a"}]\\', "n": [1, {"x": None}]},
+            "b\\c",
+            7,
+        ]
+
+    def test_iter_items_invalid_element_fails_early(self):
+        """Test that a malformed element raises as soon as it closes, not at the end of the body."""
+        decoder = JSONItemDecoder("data.item")
+
+        assert decoder.feed(b'{"data": [{"a": 1}, ') == [{"a": 1}]
+        with pytest.raises(ValueError, match="tru"):
+            decoder.feed(b'{"a": tru}, ' + b'{"b": 1}, ' * 1000)
+
+    def test_iter_items_incomplete_document(self):
+        """Test that a truncated document raises once the body ends."""
+        response = Response(status_code=200, headers={}, content=b'{"data": [1, 2', url="")
+
+        with pytest.raises(ValueError):
+            list(response.iter_items("data.item"))
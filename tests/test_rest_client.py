@@ -1,9 +1,18 @@
+import asyncio
+import json
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
-from integrates.protocols.rest.client import ResourceClient, RestClient
+from integrates.protocols.rest.client import AsyncRestClient, ResourceClient, RestClient
+from integrates.protocols.rest.pagination import (
+    CursorPagination,
+    OffsetPagination,
+    PagePagination,
+    Paginator,
+    parse_link_header,
+)
 
 
 class TestRestClient:
@@ -130,3 +139,281 @@ class TestRestClient:
         mock_request.assert_called_once()
         assert mock_request.call_args[0][0] == "GET"
         assert mock_request.call_args[0][1] == "users/1/posts/1"
+
+    @patch("httpx.Client.request")
+    def test_resource_prepare(self, mock_request):
+        """Test that a resource can prepare a request for repeated sending."""
+        mock_request.return_value = httpx.Response(
+            200, request=httpx.Request("GET", "https://api.example.com/users/1/orders")
+        )
+
+        client = RestClient(base_url="https://api.example.com")
+        prepared = client.resource("users")(1).prepare("GET", "orders")
+        prepared.send(params={"status": "open"})
+
+        assert prepared.url == "https://api.example.com/users/1/orders"
+        assert mock_request.call_args[1]["params"] == {"status": "open"}
+
+
+class TestPagination:
+    def test_paginate_cursor(self):
+        """Test that cursor pagination follows cursors until they run out."""
+        pages = {
+            None: {"items": [1, 2], "next_cursor": "b"},
+            "b": {"items": [3], "next_cursor": "c"},
+            "c": {"items": [4], "next_cursor": None},
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        client = RestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+
+        assert list(client.resource("events").paginate("cursor")) == [1, 2, 3, 4]
+
+    def test_paginate_link_header(self):
+        """Test that Link header pagination follows rel=next URLs."""
+
+        def handler(request):
+            if request.url.params.get("page") == "2":
+                return httpx.Response(200, json=[3])
+            return httpx.Response(
+                200,
+                json=[1, 2],
+                headers={"Link": '<https://api.example.com/repos?page=2>; rel="next"'},
+            )
+
+        client = RestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+
+        assert list(client.resource("repos").paginate("link")) == [1, 2, 3]
+
+    def test_paginate_offset_with_total_fetches_in_parallel(self):
+        """Test that offset pagination with a total requests every page once, in order."""
+        seen = []
+
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            seen.append(offset)
+            items = list(range(offset, min(offset + 10, 35)))
+            return httpx.Response(200, json={"items": items, "total": 35})
+
+        client = RestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+        paginator = OffsetPagination(limit=10, total_path="total")
+
+        items = list(client.resource("rows").paginate(paginator, concurrency=2))
+
+        assert items == list(range(35))
+        assert sorted(seen) == [0, 10, 20, 30]
+
+    def test_paginate_page_stops_on_short_page(self):
+        """Test that page-number pagination stops when a page is not full."""
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={"items": [page] * (2 if page < 3 else 1)})
+
+        client = RestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+        paginator = PagePagination(page_size=2)
+
+        assert list(client.resource("rows").paginate(paginator)) == [1, 1, 2, 2, 3]
+
+    def test_paginator_base_class(self):
+        """Test that strategies must define next_request and only indexable ones address pages."""
+        with pytest.raises(TypeError):
+            Paginator()
+        with pytest.raises(TypeError, match="CursorPagination cannot request pages by index"):
+            CursorPagination().page_request(1, (None, {}))
+
+    def test_parse_link_header(self):
+        """Test that Link headers with several relations are parsed."""
+        links = parse_link_header(
+            '<https://x.test/?page=2>; rel="next", <https://x.test/?page=9>; rel="last"'
+        )
+
+        assert links == {"next": "https://x.test/?page=2", "last": "https://x.test/?page=9"}
+
+    @pytest.mark.asyncio
+    async def test_async_paginate_page_with_total(self):
+        """Test that async page pagination yields all items in order."""
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={"items": [page * 10, page * 10 + 1], "pages": 3})
+
+        client = AsyncRestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+        paginator = PagePagination(total_pages_path="pages")
+
+        items = [item async for item in client.resource("rows").paginate(paginator)]
+
+        assert items == [10, 11, 20, 21, 30, 31]
+
+    @pytest.mark.asyncio
+    async def test_max_pages_agree(self):
+        """Test that both clients fetch the same pages for a given max_pages, including none."""
+        pages = {
+            None: {"items": [1, 2], "next_cursor": "b"},
+            "b": {"items": [3], "next_cursor": "c"},
+            "c": {"items": [4], "next_cursor": None},
+        }
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=pages[request.url.params.get("cursor")])
+
+        client = RestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+        async_client = AsyncRestClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+
+        for max_pages, expected in ((0, []), (1, [1, 2]), (2, [1, 2, 3])):
+            del requests[:]
+            resource = client.resource("events")
+            assert list(resource.paginate("cursor", max_pages=max_pages)) == expected
+            sync_requests = len(requests)
+            async_resource = async_client.resource("events")
+            items = [item async for item in async_resource.paginate("cursor", max_pages=max_pages)]
+            assert items == expected
+            assert len(requests) == 2 * sync_requests == 2 * max_pages
+
+
+@pytest.mark.asyncio
+class TestBatching:
+    @staticmethod
+    def bulk_client(calls):
+        def handler(request):
+            ids = json.loads(request.content)["ids"]
+            calls.append(ids)
+            return httpx.Response(200, json=[{"id": int(i), "name": f"item {i}"} for i in ids])
+
+        return AsyncRestClient(
+            base_url="https://api.example.com/", transport=httpx.MockTransport(handler)
+        )
+
+    async def test_concurrent_gets_are_sent_as_one_bulk_request(self):
+        """Test that item GETs issued together share one bulk request."""
+        calls = []
+        client = self.bulk_client(calls)
+        items = client.resource("items")
+        items.batch("items:batchGet")
+
+        responses = await asyncio.gather(*(items(str(i)).get() for i in (1, 2, 3)))
+
+        assert calls == [["1", "2", "3"]]
+        assert [r.json()["name"] for r in responses] == ["item 1", "item 2", "item 3"]
+        assert responses[0].url == "https://api.example.com/items/1"
+        assert responses[0].request_info["url"] == "https://api.example.com/items/1"
+        assert responses[0].request_info["batch"]["url"] == "https://api.example.com/items:batchGet"
+
+    async def test_duplicate_keys_are_requested_once(self):
+        """Test that the same id looked up twice is sent once and resolves both callers."""
+        calls = []
+        client = self.bulk_client(calls)
+        client.batch("items", "items:batchGet")
+
+        first, second = await asyncio.gather(
+            client.resource("items")("7").get(), client.resource("items")("7").get()
+        )
+
+        assert calls == [["7"]]
+        assert first.json() == second.json() == {"id": 7, "name": "item 7"}
+
+    async def test_batches_are_split_at_max_size(self):
+        """Test that a full batch is sent immediately and the rest in the next one."""
+        calls = []
+        client = self.bulk_client(calls)
+        client.batch("items", "items:batchGet", max_size=2, window=10)
+        items = client.resource("items")
+
+        tasks = [asyncio.ensure_future(items(str(i)).get()) for i in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert calls == [["0", "1"]]
+        assert tasks[0].done() and not tasks[2].done()
+        client._batchers["items"].flush()
+        await asyncio.gather(*tasks)
+        assert calls == [["0", "1"], ["2"]]
+
+    async def test_missing_item_gets_404(self):
+        """Test that an id missing from the bulk response resolves to a 404 response."""
+
+        def handler(request):
+            return httpx.Response(200, json={"data": {"items": [{"key": "a"}]}})
+
+        client = AsyncRestClient(
+            base_url="https://api.example.com/", transport=httpx.MockTransport(handler)
+        )
+        client.batch("things", "things/bulk", items_path="data.items", id_field="key")
+
+        found, missing = await asyncio.gather(
+            client.resource("things")("a").get(), client.resource("things")("b").get()
+        )
+
+        assert found.status_code == 200 and found.json() == {"key": "a"}
+        assert missing.status_code == 404
+
+    async def test_custom_request_and_failed_bulk_request(self):
+        """Test that a custom request builder is used and a failed bulk response is shared."""
+        seen = []
+
+        def handler(request):
+            seen.append((request.method, request.url.params["ids"]))
+            return httpx.Response(503, json={"error": "down"})
+
+        client = AsyncRestClient(
+            base_url="https://api.example.com/", transport=httpx.MockTransport(handler)
+        )
+        client.resource("items").batch(
+            "items", method="GET", request=lambda ids: {"params": {"ids": ",".join(ids)}}
+        )
+
+        responses = await asyncio.gather(*(client.resource("items")(i).get() for i in "ab"))
+
+        assert seen == [("GET", "a,b")]
+        assert [r.status_code for r in responses] == [503, 503]
+
+    async def test_transport_error_reaches_every_caller(self):
+        """Test that an error sending the bulk request is raised to each caller."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        client = AsyncRestClient(
+            base_url="https://api.example.com/", transport=httpx.MockTransport(handler)
+        )
+        client.batch("items", "items:batchGet")
+
+        results = await asyncio.gather(
+            *(client.resource("items")(i).get() for i in "ab"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, Exception) for result in results)
+
+    async def test_gets_with_arguments_are_not_batched(self):
+        """Test that GETs with extra arguments bypass the batcher."""
+        urls = []
+
+        def handler(request):
+            urls.append(str(request.url))
+            return httpx.Response(200, json={})
+
+        client = AsyncRestClient(
+            base_url="https://api.example.com/", transport=httpx.MockTransport(handler)
+        )
+        client.batch("items", "items:batchGet")
+
+        await client.resource("items")("1").get(params={"fields": "name"})
+
+        assert urls == ["https://api.example.com/items/1?fields=name"]
@@ -0,0 +1,66 @@
+from urllib.parse import urljoin
+
+import pytest
+
+from integrates.core.client import Client
+from integrates.utils.url import URLResolver, expand_path, join_path
+
+
+class TestURLResolver:
+    @pytest.mark.parametrize(
+        "base_url",
+        [
+            "",
+            "https://api.example.com",
+            "https://api.example.com/v1",
+            "https://api.example.com/v1/",
+            "HTTPS://api.example.com/a//b/",
+            " https://api.example.com/v1/",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "",
+            "users",
+            "/users",
+            "users/1/orders",
+            "../up",
+            "users?page=2",
+            "https://other.com/x",
+            " users",
+            "\tusers",
+            "us\ners",
+        ],
+    )
+    def test_resolve_matches_urljoin(self, base_url, url):
+        """Test that the resolver produces the same URLs as urljoin."""
+        assert URLResolver(base_url).resolve(url) == urljoin(base_url, url)
+
+    def test_resolve_is_cached(self):
+        """Test that resolving the same URL twice hits the cache."""
+        resolver = URLResolver("https://api.example.com/v1/")
+
+        resolver.resolve("users")
+        resolver.resolve("users")
+
+        assert resolver.resolve.cache_info().hits == 1
+
+    def test_expand_path_template(self):
+        """Test that path templates are filled with encoded values."""
+        assert expand_path("users/{id}/orders", {"id": 42}) == "users/42/orders"
+        assert expand_path("files/{name}", {"name": "a/b c"}) == "files/a%2Fb%20c"
+
+    def test_join_path(self):
+        """Test that resource paths are joined like before."""
+        assert join_path("users") == "users"
+        assert join_path("users", "/123") == "users/123"
+
+    def test_client_base_url_change_resets_resolver(self):
+        """Test that assigning base_url is picked up by later requests."""
+        client = Client(base_url="https://one.example.com")
+        client.base_url = "https://two.example.com"
+
+        kwargs = client._build_request_kwargs("GET", "users/{id}", path_params={"id": 7})
+
+        assert kwargs["url"] == "https://two.example.com/users/7"